@@ -0,0 +1,1292 @@
+"""Avaliação colunar do catálogo inteiro para a análise em lote.
+
+``evaluate_catalog`` reproduz, para todos os perfis de uma vez, o fluxo de
+``perform_all_checks`` usado pelo botão de análise em lote: combinações ELU e
+ELS, análise da viga, Cb automático, resistências, forças localizadas, ELS,
+agregação de status e estado-limite governante. Nenhuma etapa percorre os
+perfis em Python; cada grandeza é uma coluna NumPy e o resultado é o mesmo
+DataFrame que a rotina linha a linha produzia.
+
+Com ``combination_envelope`` e ``variable_actions`` nos parâmetros, todas as
+combinações ELU e ELS de ``load_combinations`` são avaliadas juntas, como um
+eixo a mais das mesmas colunas, e a combinação governante de cada verificação
+aparece nas colunas ``Combinação ...``.
+
+As resistências dependem apenas dos perfis, do material, de Lb e Cb e dos
+detalhes construtivos; as demandas, das cargas e do vão. Com um
+``EvaluationCache``, cada parte é guardada com a chave das suas entradas e
+uma mudança só nas cargas recalcula as demandas e as divisões pelas
+resistências já conhecidas.
+
+Com ``executor`` (``make_catalog_executor``), os perfis são divididos por
+planilha e em blocos avaliados em processos separados; o resultado é
+reunido na ordem do catálogo e é idêntico ao da avaliação em um processo.
+
+Este módulo não importa Streamlit nem Plotly, para que possa ser usado por
+scripts e processos auxiliares.
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from concurrent.futures import Executor, ProcessPoolExecutor
+from dataclasses import dataclass
+import hashlib
+import multiprocessing
+import os
+import sys
+import threading
+from types import MappingProxyType
+from typing import Mapping
+
+import numpy as np
+import pandas as pd
+
+from calculos_lote_nbr8800_2024 import (
+    flexural_strength_i_batch,
+    local_compression_strength_batch,
+    shear_strength_i_batch,
+    unit_load_beam,
+)
+from calculos_nbr8800_2024 import (
+    ELS_COMBINATION_LABELS,
+    GAMMA_A1,
+    SUPPORT_ALIASES,
+    VariableAction,
+    _validate_beam_inputs,
+    combine_els,
+    combine_elu_normal,
+    deflection_limit,
+    load_combinations,
+    validate_material,
+)
+from verificacao_nbr8800_2024 import PROFILE_FABRICATION_MAP
+
+
+AUTOMATIC_INPUT_MODE = "Calcular a partir de Cargas na Viga"
+CANTILEVER = "Engastada e Livre (Balanço)"
+GRAVITY = 9.80665
+
+# Colunas da planilha na ordem de validação de ``get_profile_properties``.
+PROPERTY_COLUMNS = (
+    ("d", ("d (mm)",), 0.1),
+    ("bf", ("bf (mm)",), 0.1),
+    ("tw", ("tw (mm)",), 0.1),
+    ("tf", ("tf (mm)",), 0.1),
+    ("h_faces", ("h (mm)",), 0.1),
+    ("h_clear", ("d' (mm)", "h (mm)"), 0.1),
+    ("Area", ("Área (cm2)",), 1.0),
+    ("Ix", ("Ix (cm4)",), 1.0),
+    ("Wx", ("Wx (cm3)",), 1.0),
+    ("rx", ("rx (cm)",), 1.0),
+    ("Zx", ("Zx (cm3)",), 1.0),
+    ("Iy", ("Iy (cm4)",), 1.0),
+    ("ry", ("ry (cm)",), 1.0),
+    ("J", ("It (cm4)",), 1.0),
+    ("Cw", ("Cw (cm6)",), 1.0),
+    ("Peso", ("Massa Linear (kg/m)", "Peso (kg/m)"), 1.0),
+)
+
+# Perfis por tarefa do pool de processos de ``evaluate_catalog``.
+PARALLEL_CHUNK_ROWS = 64
+
+# Propriedades com índice ordenado em ``ProfileTable`` (Aw = d·tw, em cm²).
+INDEXED_PROPERTIES = ("Peso", "d", "bf", "Zx", "Wx", "Ix", "Aw")
+
+# Propriedades apenas informativas: acompanham o perfil, sem validação.
+OPTIONAL_PROPERTY_COLUMNS = (
+    ("Wy", ("Wy (cm3)",)),
+    ("Zy", ("Zy (cm3)",)),
+    ("rt", ("rt (cm)",)),
+)
+
+CHECK_NAMES = (
+    "FLT", "FLM", "FLA", "Ruptura da mesa", "Cisalhamento", "Forças locais", "Flecha",
+)
+# Folga relativa da triagem por limites superiores (``screen_profiles``).
+SCREENING_MARGIN = 1.0 + 1e-12
+
+# Colunas extras do modo envoltória: combinação governante de cada verificação.
+COMBINATION_COLUMNS = tuple(f"Combinação {name}" for name in CHECK_NAMES)
+EFFICIENCY_COLUMNS = (
+    "Ef. FLT (%)", "Ef. FLM (%)", "Ef. FLA (%)", "Ef. Cisalhamento (%)",
+    "Ef. Ruptura Mesa (%)", "Ef. Forças Locais (%)", "Ef. Flecha (%)",
+)
+
+
+def _sheet_column(frame: pd.DataFrame, candidates: tuple[str, ...], default=np.nan) -> np.ndarray:
+    for name in candidates:
+        if name in frame.columns:
+            return pd.to_numeric(frame[name], errors="coerce").to_numpy(dtype=float)
+    return np.full(len(frame), default)
+
+
+def catalog_columns(all_sheets: dict) -> dict:
+    """Converte as planilhas em colunas contíguas, já em cm, com a validação por perfil.
+
+    ``valid`` marca os perfis aptos ao cálculo; para os demais, ``observation``
+    traz a mesma mensagem que ``get_profile_properties`` levantaria.
+    """
+    names, sheets, fabrication = [], [], []
+    blocks: dict[str, list[np.ndarray]] = {
+        key: [] for key, *_ in PROPERTY_COLUMNS + OPTIONAL_PROPERTY_COLUMNS
+    }
+    raw_weight, sheet_rows = [], []
+    for sheet_name, frame in all_sheets.items():
+        profile_names = (
+            frame["Bitola (mm x kg/m)"].to_numpy(dtype=object)
+            if "Bitola (mm x kg/m)" in frame.columns
+            else np.full(len(frame), "Perfil Desconhecido", dtype=object)
+        )
+        names.append(profile_names)
+        sheets.append(np.full(len(frame), sheet_name, dtype=object))
+        fabrication.append(
+            np.full(len(frame), PROFILE_FABRICATION_MAP.get(sheet_name, "Laminado"), dtype=object)
+        )
+        raw_weight.append(_sheet_column(frame, ("Massa Linear (kg/m)",), default=0.0))
+        sheet_rows.append(np.arange(len(frame)))
+        for key, candidates, _ in PROPERTY_COLUMNS:
+            blocks[key].append(_sheet_column(frame, candidates))
+        for key, candidates in OPTIONAL_PROPERTY_COLUMNS:
+            blocks[key].append(_sheet_column(frame, candidates))
+
+    columns = {
+        key: np.concatenate(values) if values else np.empty(0)
+        for key, values in blocks.items()
+    }
+    count = len(columns["d"])
+    observations = np.full(count, None, dtype=object)
+    valid = np.ones(count, dtype=bool)
+    profile_names = np.concatenate(names) if names else np.empty(0, dtype=object)
+    for key, _, _ in PROPERTY_COLUMNS:
+        invalid = valid & ~(np.isfinite(columns[key]) & (columns[key] > 0))
+        for index in np.flatnonzero(invalid):
+            observations[index] = (
+                f"Propriedade ESSENCIAL '{key}' inválida ou nula no Excel para "
+                f"'{profile_names[index]}'. Verifique a planilha."
+            )
+        valid &= ~invalid
+    for key, _, scale in PROPERTY_COLUMNS:
+        if scale != 1.0:
+            columns[key] = columns[key] / 10.0
+    columns.update(
+        Tipo=np.concatenate(sheets) if sheets else np.empty(0, dtype=object),
+        Perfil=profile_names,
+        fabrication=np.concatenate(fabrication) if fabrication else np.empty(0, dtype=object),
+        raw_weight=np.concatenate(raw_weight) if raw_weight else np.empty(0),
+        sheet_row=np.concatenate(sheet_rows) if sheet_rows else np.empty(0, dtype=int),
+        valid=valid,
+        observation=observations,
+    )
+    return columns
+
+
+@dataclass(frozen=True)
+class ProfileTable:
+    """Catálogo de perfis em colunas (struct-of-arrays), montado uma única vez.
+
+    As propriedades são colunas float64 contíguas, já em cm e somente
+    leitura; ``Tipo``, ``Perfil`` e ``fabrication`` identificam a família de
+    cada linha e ``sheet_row`` a sua posição na planilha de origem. A
+    validação de ``catalog_columns`` roda uma vez para o catálogo inteiro e
+    ``index`` leva (planilha, nome) à linha em O(1).
+
+    Para cada propriedade de ``INDEXED_PROPERTIES`` (incluindo ``Aw`` = d·tw),
+    ``sorted_rows`` guarda as linhas válidas em ordem crescente do valor e
+    ``sorted_values`` os valores nessa ordem; ``range_rows`` e ``query``
+    respondem a faixas por busca binária, em O(log n + k).
+    """
+
+    columns: Mapping[str, np.ndarray]
+    index: Mapping[tuple[str, str], int]
+    sorted_rows: Mapping[str, np.ndarray]
+    sorted_values: Mapping[str, np.ndarray]
+
+    @classmethod
+    def from_sheets(cls, all_sheets: dict) -> "ProfileTable":
+        columns = catalog_columns(all_sheets)
+        columns["Aw"] = columns["d"] * columns["tw"]
+        valid_rows = np.flatnonzero(columns["valid"])
+        sorted_rows = {
+            key: valid_rows[np.argsort(columns[key][valid_rows], kind="stable")]
+            for key in INDEXED_PROPERTIES
+        }
+        sorted_values = {key: columns[key][rows] for key, rows in sorted_rows.items()}
+        for group in (columns, sorted_rows, sorted_values):
+            for array in group.values():
+                array.flags.writeable = False
+        # Nomes repetidos na mesma planilha ficam com a primeira linha, como o
+        # filtro ``df[df['Bitola (mm x kg/m)'] == nome].iloc[0]`` da interface.
+        index: dict[tuple[str, str], int] = {}
+        for row, key in enumerate(zip(columns["Tipo"], columns["Perfil"])):
+            index.setdefault(key, row)
+        return cls(
+            MappingProxyType(columns), MappingProxyType(index),
+            MappingProxyType(sorted_rows), MappingProxyType(sorted_values),
+        )
+
+    def range_rows(self, key: str, low: float | None = None, high: float | None = None) -> np.ndarray:
+        """Linhas válidas com ``low ≤ key ≤ high`` (limites em cm), em ordem crescente de ``key``."""
+        if key not in self.sorted_values:
+            raise ValueError(f"Propriedade sem índice: {key}")
+        values = self.sorted_values[key]
+        start = 0 if low is None else int(np.searchsorted(values, low, side="left"))
+        stop = len(values) if high is None else int(np.searchsorted(values, high, side="right"))
+        return self.sorted_rows[key][start:max(start, stop)]
+
+    def query(self, sort_by: str = "Peso", families=None, **bounds) -> np.ndarray:
+        """Linhas válidas dentro de todas as faixas, ordenadas por ``sort_by``.
+
+        Cada faixa é ``propriedade=(mínimo, máximo)``, com ``None`` para o lado
+        aberto, em unidades do cálculo: ``query(Ix=(18_000, None), d=(None,
+        45.0))`` devolve os perfis com Ix ≥ 18.000 cm⁴ e d ≤ 450 mm, do mais
+        leve ao mais pesado. A faixa mais seletiva vem da busca binária; as
+        demais filtram apenas essas k linhas.
+        """
+        ranges = {key: self.range_rows(key, *limits) for key, limits in bounds.items()}
+        if ranges:
+            key = min(ranges, key=lambda name: len(ranges[name]))
+            rows = ranges.pop(key)
+        else:
+            rows = self.sorted_rows[sort_by if sort_by in self.sorted_rows else "Peso"]
+        keep = np.ones(len(rows), dtype=bool)
+        for key, limits in bounds.items():
+            if key in ranges:
+                low, high = limits
+                values = self.columns[key][rows]
+                if low is not None:
+                    keep &= values >= low
+                if high is not None:
+                    keep &= values <= high
+        if families is not None:
+            keep &= np.isin(self.columns["Tipo"][rows], list(families))
+        rows = rows[keep]
+        if sort_by not in self.columns:
+            raise ValueError(f"Propriedade inválida para ordenação: {sort_by}")
+        # Ordem estável pelo valor e, nos empates, pela ordem do catálogo.
+        return rows[np.lexsort((rows, self.columns[sort_by][rows]))]
+
+    def __len__(self) -> int:
+        return len(self.columns["d"])
+
+    @property
+    def families(self) -> list[str]:
+        """Planilhas (famílias de perfis) na ordem do catálogo."""
+        return list(dict.fromkeys(self.columns["Tipo"]))
+
+    def __getitem__(self, key: str) -> np.ndarray:
+        return self.columns[key]
+
+    def row(self, name: str, sheet: str | None = None) -> int:
+        """Linha do perfil; sem ``sheet``, o nome deve ser único no catálogo."""
+        if sheet is not None:
+            try:
+                return self.index[(sheet, name)]
+            except KeyError:
+                raise ValueError(f"Perfil '{name}' não encontrado na planilha '{sheet}'.") from None
+        rows = [row for (_, profile), row in self.index.items() if profile == name]
+        if len(rows) != 1:
+            raise ValueError(
+                f"Perfil '{name}' não encontrado no catálogo." if not rows
+                else f"Perfil '{name}' existe em mais de uma planilha; informe a planilha."
+            )
+        return rows[0]
+
+    def properties(self, row: int) -> dict:
+        """Dicionário de ``get_profile_properties`` lido das colunas, sem revalidar."""
+        if not self.columns["valid"][row]:
+            raise ValueError(self.columns["observation"][row])
+        props = {
+            key: float(self.columns[key][row])
+            for key, *_ in PROPERTY_COLUMNS + OPTIONAL_PROPERTY_COLUMNS
+        }
+        # Alias mantido apenas para blocos legados de apresentação.
+        props["h"] = props["h_clear"]
+        return props
+
+
+def _verification_columns(demand, resistance, applicable=True):
+    """Versão colunar de ``verification_status``: eficiência (%) e status."""
+    demand, resistance = np.broadcast_arrays(np.asarray(demand, float), np.asarray(resistance, float))
+    if applicable is False:
+        return np.zeros(demand.shape), np.full(demand.shape, "N/A", dtype=object)
+    applicable = np.broadcast_to(np.asarray(applicable, dtype=bool), demand.shape)
+    missing = np.isnan(resistance) | (resistance <= 0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        efficiency = np.where(missing, np.inf, demand / resistance * 100.0)
+    status = np.where(
+        missing, "NÃO VERIFICADO", np.where(demand <= resistance, "APROVADO", "REPROVADO")
+    ).astype(object)
+    efficiency = np.where(applicable, efficiency, 0.0)
+    status = np.where(applicable, status, "N/A")
+    return efficiency, status
+
+
+def _overall_status_columns(statuses: list[np.ndarray], pending) -> np.ndarray:
+    """Versão colunar de ``overall_status`` com pendências de escopo por perfil."""
+    matrix = np.stack(statuses, axis=1)
+    failed = (matrix == "REPROVADO").any(axis=1)
+    unverified = (matrix == "NÃO VERIFICADO").any(axis=1) | pending
+    approved = np.isin(matrix, ("APROVADO", "N/A")).all(axis=1)
+    return np.where(
+        failed, "REPROVADO",
+        np.where(unverified | ~approved, "NÃO VERIFICADO", "APROVADO"),
+    ).astype(object)
+
+
+def _combination_rows(params: dict, q_g, q_q, p_g, p_q) -> tuple[list, list, list]:
+    """Ações variáveis e linhas ELU/ELS avaliadas no lote.
+
+    Sem ``combination_envelope``, é a combinação única da barra lateral, com
+    os mesmos fatores de ``combine_elu_normal`` e ``combine_els``. Com ela, é
+    a matriz completa de ``load_combinations`` para ``variable_actions``.
+    """
+    gamma_g = params.get("gamma_g", 1.50)
+    gamma_q = params.get("gamma_q", 1.50)
+    gamma_sw = params.get("gamma_self_weight", 1.25)
+    if params.get("combination_envelope", False):
+        actions = [
+            action if isinstance(action, VariableAction) else VariableAction(**action)
+            for action in params.get("variable_actions", ())
+        ]
+        # As ações permanentes passam pela mesma validação da combinação única.
+        combine_elu_normal(q_g, 0.0, 0.0, p_g, 0.0)
+        combinations = load_combinations(
+            actions, gamma_g, gamma_sw,
+            params.get("els_combinations", tuple(ELS_COMBINATION_LABELS)),
+        )
+        return actions, combinations["elu"], combinations["els"]
+
+    # As funções escalares validam os termos comuns; o peso próprio entra por coluna.
+    combine_elu_normal(
+        q_g, q_q, 0.0, p_g, p_q,
+        gamma_g=gamma_g, gamma_q=gamma_q, gamma_self_weight=gamma_sw,
+    )
+    combination = params.get("els_combination", "rare")
+    els = combine_els(
+        q_g, q_q, 0.0, p_g, p_q,
+        combination=combination,
+        psi1=params.get("psi1", 0.6),
+        psi2=params.get("psi2", 0.4),
+    )
+    permanent = 1.0 if els["include_permanent"] else 0.0
+    return (
+        [VariableAction("Q", q_q, p_q, gamma_q)],
+        [{"label": "ELU normal", "permanent": gamma_g, "self_weight": gamma_sw, "variable": (gamma_q,)}],
+        [{
+            "label": ELS_COMBINATION_LABELS.get(combination, "Somente variável"),
+            "permanent": permanent, "self_weight": permanent,
+            "variable": (els["variable_factor"],),
+        }],
+    )
+
+
+def _combined_loads(
+    rows: list, actions: list, q_g, p_g, self_weight, variable_scale=None,
+) -> tuple[np.ndarray, np.ndarray]:
+    """q (perfis × combinações) e P (combinações) de todas as linhas de uma vez.
+
+    ``variable_scale`` (um fator por perfil) multiplica as cargas variáveis
+    distribuídas; as pontuais continuam comuns a todos os perfis.
+    """
+    permanent, own = (np.array([row[key] for row in rows], dtype=float) for key in ("permanent", "self_weight"))
+    variable = np.array([row["variable"] for row in rows], dtype=float)
+    variable_q = variable @ np.array([a.q for a in actions], dtype=float)
+    if variable_scale is not None:
+        variable_q = variable_q * np.asarray(variable_scale, dtype=float)[:, None]
+    q = permanent * q_g + own * self_weight[:, None] + variable_q
+    P = permanent * p_g + variable @ np.array([a.point_load for a in actions], dtype=float)
+    return q, P
+
+
+def _governing_combination(efficiency, status, labels) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Reduz (perfis × combinações) à combinação de maior eficiência de cada perfil."""
+    efficiency, status = np.broadcast_arrays(efficiency, status)
+    index = np.argmax(efficiency, axis=1)
+    rows = np.arange(len(index))
+    status = status[rows, index]
+    label = np.asarray(labels, dtype=object)[index]
+    return efficiency[rows, index], status, np.where(status == "N/A", None, label)
+
+
+def _design_actions(props: dict, params: dict, variable_scale=None, span_scale=None) -> dict:
+    """Combinações e esforços solicitantes por perfil (perfis × combinações).
+
+    No modo manual, Msd e Vsd informados formam uma única coluna. No modo
+    automático, a viga é resolvida uma vez para cargas unitárias e o peso
+    próprio de cada perfil e cada combinação entram por superposição, assim
+    como o fator ``variable_scale`` das cargas variáveis distribuídas.
+
+    ``span_scale`` (s, um por perfil) avalia cada perfil no vão s·L, com as
+    posições na mesma proporção, sobre a viga de referência: por semelhança,
+    a viga de vão s·L sob (q, P) tem as reações e cortantes da viga de
+    referência sob (s·q, P), momentos s vezes maiores e flechas s³ vezes
+    maiores. ``q_elu`` e ``q_els`` já saem multiplicados por s; ``Msd``
+    também, e quem usa momentos ou flechas da viga aplica o fator restante.
+    """
+    count = len(props["d"])
+    design = {
+        "automatic": params["input_mode"] == AUTOMATIC_INPUT_MODE,
+        "Msd": np.full((count, 1), float(params["Msd"])),
+        "Vsd": np.full((count, 1), float(params["Vsd"])),
+        "elu_labels": ["Esforços informados"],
+        "els_labels": [],
+    }
+    if not design["automatic"]:
+        return design
+
+    tipo_viga = params["tipo_viga"]
+    L_cm = params["L_cm"]
+    q_serv = params.get("q_serv_kn_cm", 0.0)
+    p_load_serv = params.get("p_load_serv")
+    support = SUPPORT_ALIASES.get(tipo_viga)
+    if support is None:
+        raise ValueError(f"Vinculação não suportada: {tipo_viga}")
+    a = float(params.get("p_pos_cm", p_load_serv[1] if p_load_serv else L_cm / 2.0))
+    self_weight = (
+        props["Peso"] * GRAVITY / 100_000.0
+        if params.get("include_self_weight", True) else np.zeros(count)
+    )
+    q_g = params.get("q_g_kn_cm", 0.0)
+    p_g = params.get("p_g_kn", 0.0)
+    actions, elu_rows, els_rows = _combination_rows(
+        params, q_g, params.get("q_q_kn_cm", q_serv), p_g,
+        params.get("p_q_kn", p_load_serv[0] if p_load_serv else 0.0),
+    )
+    q_elu, P_elu = _combined_loads(elu_rows, actions, q_g, p_g, self_weight, variable_scale)
+    q_els, P_els = _combined_loads(els_rows, actions, q_g, p_g, self_weight, variable_scale)
+    if span_scale is not None:
+        span_scale = np.asarray(span_scale, dtype=float)
+        q_elu, q_els = q_elu * span_scale[:, None], q_els * span_scale[:, None]
+    _validate_beam_inputs(L_cm, float(q_elu.min()), float(P_elu.min()), a)
+    beam = unit_load_beam(support, L_cm, a)
+    ra, rb, _, _, _ = beam.end_actions(q_elu, P_elu)
+    Msd = beam.max_moment(q_elu, P_elu)[0]
+    design.update(
+        Msd=Msd if span_scale is None else Msd * span_scale[:, None],
+        Vsd=beam.max_shear(q_elu, P_elu),
+        elu_labels=[row["label"] for row in elu_rows],
+        els_labels=[row["label"] for row in els_rows],
+        beam=beam, point_position=a, ra=ra, rb=rb,
+        q_elu=q_elu, P_elu=P_elu, q_els=q_els, P_els=P_els, span_scale=span_scale,
+    )
+    return design
+
+
+def screen_profiles(props: dict, params: dict) -> dict:
+    """Triagem por limites superiores que provam a reprovação sem a verificação completa.
+
+    Todo Mrd de FLA (5.4.2 e Anexo E) é no máximo min(máx(Zx; Wx)·fy;
+    1,5·Wx·fy)/γa1 e todo Vrd de 5.4.3 é no máximo 0,6·d·tw·fy/γa1; a flecha
+    é inversamente proporcional a Ix, de modo que ``Ix_required`` é a inércia
+    que a levaria exatamente ao limite. Se a demanda supera o limite
+    superior, a verificação correspondente resulta ``REPROVADO`` e, como a
+    reprovação tem prioridade em ``overall_status``, o status global também:
+    ``rejected`` é idêntico ao que a avaliação completa concluiria.
+    """
+    fy, E = params["fy_aco"], params["E_aco"]
+    design = _design_actions(props, params)
+    W = props["Wx"]
+    moment_bound = np.minimum(np.maximum(props["Zx"], W) * fy / GAMMA_A1, 1.50 * W * fy / GAMMA_A1)
+    shear_bound = 0.60 * props["d"] * props["tw"] * fy / GAMMA_A1
+    Msd, Vsd = design["Msd"].max(axis=1), design["Vsd"].max(axis=1)
+    Ix_required = np.zeros(len(W))
+    if design["automatic"] and E > 0:
+        absolute_limit = 1.5 if params.get("masonry_on_beam", False) else None
+        limit = deflection_limit(
+            params["tipo_viga"], params["L_cm"], params["limite_flecha_divisor"], absolute_limit
+        )
+        # Com E = I = 1, max_deflection devolve o máximo de |E·I·δ| por combinação.
+        stiffness, _ = design["beam"].max_deflection(design["q_els"], design["P_els"], 1.0, 1.0)
+        Ix_required = stiffness.max(axis=1) / (E * limit)
+
+    # A folga relativa cobre o arredondamento entre o limite e a resistência calculada.
+    failures = (
+        (Msd > moment_bound * SCREENING_MARGIN, "Msd > min(Zx·fy; 1,5·Wx·fy)/γa1"),
+        (Vsd > shear_bound * SCREENING_MARGIN, "Vsd > 0,6·d·tw·fy/γa1"),
+        (props["Ix"] * SCREENING_MARGIN < Ix_required, "Ix < Ix necessário para a flecha"),
+    )
+    rejected = np.logical_or.reduce([mask for mask, _ in failures])
+    reason = np.full(len(W), None, dtype=object)
+    for index in np.flatnonzero(rejected):
+        reason[index] = "; ".join(text for mask, text in failures if mask[index])
+    return {
+        "rejected": rejected,
+        "reason": reason,
+        "Msd": Msd,
+        "Vsd": Vsd,
+        "Mrd_bound": moment_bound,
+        "Vrd_bound": shear_bound,
+        "Ix_required": Ix_required,
+    }
+
+
+# Chaves de ``input_params`` lidas pelas demandas (ações, combinações, Cb
+# automático e flecha com E·I = 1) e pelas capacidades de ``_evaluate_valid_profiles``.
+DEMAND_PARAMS = (
+    "input_mode", "Msd", "Vsd", "tipo_viga", "L_cm", "q_serv_kn_cm", "p_load_serv", "p_pos_cm",
+    "include_self_weight", "q_g_kn_cm", "q_q_kn_cm", "p_g_kn", "p_q_kn", "gamma_g", "gamma_q",
+    "gamma_self_weight", "combination_envelope", "variable_actions", "els_combinations",
+    "els_combination", "psi1", "psi2", "cb_modo_auto", "lb_start_cm", "Lb_projeto",
+)
+CAPACITY_PARAMS = (
+    "fy_aco", "fu_aco", "E_aco", "Lb_projeto", "flt_applicable", "has_tension_flange_holes",
+    "tension_flange_net_ratio", "usa_enrijecedores", "a_enr", "stiffener_width",
+    "stiffener_thickness", "stiffener_pair", "stiffener_welded", "bearing_left_cm",
+    "bearing_right_cm", "point_bearing_cm", "support_relative_lateral_restrained",
+    "point_relative_lateral_restrained", "loaded_flange_rotation_restrained", "local_unbraced_cm",
+    "weld_root_cm",
+)
+# Entradas de cada LRU de ``EvaluationCache``.
+EVALUATION_CACHE_SIZE = 16
+
+
+def _array_digest(*arrays) -> str:
+    """Resumo do conteúdo, do tipo e da forma de cada array (``None`` incluído)."""
+    digest = hashlib.blake2b(digest_size=16)
+    for value in arrays:
+        if value is None:
+            digest.update(b"\x00none")
+            continue
+        value = np.asarray(value)
+        digest.update(f"{value.dtype.str}{value.shape}".encode())
+        if value.dtype == object or value.dtype.kind == "U":
+            digest.update("\x1f".join(map(str, value.ravel())).encode("utf-8"))
+        else:
+            digest.update(np.ascontiguousarray(value).tobytes())
+    return digest.hexdigest()
+
+
+class EvaluationCache:
+    """Capacidades e demandas de ``_evaluate_valid_profiles`` em LRUs separadas.
+
+    As capacidades (flexão, cisalhamento e forças localizadas) dependem só
+    dos perfis, do material, de Lb e Cb, da fabricação, dos enrijecedores e
+    dos comprimentos de apoio; as demandas, das cargas, do vão e das
+    combinações. Mudar Gk ou Qk recalcula apenas as demandas, e as
+    eficiências saem da divisão das demandas pelas capacidades guardadas.
+    ``hits`` e ``misses`` contam os acessos por tipo (``"capacity"`` e
+    ``"demand"``). As entradas são compartilhadas e apenas lidas; o acesso é
+    protegido por uma trava, como exige ``st.cache_resource``.
+    """
+
+    def __init__(self, capacity_size: int = EVALUATION_CACHE_SIZE, demand_size: int = EVALUATION_CACHE_SIZE):
+        self._stores = {"capacity": (OrderedDict(), capacity_size), "demand": (OrderedDict(), demand_size)}
+        self._lock = threading.Lock()
+        self.hits = dict.fromkeys(self._stores, 0)
+        self.misses = dict.fromkeys(self._stores, 0)
+
+    def get(self, kind: str, key: tuple, compute):
+        """Valor de ``key`` no cache ``kind``; na ausência, ``compute()`` é guardado."""
+        store, size = self._stores[kind]
+        with self._lock:
+            if key in store:
+                store.move_to_end(key)
+                self.hits[kind] += 1
+                return store[key]
+            self.misses[kind] += 1
+        # Fora da trava: duas chamadas simultâneas no máximo repetem o cálculo.
+        value = compute()
+        with self._lock:
+            store[key] = value
+            store.move_to_end(key)
+            while len(store) > size:
+                store.popitem(last=False)
+        return value
+
+    def clear(self) -> None:
+        with self._lock:
+            for store, _ in self._stores.values():
+                store.clear()
+
+
+def _demand_columns(props: dict, params: dict, variable_scale=None, span_scale=None) -> dict:
+    """Demandas de ``_evaluate_valid_profiles``, independentes do material e das resistências.
+
+    Além de ``_design_actions``, no modo automático traz o Cb do diagrama
+    (com ``cb_modo_auto``), ``stiffness`` = |E·I·δ| por combinação ELS (a
+    flecha é esse valor dividido por E·Ix) e, para cada local de força
+    localizada (``locations``: apoio esquerdo, direito e carga pontual), a
+    força, a distância à extremidade, o momento no local e as combinações
+    em que a força atua.
+    """
+    design = _design_actions(props, params, variable_scale, span_scale)
+    demand = {"design": design, "Cb": None, "locations": (), "distances": ()}
+    if not design["automatic"]:
+        return demand
+    count = len(props["d"])
+    tipo_viga, L_cm = params["tipo_viga"], params["L_cm"]
+    beam, a, scale = design["beam"], design["point_position"], design["span_scale"]
+    q_elu, P_elu = design["q_elu"], design["P_elu"]
+    if params.get("cb_modo_auto", False):
+        # Cb só depende da forma do carregamento: com as cargas divididas por q
+        # (ou por P, sem carga distribuída), mudar apenas a intensidade das
+        # cargas repete Cb bit a bit e, com ele, as capacidades em cache.
+        size = np.where(q_elu != 0, np.abs(q_elu), np.abs(np.broadcast_to(P_elu, q_elu.shape)))
+        size = np.where(size > 0, size, 1.0)
+        Cb = beam.cb(q_elu / size, P_elu / size, params.get("lb_start_cm", 0.0), params["Lb_projeto"])["Cb"]
+        demand["Cb"] = Cb[:, 0] if Cb.shape[1] == 1 else Cb
+    demand["stiffness"], _ = beam.max_deflection(design["q_els"], design["P_els"], 1.0, 1.0)
+
+    combinations = len(design["elu_labels"])
+    every = np.ones(combinations, dtype=bool)
+    locations = [("left", np.abs(design["ra"]), 0.0, 0.0, every)]
+    if tipo_viga != CANTILEVER:
+        locations.append(("right", np.abs(design["rb"]), 0.0, L_cm, every))
+    if np.any(P_elu > 0):
+        locations.append((
+            "point", np.broadcast_to(P_elu, (count, combinations)), min(a, L_cm - a), a, P_elu > 0,
+        ))
+    kinds, forces, distances, x_load, loaded = zip(*locations)
+    x_load = np.clip(np.asarray(x_load, dtype=float), 0.0, L_cm)
+    # Eixos: perfis × locais × combinações.
+    moments = beam.moment_at(q_elu[:, None, :], P_elu, x_load[None, :, None])
+    if scale is not None:
+        moments = moments * scale[:, None, None]
+    demand.update(
+        locations=kinds, distances=distances, forces=np.stack(forces, axis=1),
+        moments=moments, loaded=np.concatenate(loaded),
+    )
+    return demand
+
+
+def _capacity_columns(
+    props: dict, fabrication, params: dict, Cb, locations=(), distances=(), span_scale=None,
+) -> dict:
+    """Resistências de ``_evaluate_valid_profiles``, independentes das cargas.
+
+    ``Cb`` tem um valor por perfil ou é uma matriz (perfis × combinações);
+    ``locations`` e ``distances`` vêm de ``_demand_columns``. Nas forças
+    localizadas, o único efeito da carga é Cr = 32·E ou 16·E conforme o
+    momento no local seja menor que Mr (5.7.5): ``local_FRd_32E`` e
+    ``local_FRd_16E`` guardam os dois casos e ``local_Mr`` o limite entre eles
+    (NaN onde a flambagem lateral da alma não ocorre e os dois coincidem).
+    """
+    fy, fu, E = params["fy_aco"], params.get("fu_aco", 45.0), params["E_aco"]
+    Lb = params["Lb_projeto"]
+    scale = None if span_scale is None else np.asarray(span_scale, dtype=float)
+    holes = params.get("has_tension_flange_holes", False)
+    stiffeners = params.get("usa_enrijecedores", False)
+    a_enr = params.get("a_enr", 0.0)
+    # Com Cb por combinação, as propriedades ganham o eixo de combinações.
+    flex_props, flex_fabrication = props, fabrication
+    flex_Lb = Lb if scale is None else Lb * scale
+    if Cb.ndim == 2:
+        flex_props = {key: value[:, None] for key, value in props.items()}
+        flex_fabrication = fabrication if isinstance(fabrication, str) else np.asarray(fabrication)[:, None]
+        flex_Lb = flex_Lb if scale is None else flex_Lb[:, None]
+    Afg = flex_props["bf"] * flex_props["tf"] if holes else None
+    Afn = Afg * params.get("tension_flange_net_ratio", 1.0) if holes else None
+    capacity = {
+        "flexure": flexural_strength_i_batch(
+            flex_props, fy, fu, E, flex_Lb, Cb, flex_fabrication,
+            stiffener_spacing=a_enr if stiffeners else None,
+            flt_applicable=params.get("flt_applicable", True),
+            net_tension_flange_area=Afn,
+            gross_tension_flange_area=Afg,
+        ),
+        "shear": shear_strength_i_batch(
+            props, fy, E,
+            stiffener_spacing=a_enr if stiffeners else None,
+            stiffener_width=params.get("stiffener_width"),
+            stiffener_thickness=params.get("stiffener_thickness"),
+            stiffener_pair=params.get("stiffener_pair", True),
+            stiffener_welded_to_web_and_flanges=params.get("stiffener_welded", False),
+        ),
+    }
+    if not locations:
+        return capacity
+
+    support_restrained = params.get("support_relative_lateral_restrained", True)
+    bearing = {
+        "left": params.get("bearing_left_cm", 10.0),
+        "right": params.get("bearing_right_cm", 10.0),
+        "point": params.get("point_bearing_cm", 10.0),
+    }
+    restrained = {
+        "left": support_restrained,
+        "right": support_restrained,
+        "point": params.get("point_relative_lateral_restrained", True),
+    }
+    distance = np.asarray(distances, dtype=float)
+    local_unbraced = params.get("local_unbraced_cm", Lb)
+    if scale is not None:
+        distance = np.outer(scale, distance)
+        if local_unbraced is not None:
+            local_unbraced = np.outer(scale, np.full(len(locations), local_unbraced))
+    # Uma chamada com cada local duas vezes: primeiro com Cr = 32·E, depois com 16·E.
+    count = len(locations)
+    local = local_compression_strength_batch(
+        props, fy, E, [bearing[kind] for kind in locations] * 2,
+        np.concatenate([distance, distance], axis=-1), fabrication,
+        weld_root_or_radius=params.get("weld_root_cm", 0.0),
+        lateral_unbraced_length=(
+            np.concatenate([local_unbraced, local_unbraced], axis=-1)
+            if isinstance(local_unbraced, np.ndarray) else local_unbraced
+        ),
+        flange_rotation_restrained=params.get("loaded_flange_rotation_restrained", True),
+        relative_lateral_movement_restrained=[restrained[kind] for kind in locations] * 2,
+        moment_at_load=np.repeat([0.0, np.inf], count),
+    )
+    capacity.update(
+        local_FRd_32E=local["FRd"][:, :count], local_FRd_16E=local["FRd"][:, count:],
+        local_Mr=local["Mr"][:, :count],
+    )
+    return capacity
+
+
+def _evaluate_valid_profiles(
+    props: dict, fabrication, params: dict, variable_scale=None, span_scale=None,
+    cache: EvaluationCache | None = None,
+) -> dict:
+    """Executa o fluxo de ``perform_all_checks`` para colunas de perfis válidos.
+
+    As demandas têm um eixo de combinações (perfis × combinações); cada
+    verificação é reduzida à combinação governante do perfil. A combinação
+    única da barra lateral é o caso de uma coluna. ``variable_scale`` e
+    ``span_scale`` seguem para ``_design_actions``; com ``span_scale``, Lb,
+    ℓ, as distâncias das forças localizadas e o limite de flecha acompanham
+    o vão de cada perfil.
+
+    Demandas (``_demand_columns``) e capacidades (``_capacity_columns``) são
+    calculadas em separado; com ``cache``, cada parte é reaproveitada quando
+    as entradas de que depende (``DEMAND_PARAMS`` ou ``CAPACITY_PARAMS``,
+    perfis e fatores de escala) se repetem.
+    """
+    count = len(props["d"])
+    tipo_viga = params["tipo_viga"]
+    L_cm = params["L_cm"]
+    fy, fu, E = params["fy_aco"], params.get("fu_aco", 45.0), params["E_aco"]
+    flt_applicable = params.get("flt_applicable", True)
+    scope_issues = list(params.get("unsupported_reasons", []))
+    scope_issues.extend(validate_material(fy, fu))
+
+    def demand_columns():
+        return _demand_columns(props, params, variable_scale, span_scale)
+
+    if cache is None:
+        demand = demand_columns()
+    else:
+        profiles = _array_digest(fabrication, *(props[key] for key in sorted(props)))
+        demand = cache.get("demand", (
+            profiles, repr([params.get(name) for name in DEMAND_PARAMS]),
+            _array_digest(variable_scale, span_scale),
+        ), demand_columns)
+    design = demand["design"]
+    automatic = design["automatic"]
+    scale = design.get("span_scale")
+    Msd, Vsd = design["Msd"], design["Vsd"]
+    elu_labels, els_labels = design["elu_labels"], design["els_labels"]
+    Cb = demand["Cb"] if demand["Cb"] is not None else np.full(count, float(params["Cb_projeto"]))
+    locations = demand["locations"]
+
+    def capacity_columns():
+        return _capacity_columns(props, fabrication, params, Cb, locations, demand["distances"], scale)
+
+    if cache is None:
+        capacity = capacity_columns()
+    else:
+        capacity = cache.get("capacity", (
+            profiles, repr([params.get(name) for name in CAPACITY_PARAMS]), locations,
+            _array_digest(Cb, np.asarray(demand["distances"], dtype=float), scale),
+        ), capacity_columns)
+    flex, shear = capacity["flexure"], capacity["shear"]
+    local_efficiency = np.zeros(count)
+    local_label = np.full(count, None, dtype=object)
+    local_statuses: list[np.ndarray] = []
+    deflection_efficiency = np.zeros(count)
+    deflection_status = np.full(count, "N/A", dtype=object)
+    deflection_label = np.full(count, None, dtype=object)
+
+    if automatic:
+        if E > 0:
+            deflection = demand["stiffness"] / (E * props["Ix"][:, None])
+        else:
+            deflection = np.zeros(design["q_els"].shape)
+        absolute_limit = 1.5 if params.get("masonry_on_beam", False) else None
+        limit = deflection_limit(tipo_viga, L_cm, params["limite_flecha_divisor"], absolute_limit)
+        if scale is not None:
+            deflection = deflection * scale[:, None] ** 3
+            limit = deflection_limit(tipo_viga, L_cm, params["limite_flecha_divisor"]) * scale[:, None]
+            if absolute_limit:
+                limit = np.minimum(limit, absolute_limit)
+        deflection_efficiency, deflection_status, deflection_label = _governing_combination(
+            *_verification_columns(deflection, limit), els_labels
+        )
+
+        # Colunas ordenadas por local e, dentro de cada local, por combinação.
+        combinations = len(elu_labels)
+        braced = np.abs(demand["moments"]) < capacity["local_Mr"][:, :, None]
+        FRd = np.where(
+            braced, capacity["local_FRd_32E"][:, :, None], capacity["local_FRd_16E"][:, :, None]
+        ).reshape(count, -1)
+        efficiency, status = _verification_columns(
+            demand["forces"].reshape(count, -1), FRd, demand["loaded"]
+        )
+        by_combination = efficiency.reshape(count, len(locations), combinations).max(axis=1)
+        local_efficiency, _, local_label = _governing_combination(
+            by_combination, np.full(by_combination.shape, "", dtype=object), elu_labels
+        )
+        local_statuses = list(status.T)
+    elif not params.get("manual_local_checks_confirmed", False):
+        scope_issues.append("Modo manual sem reações/forças localizadas e sem verificação ELS.")
+
+    def resistance(value):
+        value = np.asarray(value, dtype=float)
+        return value[:, None] if value.ndim == 1 else value
+
+    flt_eff, flt_status, flt_label = _governing_combination(*_verification_columns(
+        Msd, resistance(flex["Mrd_FLT"]) if flex["Mrd_FLT"] is not None else np.nan, flt_applicable
+    ), elu_labels)
+    flm_eff, flm_status, flm_label = _governing_combination(
+        *_verification_columns(Msd, resistance(flex["Mrd_FLM"])), elu_labels
+    )
+    fla_eff, fla_status, fla_label = _governing_combination(
+        *_verification_columns(Msd, resistance(flex["Mrd_FLA_or_tension"])), elu_labels
+    )
+    rupture = resistance(flex["Mrd_rupture"])
+    rupture_eff, rupture_status, rupture_label = _governing_combination(
+        *_verification_columns(Msd, rupture, ~np.isnan(rupture)), elu_labels
+    )
+    rupture_applicable = rupture_status != "N/A"
+    shear_eff, shear_status, shear_label = _governing_combination(
+        *_verification_columns(Vsd, resistance(shear["Vrd"])), elu_labels
+    )
+
+    pending = np.full(count, bool(scope_issues)) | ~np.reshape(flex["applicable"], (count, -1)).all(axis=1)
+    status = _overall_status_columns(
+        [flt_status, flm_status, fla_status, rupture_status, shear_status, deflection_status]
+        + local_statuses,
+        pending,
+    )
+    efficiencies = np.stack([
+        flt_eff, flm_eff, fla_eff, np.where(rupture_applicable, rupture_eff, -np.inf),
+        shear_eff, local_efficiency, deflection_efficiency,
+    ], axis=1)
+    governing_index = np.argmax(efficiencies, axis=1)
+    governing = np.asarray(CHECK_NAMES, dtype=object)[governing_index]
+    results = {
+        "Status": status,
+        "Ef. FLT (%)": flt_eff,
+        "Ef. FLM (%)": flm_eff,
+        "Ef. FLA (%)": fla_eff,
+        "Ef. Cisalhamento (%)": shear_eff,
+        "Ef. Ruptura Mesa (%)": np.where(rupture_applicable, rupture_eff, np.nan),
+        "Ef. Forças Locais (%)": local_efficiency,
+        "Ef. Flecha (%)": deflection_efficiency,
+        "Estado-limite governante": governing,
+        "flexure": flex,
+    }
+    if params.get("combination_envelope", False) and automatic:
+        labels = np.stack([
+            flt_label, flm_label, fla_label, rupture_label, shear_label, local_label, deflection_label,
+        ], axis=1)
+        for name, column in zip(COMBINATION_COLUMNS, labels.T):
+            results[name] = column
+        results["Combinação governante"] = labels[np.arange(count), governing_index]
+    return results
+
+
+_MAIN_LOCK = threading.Lock()
+
+
+class _CleanMainProcess:
+    """Processo do pool que não reexecuta o ``__main__`` do processo pai.
+
+    O multiprocessing reimporta no filho o script de entrada do pai, achado
+    por ``__main__.__file__`` ou ``__main__.__spec__``. Sob ``streamlit run``
+    esse script é o do próprio Streamlit, que traria a interface e o Plotly
+    para cada processo; por isso os dois atributos ficam ocultos enquanto o
+    processo é criado.
+    """
+
+    def start(self):
+        main = sys.modules["__main__"]
+        with _MAIN_LOCK:
+            saved = {name: main.__dict__[name] for name in ("__file__", "__spec__") if name in main.__dict__}
+            main.__dict__.pop("__file__", None)
+            main.__spec__ = None
+            try:
+                super().start()
+            finally:
+                main.__dict__.pop("__spec__", None)
+                main.__dict__.update(saved)
+
+
+class _SpawnProcess(_CleanMainProcess, multiprocessing.context.SpawnProcess):
+    pass
+
+
+class _SpawnContext(multiprocessing.context.SpawnContext):
+    Process = _SpawnProcess
+
+
+if sys.platform != "win32":
+    class _ForkServerProcess(_CleanMainProcess, multiprocessing.context.ForkServerProcess):
+        pass
+
+    class _ForkServerContext(multiprocessing.context.ForkServerContext):
+        Process = _ForkServerProcess
+
+
+def make_catalog_executor(
+    workers: int | None = None, initializer=None, initargs: tuple = (),
+) -> ProcessPoolExecutor:
+    """Pool de processos para ``evaluate_catalog(..., executor=...)``.
+
+    Os processos nascem de um forkserver que já importou este módulo (NumPy,
+    pandas e o núcleo de cálculo), sem herdar a interface nem suas threads e
+    sem reimportar o script de entrada (``_CleanMainProcess``).
+    Guardado entre execuções, o pool mantém os processos prontos.
+    ``initializer(*initargs)`` roda uma vez em cada processo.
+    """
+    if "forkserver" in multiprocessing.get_all_start_methods():
+        context = _ForkServerContext()
+        context.set_forkserver_preload([__name__])
+    else:
+        context = _SpawnContext()
+    return ProcessPoolExecutor(
+        workers or os.cpu_count() or 1, mp_context=context, initializer=initializer, initargs=initargs,
+    )
+
+
+def _evaluate_chunk(props: dict, fabrication, params: dict) -> dict:
+    # Tarefa do pool: só as colunas de resultado voltam ao processo principal.
+    results = _evaluate_valid_profiles(props, fabrication, params)
+    results.pop("flexure")
+    return results
+
+
+def _evaluate_partitioned(
+    executor: Executor, props: dict, fabrication, families, params: dict, chunk_rows: int,
+) -> dict:
+    """``_evaluate_valid_profiles`` por planilha e em blocos de ``chunk_rows`` perfis no ``executor``."""
+    count = len(fabrication)
+    edges = np.flatnonzero(families[1:] != families[:-1]) + 1
+    starts: list[int] = []
+    for start, stop in zip(np.r_[0, edges], np.r_[edges, count]):
+        starts.extend(range(start, stop, chunk_rows))
+    futures = [
+        executor.submit(
+            _evaluate_chunk, {key: value[start:stop] for key, value in props.items()},
+            fabrication[start:stop], params,
+        )
+        for start, stop in zip(starts, starts[1:] + [count])
+    ]
+    parts = [future.result() for future in futures]
+    return {name: np.concatenate([part[name] for part in parts]) for name in parts[0]}
+
+
+def evaluate_catalog(
+    input_params: dict, all_sheets: dict | ProfileTable, prune: bool = False,
+    bounds: dict | None = None, executor: Executor | None = None,
+    chunk_rows: int = PARALLEL_CHUNK_ROWS, cache: EvaluationCache | None = None,
+) -> pd.DataFrame:
+    """Avalia todos os perfis do catálogo e devolve o DataFrame da análise em lote.
+
+    ``input_params`` é o mesmo dicionário montado na barra lateral de ``main``;
+    o catálogo pode vir como as planilhas lidas ou como um ``ProfileTable``.
+    Perfis com propriedades inválidas e erros de dados que afetam todo o lote
+    resultam em ``NÃO VERIFICADO`` com a mensagem em ``Observação``, como na
+    rotina linha a linha.
+
+    Com ``prune``, os perfis que ``screen_profiles`` já prova reprovados
+    recebem ``REPROVADO`` e o motivo na coluna ``Triagem``, sem as
+    verificações completas; suas eficiências ficam vazias. Os demais perfis
+    e todos os status são idênticos aos da avaliação completa.
+
+    ``bounds`` (``{propriedade: (mínimo, máximo)}``, como em
+    ``ProfileTable.query``) restringe a avaliação aos perfis válidos dentro
+    das faixas, mantida a ordem do catálogo; sem perfis nas faixas, o
+    DataFrame fica vazio, mas com as colunas de sempre.
+
+    Com ``executor``, a verificação completa é dividida por planilha e em
+    blocos de até ``chunk_rows`` perfis; cada tarefa leva apenas as colunas
+    de propriedades do bloco e ``input_params``. Sem ``executor``, ``cache``
+    (``EvaluationCache``) reaproveita capacidades e demandas entre chamadas.
+    """
+    table = all_sheets if isinstance(all_sheets, ProfileTable) else ProfileTable.from_sheets(all_sheets)
+    columns = table.columns
+    if bounds:
+        selected = np.sort(table.query(**bounds))
+        columns = {key: values[selected] for key, values in columns.items()}
+    count = len(columns["Perfil"])
+    valid = columns["valid"].copy()
+    observation = columns["observation"].copy()
+    frame = {
+        "Tipo": columns["Tipo"],
+        "Perfil": columns["Perfil"],
+        "Peso (kg/m)": np.where(valid, columns["Peso"], columns["raw_weight"]),
+        "Status": np.full(count, "NÃO VERIFICADO", dtype=object),
+    }
+    result_columns = EFFICIENCY_COLUMNS + ("Estado-limite governante",)
+    if input_params.get("combination_envelope", False) and input_params["input_mode"] == AUTOMATIC_INPUT_MODE:
+        result_columns += COMBINATION_COLUMNS + ("Combinação governante",)
+    for name in result_columns:
+        frame[name] = np.full(count, np.nan, dtype=float if name.startswith("Ef.") else object)
+    if prune:
+        frame["Triagem"] = np.full(count, None, dtype=object)
+
+    if valid.any():
+        rows = np.flatnonzero(valid)
+        props = {key: columns[key][rows] for key, _, _ in PROPERTY_COLUMNS}
+        try:
+            screening = screen_profiles(props, input_params) if prune else None
+            full = rows if screening is None else rows[~screening["rejected"]]
+            full_props = {key: columns[key][full] for key, _, _ in PROPERTY_COLUMNS}
+            if not len(full):
+                results = None
+            elif executor is None:
+                results = _evaluate_valid_profiles(
+                    full_props, columns["fabrication"][full], input_params, cache=cache,
+                )
+            else:
+                results = _evaluate_partitioned(
+                    executor, full_props, columns["fabrication"][full], columns["Tipo"][full],
+                    input_params, chunk_rows,
+                )
+        except (ValueError, KeyError) as exc:
+            observation[valid] = str(exc)
+            valid[:] = False
+        else:
+            if results is not None:
+                for name in ("Status",) + result_columns:
+                    frame[name][full] = results[name]
+            if screening is not None:
+                pruned = rows[screening["rejected"]]
+                frame["Status"][pruned] = "REPROVADO"
+                frame["Triagem"][pruned] = screening["reason"][screening["rejected"]]
+
+    if not valid.all():
+        frame["Observação"] = observation
+    return pd.DataFrame(frame)
+
+
+def lightest_profiles(
+    input_params: dict, all_sheets: dict | ProfileTable, top: int = 1, families=None,
+    bounds: dict | None = None,
+) -> dict:
+    """Os ``top`` perfis APROVADOS mais leves de cada família, sem avaliar o catálogo inteiro.
+
+    Os perfis válidos vêm do índice de peso de ``ProfileTable`` (empates na
+    ordem do catálogo), separados por família, e ``screen_profiles`` descarta, de uma vez, os que
+    os limites superiores de Mrd, Vrd e Ix já provam reprovados. Os restantes
+    passam pela verificação completa em rodadas, na ordem do peso, com lotes
+    que dobram a cada rodada; as famílias ainda abertas são avaliadas juntas
+    em uma única chamada por rodada. O resultado é o mesmo das primeiras
+    linhas aprovadas de ``evaluate_catalog`` ordenado por peso, e
+    ``full_evaluations`` informa quantos perfis passaram pela verificação
+    completa. ``bounds`` limita a busca às faixas de ``ProfileTable.query``.
+    """
+    if top < 1:
+        raise ValueError("Informe ao menos um perfil por família.")
+    table = all_sheets if isinstance(all_sheets, ProfileTable) else ProfileTable.from_sheets(all_sheets)
+    columns = table.columns
+    if families is None:
+        families = table.families
+
+    def props_at(rows):
+        return {key: columns[key][rows] for key, _, _ in PROPERTY_COLUMNS}
+
+    ordered = {family: table.query("Peso", families=(family,), **(bounds or {})) for family in families}
+    all_rows = np.concatenate(list(ordered.values())) if ordered else np.empty(0, dtype=int)
+    # Sem perfis nas faixas não há o que triar: o resultado é vazio.
+    rejected = {}
+    if len(all_rows):
+        rejected = dict(zip(all_rows, screen_profiles(props_at(all_rows), input_params)["rejected"]))
+    candidates = {family: np.array([row for row in rows if not rejected[row]], dtype=int)
+                  for family, rows in ordered.items()}
+    summary = {
+        family: {
+            "profiles": len(rows), "screened_out": len(rows) - len(candidates[family]),
+            "full_evaluations": 0, "found": 0,
+        }
+        for family, rows in ordered.items()
+    }
+    approved: dict[str, list] = {family: [] for family in families}
+    start, batch = 0, top
+    while True:
+        open_families = [
+            family for family in families
+            if summary[family]["found"] < top and start < len(candidates[family])
+        ]
+        if not open_families:
+            break
+        chunks = [candidates[family][start:start + batch] for family in open_families]
+        rows = np.concatenate(chunks)
+        results = _evaluate_valid_profiles(props_at(rows), columns["fabrication"][rows], input_params)
+        offset = 0
+        for family, chunk in zip(open_families, chunks):
+            summary[family]["full_evaluations"] += len(chunk)
+            passed = np.flatnonzero(results["Status"][offset:offset + len(chunk)] == "APROVADO")
+            for position in passed[:top - summary[family]["found"]] + offset:
+                approved[family].append({
+                    "Tipo": family,
+                    "Perfil": columns["Perfil"][rows[position]],
+                    "Peso (kg/m)": columns["Peso"][rows[position]],
+                    **{name: value[position] for name, value in results.items() if name != "flexure"},
+                })
+                summary[family]["found"] += 1
+            offset += len(chunk)
+        start += batch
+        batch *= 2
+    return {
+        "profiles": pd.DataFrame([record for family in families for record in approved[family]]),
+        "families": summary,
+        "full_evaluations": sum(item["full_evaluations"] for item in summary.values()),
+    }
+
+
+def _bisect_capacity(evaluate, count: int, low: float, high: float, tolerance: float, limit: float) -> dict:
+    """Bissecção simultânea do maior valor APROVADO de cada perfil.
+
+    ``evaluate(linhas, valores)`` verifica as linhas nos valores indicados.
+    Como as verificações crescem monotonicamente com o valor, basta um
+    intervalo [aprovado, não aprovado] por perfil: o limite superior dobra até
+    reprovar (ou até ``limit``) e o intervalo é então dividido ao meio até
+    ``tolerance``. Cada rodada é uma única chamada de ``evaluate`` para todos
+    os perfis ainda abertos, cada um no seu próprio valor.
+    """
+    if not 0 <= low < high or tolerance <= 0:
+        raise ValueError("Intervalo de busca inválido.")
+    lo = np.full(count, float(low))
+    hi = np.full(count, float(high))
+    approved: dict = {}
+    failed: dict = {}
+
+    def run(rows, values):
+        results = evaluate(rows, values)
+        efficiency = np.column_stack([results[name] for name in EFFICIENCY_COLUMNS])
+        summary = {
+            "Status": results["Status"],
+            "Estado-limite governante": results["Estado-limite governante"],
+            "Eficiência no limite (%)": np.nanmax(efficiency, axis=1),
+        }
+        passed = results["Status"] == "APROVADO"
+        for store, mask in ((approved, passed), (failed, ~passed)):
+            for row, position in zip(rows[mask], np.flatnonzero(mask)):
+                store[row] = {name: value[position] for name, value in summary.items()}
+        return passed
+
+    rows = np.arange(count)
+    feasible = run(rows, lo)
+    rows = rows[feasible]
+    # Expansão: o limite superior dobra enquanto o perfil ainda é aprovado.
+    while len(rows):
+        passed = run(rows, hi[rows])
+        lo[rows[passed]] = hi[rows[passed]]
+        rows = rows[passed & (hi[rows] < limit)]
+        hi[rows] = np.minimum(2.0 * hi[rows], limit)
+    rows = np.flatnonzero(feasible & (hi > lo))
+    while len(rows):
+        middle = (lo[rows] + hi[rows]) / 2.0
+        passed = run(rows, middle)
+        lo[rows[passed]] = middle[passed]
+        hi[rows[~passed]] = middle[~passed]
+        rows = rows[hi[rows] - lo[rows] > tolerance]
+
+    value = np.where(feasible, lo, np.nan)
+    summary = {"value": value}
+    for name in ("Estado-limite governante", "Eficiência no limite (%)"):
+        summary[name] = np.array([
+            (approved.get(row) or failed[row])[name] for row in range(count)
+        ], dtype=object if name.startswith("Estado") else float)
+    summary["Status além do limite"] = np.array(
+        [failed[row]["Status"] if row in failed else None for row in range(count)], dtype=object
+    )
+    return summary
+
+
+def _capacity_frame(table: "ProfileTable", rows: np.ndarray, column: str, summary: dict) -> pd.DataFrame:
+    columns = table.columns
+    return pd.DataFrame({
+        "Tipo": columns["Tipo"][rows],
+        "Perfil": columns["Perfil"][rows],
+        "Peso (kg/m)": columns["Peso"][rows],
+        column: summary["value"],
+        "Estado-limite governante": summary["Estado-limite governante"],
+        "Eficiência no limite (%)": summary["Eficiência no limite (%)"],
+        "Status além do limite": summary["Status além do limite"],
+    })
+
+
+def _inverse_rows(input_params: dict, all_sheets, bounds) -> tuple["ProfileTable", np.ndarray]:
+    if input_params["input_mode"] != AUTOMATIC_INPUT_MODE:
+        raise ValueError("O cálculo inverso exige o modo de cargas aplicadas na viga.")
+    table = all_sheets if isinstance(all_sheets, ProfileTable) else ProfileTable.from_sheets(all_sheets)
+    return table, np.sort(table.query(**(bounds or {})))
+
+
+def max_span(
+    input_params: dict, all_sheets: dict | ProfileTable, low: float = 50.0, high: float = 3_000.0,
+    tolerance: float = 1.0, bounds: dict | None = None,
+) -> pd.DataFrame:
+    """Maior vão (cm) em que cada perfil válido é APROVADO com as cargas de ``input_params``.
+
+    Lb, x0, ℓ e a posição da carga pontual acompanham o vão na proporção de
+    ``input_params``; as cargas, os apoios e o restante dos dados ficam
+    fixos. O vão de cada perfil entra como ``span_scale`` sobre a viga de
+    ``L_cm``, de modo que cada rodada da bissecção (de ``low`` a ``high``,
+    com precisão ``tolerance``) é uma única avaliação colunar do catálogo.
+
+    ``Vão máximo (cm)`` é NaN para perfis não aprovados já em ``low`` e igual
+    a ``high`` quando o limite não é atingido (``Status além do limite``
+    vazio). ``Estado-limite governante`` e ``Eficiência no limite (%)`` vêm da
+    última verificação aprovada; ``Status além do limite``, da primeira
+    reprovada ou não verificada.
+    """
+    table, rows = _inverse_rows(input_params, all_sheets, bounds)
+    columns = table.columns
+    props = {key: columns[key][rows] for key, _, _ in PROPERTY_COLUMNS}
+
+    def evaluate(subset, spans):
+        return _evaluate_valid_profiles(
+            {key: value[subset] for key, value in props.items()},
+            columns["fabrication"][rows[subset]], input_params, span_scale=spans / input_params["L_cm"],
+        )
+
+    summary = _bisect_capacity(evaluate, len(rows), low, high, tolerance, high)
+    return _capacity_frame(table, rows, "Vão máximo (cm)", summary)
+
+
+def max_variable_load(
+    input_params: dict, all_sheets: dict | ProfileTable, high: float = 1.0,
+    tolerance: float = 1e-3, limit: float = 1_000.0, bounds: dict | None = None,
+) -> pd.DataFrame:
+    """Maior fator das cargas variáveis distribuídas com cada perfil válido APROVADO.
+
+    O fator multiplica ``q_q_kn_cm`` (ou o ``q`` de cada ação de
+    ``variable_actions`` na envoltória); cargas permanentes, peso próprio e
+    cargas pontuais ficam fixos. O fator entra por perfil na superposição de
+    ``_design_actions``, de modo que cada rodada da bissecção é uma única
+    avaliação colunar do catálogo: o limite superior parte de ``high`` e dobra
+    até reprovar (no máximo ``limit``), e o intervalo é dividido até
+    ``tolerance``.
+
+    ``Carga variável máxima (kN/m)`` é o fator vezes a soma das cargas
+    variáveis distribuídas de referência. O fator é NaN para perfis não
+    aprovados nem sem carga variável; as demais colunas seguem ``max_span``.
+    """
+    table, rows = _inverse_rows(input_params, all_sheets, bounds)
+    columns = table.columns
+    props = {key: columns[key][rows] for key, _, _ in PROPERTY_COLUMNS}
+    if input_params.get("combination_envelope", False):
+        reference = sum(
+            (action.q if isinstance(action, VariableAction) else action.get("q", 0.0))
+            for action in input_params.get("variable_actions", ())
+        )
+    else:
+        reference = input_params.get("q_q_kn_cm", input_params.get("q_serv_kn_cm", 0.0))
+    if reference <= 0:
+        raise ValueError("Informe uma carga variável distribuída de referência positiva.")
+
+    def evaluate(subset, factors):
+        return _evaluate_valid_profiles(
+            {key: value[subset] for key, value in props.items()},
+            columns["fabrication"][rows[subset]], input_params, factors,
+        )
+
+    summary = _bisect_capacity(evaluate, len(rows), 0.0, high, tolerance, limit)
+    frame = _capacity_frame(table, rows, "Fator de carga variável", summary)
+    frame.insert(4, "Carga variável máxima (kN/m)", summary["value"] * reference * 100.0)
+    return frame
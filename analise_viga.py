@@ -0,0 +1,936 @@
+"""Motor de vigas por polinômios por trechos, para listas arbitrárias de cargas.
+
+``analyze_beam`` (núcleo) trata uma carga uniforme e uma carga pontual. Este
+módulo aceita N cargas concentradas e cargas distribuídas parciais ou
+trapezoidais nos mesmos quatro modelos de vinculação. A viga é dividida nos
+pontos em que alguma carga começa, termina ou atua; em cada trecho, V, M, EI·θ
+e EI·δ são polinômios de grau 2 a 5 na coordenada local t = x − xₖ.
+
+A montagem ordena os pontos de quebra (O(N log N)) e propaga o estado de um
+trecho ao seguinte por somas acumuladas. Os extremos são analíticos: os
+candidatos são os pontos de quebra e as raízes da derivada em cada trecho,
+sem malha de amostragem. Convenções e unidades (kN, cm, momento sagente
+positivo) são as de ``calculos_nbr8800_2024``.
+
+Vigas contínuas (``analyze_continuous_beam``) são resolvidas pela equação dos
+três momentos, um sistema tridiagonal em O(n vãos); cada vão é depois
+analisado pelo mesmo motor, com os momentos de apoio impostos. Cargas móveis
+(``moving_load_envelope``) usam as linhas de influência da vinculação.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, replace
+from typing import Iterable
+
+import numpy as np
+
+from calculos_lote_nbr8800_2024 import _real_cubic_roots_batch
+from calculos_nbr8800_2024 import (
+    SUPPORT_ALIASES,
+    BeamDiagrams,
+    _beam_end_actions,
+    _validate_beam_inputs,
+    _validate_samples,
+    deflection_limit,
+    flexural_strength_i,
+    overall_status,
+    shear_strength_i,
+    validate_material,
+    verification_status,
+)
+
+
+@dataclass(frozen=True)
+class PointLoad:
+    """Carga concentrada gravitacional ``value`` (kN) na posição ``position`` (cm)."""
+
+    position: float
+    value: float
+
+
+@dataclass(frozen=True)
+class DistributedLoad:
+    """Carga distribuída (kN/cm) de ``start`` a ``end``; trapezoidal se ``q_end`` for dado."""
+
+    start: float
+    end: float
+    q_start: float
+    q_end: float | None = None
+
+    @property
+    def slope(self) -> float:
+        q_end = self.q_start if self.q_end is None else self.q_end
+        return (q_end - self.q_start) / (self.end - self.start)
+
+
+def _as_point_load(load) -> PointLoad:
+    return load if isinstance(load, PointLoad) else PointLoad(*load)
+
+
+def _as_distributed_load(load) -> DistributedLoad:
+    return load if isinstance(load, DistributedLoad) else DistributedLoad(*load)
+
+
+def _validate_loads(
+    length: float, point_loads: list[PointLoad], distributed_loads: list[DistributedLoad]
+) -> None:
+    if length <= 0:
+        raise ValueError("O comprimento da viga deve ser positivo.")
+    for load in point_loads:
+        if load.value < 0:
+            raise ValueError("Este modelo admite cargas gravitacionais não negativas.")
+        if not 0 <= load.position <= length:
+            raise ValueError("A posição da carga pontual deve estar dentro do vão.")
+    for load in distributed_loads:
+        q_end = load.q_start if load.q_end is None else load.q_end
+        if load.q_start < 0 or q_end < 0:
+            raise ValueError("Este modelo admite cargas gravitacionais não negativas.")
+        if not 0 <= load.start < load.end <= length:
+            raise ValueError("A carga distribuída deve estar contida no vão e ter comprimento positivo.")
+
+
+def _horner(coefficients: np.ndarray, t: np.ndarray) -> np.ndarray:
+    """Avalia polinômios de coeficientes crescentes (linha a linha) em ``t``."""
+    result = np.zeros(np.shape(t))
+    for index in range(coefficients.shape[-1] - 1, -1, -1):
+        result = result * t + coefficients[..., index]
+    return result
+
+
+def _segment_roots(coefficients: np.ndarray, widths: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Raízes reais de cada polinômio de trecho dentro de [0, largura do trecho].
+
+    Os polinômios são reescalados para s = t/h ∈ [0, 1] e resolvidos pelos
+    autovalores da matriz companheira, agrupando os trechos de mesmo grau
+    efetivo; dois passos de Newton refinam as raízes.
+    """
+    order = coefficients.shape[1]
+    scaled = coefficients * widths[:, None] ** np.arange(order)
+    magnitude = np.abs(scaled)
+    significant = magnitude > 1e-13 * magnitude.max(axis=1, keepdims=True)
+    degree = np.where(
+        significant.any(axis=1), order - 1 - np.argmax(significant[:, ::-1], axis=1), 0
+    )
+    segments, positions = [np.empty(0, dtype=int)], [np.empty(0)]
+    for current in range(1, order):
+        rows = np.flatnonzero(degree == current)
+        if not rows.size:
+            continue
+        monic = scaled[rows, : current + 1] / scaled[rows, current : current + 1]
+        companion = np.zeros((rows.size, current, current))
+        companion[:, np.arange(1, current), np.arange(current - 1)] = 1.0
+        companion[:, :, -1] = -monic[:, :current]
+        eigenvalues = np.linalg.eigvals(companion)
+        real = np.abs(eigenvalues.imag) <= 1e-6 * (1.0 + np.abs(eigenvalues.real))
+        s = eigenvalues.real
+        derivative = monic[:, 1:] * np.arange(1, current + 1)
+        for _ in range(2):
+            slope = _horner(derivative[:, None, :], s)
+            with np.errstate(divide="ignore", invalid="ignore"):
+                step = _horner(monic[:, None, :], s) / slope
+            s = np.where(np.isfinite(step), s - step, s)
+        keep = real & (s >= -1e-12) & (s <= 1.0 + 1e-12)
+        row, column = np.nonzero(keep)
+        segments.append(rows[row])
+        positions.append(np.clip(s[row, column], 0.0, 1.0) * widths[rows[row]])
+    return np.concatenate(segments), np.concatenate(positions)
+
+
+def _propagate(
+    widths: np.ndarray, node_loads: np.ndarray, w0: np.ndarray, w1: np.ndarray,
+    shear: float, moment: float, rotation: float,
+) -> tuple[np.ndarray, ...]:
+    """Estado (V, M, EI·θ, EI·δ) no início de cada trecho e no fim da viga.
+
+    ``shear`` é a reação à esquerda (antes das cargas aplicadas em x = 0). Os
+    vetores devolvidos têm um elemento a mais que ``widths``: o último é o
+    estado em x = L, já descontadas as cargas pontuais aplicadas nesse ponto.
+    """
+    h = widths
+    V = np.empty(len(h) + 1)
+    V[0] = shear - node_loads[0]
+    V[1:] = V[0] + np.cumsum(-w0 * h - w1 * h**2 / 2.0 - node_loads[1:])
+    M = np.empty(len(h) + 1)
+    M[0] = moment
+    M[1:] = moment + np.cumsum(V[:-1] * h - w0 * h**2 / 2.0 - w1 * h**3 / 6.0)
+    T = np.empty(len(h) + 1)
+    T[0] = rotation
+    T[1:] = rotation + np.cumsum(
+        M[:-1] * h + V[:-1] * h**2 / 2.0 - w0 * h**3 / 6.0 - w1 * h**4 / 24.0
+    )
+    D = np.empty(len(h) + 1)
+    D[0] = 0.0
+    D[1:] = np.cumsum(
+        T[:-1] * h + M[:-1] * h**2 / 2.0 + V[:-1] * h**3 / 6.0
+        - w0 * h**4 / 24.0 - w1 * h**5 / 120.0
+    )
+    return V, M, T, D
+
+
+@dataclass(frozen=True)
+class PiecewiseBeam:
+    """Resposta elástica por trechos polinomiais de uma viga de vão único.
+
+    ``breakpoints`` tem n + 1 abscissas; as matrizes de coeficientes têm n
+    linhas com potências crescentes de t = x − xₖ. ``rotation`` e
+    ``deflection`` guardam EI·θ e EI·δ; os métodos dividem por E·I quando
+    ambos foram informados.
+    """
+
+    support: str
+    length: float
+    breakpoints: np.ndarray
+    shear_coefficients: np.ndarray
+    moment_coefficients: np.ndarray
+    rotation_coefficients: np.ndarray
+    deflection_coefficients: np.ndarray
+    reaction_left: float
+    reaction_right: float
+    moment_left: float
+    moment_right: float
+    max_moment: float
+    max_moment_position: float
+    max_shear: float
+    max_deflection: float
+    max_deflection_position: float
+    E: float | None = None
+    I: float | None = None
+
+    @property
+    def widths(self) -> np.ndarray:
+        return np.diff(self.breakpoints)
+
+    @property
+    def _stiffness(self) -> float | None:
+        if self.E is None or self.I is None or self.E <= 0 or self.I <= 0:
+            return None
+        return self.E * self.I
+
+    def _locate(self, x) -> tuple[np.ndarray, np.ndarray]:
+        x = np.clip(np.asarray(x, dtype=float), 0.0, self.length)
+        index = np.clip(
+            np.searchsorted(self.breakpoints, x, side="right") - 1, 0, len(self.widths) - 1
+        )
+        return index, x - self.breakpoints[index]
+
+    def _evaluate(self, coefficients: np.ndarray, x) -> np.ndarray:
+        index, t = self._locate(x)
+        return _horner(coefficients[index], t)
+
+    def shear_at(self, x):
+        """V(x) imediatamente à direita de x (à esquerda em x = L)."""
+        return self._evaluate(self.shear_coefficients, x)
+
+    def moment_at(self, x):
+        return self._evaluate(self.moment_coefficients, x)
+
+    def rotation_at(self, x):
+        stiffness = self._stiffness
+        value = self._evaluate(self.rotation_coefficients, x)
+        return value / stiffness if stiffness else np.zeros_like(value)
+
+    def deflection_at(self, x):
+        stiffness = self._stiffness
+        value = self._evaluate(self.deflection_coefficients, x)
+        return value / stiffness if stiffness else np.zeros_like(value)
+
+    def roots(self, kind: str = "shear") -> np.ndarray:
+        """Abscissas ordenadas em que V, M, θ ou δ se anulam (``kind``)."""
+        coefficients = {
+            "shear": self.shear_coefficients,
+            "moment": self.moment_coefficients,
+            "rotation": self.rotation_coefficients,
+            "deflection": self.deflection_coefficients,
+        }.get(kind)
+        if coefficients is None:
+            raise ValueError(f"Grandeza desconhecida: {kind}")
+        segment, t = _segment_roots(coefficients, self.widths)
+        return np.unique(self.breakpoints[segment] + t)
+
+    def _extremum(
+        self, values: np.ndarray, derivative: np.ndarray,
+        x0: float, x1: float, points: Iterable[float] = (),
+    ) -> tuple[float, float]:
+        """Maior |f| em [x0, x1]: extremidades dos trechos, raízes de f' e ``points``.
+
+        Cada candidato é avaliado no polinômio do próprio trecho, de modo que
+        os dois lados de uma descontinuidade (cortante sob carga pontual) são
+        considerados.
+        """
+        starts, ends = self.breakpoints[:-1], self.breakpoints[1:]
+        inside = np.flatnonzero((ends >= x0) & (starts <= x1))
+        lower = np.maximum(x0, starts[inside]) - starts[inside]
+        upper = np.minimum(x1, ends[inside]) - starts[inside]
+        segment_roots, root_t = _segment_roots(derivative, self.widths)
+        root_x = self.breakpoints[segment_roots] + root_t
+        in_range = (root_x >= x0) & (root_x <= x1)
+        extra = np.asarray([x for x in points if x0 <= x <= x1], dtype=float)
+        extra_segment, extra_t = self._locate(extra)
+        segment = np.concatenate([inside, inside, segment_roots[in_range], extra_segment])
+        t = np.concatenate([lower, upper, root_t[in_range], extra_t])
+        magnitude = np.abs(_horner(values[segment], t))
+        best = int(np.argmax(magnitude))
+        return float(magnitude[best]), float(self.breakpoints[segment[best]] + t[best])
+
+    def moment_extremum(
+        self, x0: float, x1: float, points: Iterable[float] = ()
+    ) -> tuple[float, float]:
+        """Maior |M| em [x0, x1] e sua posição (mesma interface de ``BeamResponse``)."""
+        return self._extremum(self.moment_coefficients, self.shear_coefficients, x0, x1, points)
+
+    def diagrams(self, samples: int = 2001) -> BeamDiagrams:
+        """Amostra M, V e δ em ``samples`` pontos, acrescidos dos pontos de quebra."""
+        _validate_samples(samples)
+        xs = np.union1d(np.linspace(0.0, self.length, samples), self.breakpoints)
+        return BeamDiagrams(xs, self.moment_at(xs), self.shear_at(xs), self.deflection_at(xs))
+
+
+@dataclass(frozen=True)
+class _SpanLoads:
+    """Cargas de um vão já organizadas por trecho (ver ``_span_loads``)."""
+
+    length: float
+    breakpoints: np.ndarray
+    node_loads: np.ndarray
+    w0: np.ndarray
+    w1: np.ndarray
+
+    @property
+    def widths(self) -> np.ndarray:
+        return np.diff(self.breakpoints)
+
+    def end_state(self) -> np.ndarray:
+        """(V, M, EI·θ, EI·δ) em x = L produzidos só pelas cargas."""
+        state = _propagate(self.widths, self.node_loads, self.w0, self.w1, 0.0, 0.0, 0.0)
+        return np.array([value[-1] for value in state])
+
+
+# Influência de RA, M(0) e EI·θ(0) unitários sobre (V, M, EI·θ, EI·δ) em x = L.
+def _end_influence(L: float) -> dict[str, np.ndarray]:
+    return {
+        "ra": np.array([1.0, L, L**2 / 2.0, L**3 / 6.0]),
+        "m0": np.array([0.0, 1.0, L, L**2 / 2.0]),
+        "theta0": np.array([0.0, 0.0, 1.0, L]),
+    }
+
+
+# Incógnitas e condições em x = L (índices de V, M, EI·θ, EI·δ) por vinculação.
+_SUPPORT_CONDITIONS = {
+    "simply_supported": (("ra", "theta0"), (1, 3)),
+    "cantilever": (("ra", "m0"), (0, 1)),
+    "fixed_fixed": (("ra", "m0"), (2, 3)),
+    "propped_cantilever": (("ra", "m0"), (1, 3)),
+}
+
+
+def _span_loads(length: float, point_loads: Iterable, distributed_loads: Iterable) -> _SpanLoads:
+    """Valida as cargas e monta pontos de quebra, cargas nodais e w(t) por trecho."""
+    L = float(length)
+    point_loads = [_as_point_load(load) for load in point_loads]
+    distributed_loads = [_as_distributed_load(load) for load in distributed_loads]
+    _validate_loads(L, point_loads, distributed_loads)
+
+    positions = np.array(
+        [0.0, L]
+        + [load.position for load in point_loads]
+        + [x for load in distributed_loads for x in (load.start, load.end)],
+        dtype=float,
+    )
+    breakpoints, inverse = np.unique(positions, return_inverse=True)
+    node_loads = np.zeros(len(breakpoints))
+    if point_loads:
+        np.add.at(
+            node_loads, inverse[2 : 2 + len(point_loads)],
+            [load.value for load in point_loads],
+        )
+
+    # Intensidade ativa w(x) = A + B·x, acumulada pelos eventos de início e fim.
+    delta_a = np.zeros(len(breakpoints))
+    delta_b = np.zeros(len(breakpoints))
+    if distributed_loads:
+        events = inverse[2 + len(point_loads):].reshape(-1, 2)
+        slopes = np.array([load.slope for load in distributed_loads])
+        intercepts = np.array([load.q_start for load in distributed_loads]) - slopes * np.array(
+            [load.start for load in distributed_loads]
+        )
+        np.add.at(delta_a, events[:, 0], intercepts)
+        np.add.at(delta_a, events[:, 1], -intercepts)
+        np.add.at(delta_b, events[:, 0], slopes)
+        np.add.at(delta_b, events[:, 1], -slopes)
+    w1 = np.cumsum(delta_b)[:-1]
+    w0 = np.cumsum(delta_a)[:-1] + w1 * breakpoints[:-1]
+    return _SpanLoads(L, breakpoints, node_loads, w0, w1)
+
+
+def _solve_redundants(
+    loads: _SpanLoads, unknowns: tuple[str, str], conditions: tuple[int, int],
+    prescribed: dict[str, float] | None = None, targets: tuple[float, float] = (0.0, 0.0),
+) -> dict[str, float]:
+    """Resolve duas incógnitas de (RA, M(0), EI·θ(0)) pelas condições em x = L."""
+    prescribed = prescribed or {}
+    influence = _end_influence(loads.length)
+    end = loads.end_state()
+    for name, value in prescribed.items():
+        end = end + value * influence[name]
+    rows = list(conditions)
+    matrix = np.column_stack([influence[name][rows] for name in unknowns])
+    solution = np.linalg.solve(matrix, np.asarray(targets, dtype=float) - end[rows])
+    values = {"ra": 0.0, "m0": 0.0, "theta0": 0.0, **prescribed}
+    values.update((name, float(value)) for name, value in zip(unknowns, solution))
+    return values
+
+
+def _assemble(
+    support: str, loads: _SpanLoads, redundants: dict[str, float],
+    E: float | None, I: float | None,
+) -> PiecewiseBeam:
+    """Monta os polinômios por trecho e os extremos analíticos da resposta."""
+    L, widths = loads.length, loads.widths
+    w0, w1 = loads.w0, loads.w1
+    ra, m0 = redundants["ra"], redundants["m0"]
+    V, M, T, D = _propagate(widths, loads.node_loads, w0, w1, ra, m0, redundants["theta0"])
+    shear = np.column_stack([V[:-1], -w0, -w1 / 2.0])
+    moment = np.column_stack([M[:-1], V[:-1], -w0 / 2.0, -w1 / 6.0])
+    rotation = np.column_stack([T[:-1], M[:-1], V[:-1] / 2.0, -w0 / 6.0, -w1 / 24.0])
+    deflection = np.column_stack(
+        [D[:-1], T[:-1], M[:-1] / 2.0, V[:-1] / 6.0, -w0 / 24.0, -w1 / 120.0]
+    )
+    for coefficients in (shear, moment, rotation, deflection, loads.breakpoints):
+        coefficients.flags.writeable = False
+    rb = 0.0 if support == "cantilever" else float(-V[-1])
+
+    beam = PiecewiseBeam(
+        support=support, length=L, breakpoints=loads.breakpoints,
+        shear_coefficients=shear, moment_coefficients=moment,
+        rotation_coefficients=rotation, deflection_coefficients=deflection,
+        reaction_left=ra, reaction_right=rb, moment_left=m0, moment_right=float(M[-1]),
+        max_moment=0.0, max_moment_position=0.0, max_shear=0.0,
+        max_deflection=0.0, max_deflection_position=0.0, E=E, I=I,
+    )
+    max_moment, max_moment_x = beam.moment_extremum(0.0, L)
+    # A cortante é monótona em cada trecho (w ≥ 0); as reações cobrem as faces
+    # externas das cargas aplicadas sobre os apoios.
+    max_shear = max(
+        float(np.abs(shear[:, 0]).max()),
+        float(np.abs(_horner(shear, widths)).max()),
+        abs(ra), abs(rb),
+    )
+    max_deflection, max_deflection_x = 0.0, 0.0
+    if beam._stiffness:
+        extremum, max_deflection_x = beam._extremum(deflection, rotation, 0.0, L)
+        max_deflection = extremum / beam._stiffness
+    return replace(
+        beam, max_moment=max_moment, max_moment_position=max_moment_x, max_shear=max_shear,
+        max_deflection=max_deflection, max_deflection_position=max_deflection_x,
+    )
+
+
+def analyze_beam_loads(
+    support: str,
+    length: float,
+    point_loads: Iterable = (),
+    distributed_loads: Iterable = (),
+    E: float | None = None,
+    I: float | None = None,
+) -> PiecewiseBeam:
+    """Análise elástica de primeira ordem para listas de cargas.
+
+    ``point_loads`` aceita ``PointLoad`` ou pares (posição, valor);
+    ``distributed_loads`` aceita ``DistributedLoad`` ou tuplas (início, fim,
+    q_início[, q_fim]). As incógnitas hiperestáticas (RA, M(0) e θ(0)) são
+    obtidas pelas condições de contorno em x = L, por superposição linear.
+    """
+    normalized = SUPPORT_ALIASES.get(support)
+    if normalized is None:
+        raise ValueError(f"Vinculação não suportada: {support}")
+    loads = _span_loads(length, point_loads, distributed_loads)
+    unknowns, conditions = _SUPPORT_CONDITIONS[normalized]
+    return _assemble(normalized, loads, _solve_redundants(loads, unknowns, conditions), E, I)
+
+
+def analyze_span_with_end_moments(
+    length: float,
+    point_loads: Iterable = (),
+    distributed_loads: Iterable = (),
+    moment_left: float = 0.0,
+    moment_right: float = 0.0,
+    E: float | None = None,
+    I: float | None = None,
+) -> PiecewiseBeam:
+    """Vão apoiado nas duas extremidades com momentos de extremidade impostos.
+
+    É o vão isolado de uma viga contínua: os momentos de apoio (negativos
+    quando tracionam a face superior) entram como M(0) e M(L).
+    """
+    loads = _span_loads(length, point_loads, distributed_loads)
+    redundants = _end_moment_redundants(loads, moment_left, moment_right)
+    return _assemble("continuous_span", loads, redundants, E, I)
+
+
+def _end_moment_redundants(loads: _SpanLoads, moment_left: float, moment_right: float) -> dict[str, float]:
+    return _solve_redundants(
+        loads, ("ra", "theta0"), (1, 3), {"m0": float(moment_left)}, (float(moment_right), 0.0)
+    )
+
+
+END_CONDITIONS = {
+    "Apoiada": "pinned",
+    "Engastada": "fixed",
+    "pinned": "pinned",
+    "fixed": "fixed",
+}
+
+
+@dataclass(frozen=True)
+class Span:
+    """Vão de viga contínua: comprimento, inércia e cargas em coordenadas locais."""
+
+    length: float
+    I: float
+    point_loads: tuple = ()
+    distributed_loads: tuple = ()
+
+
+@dataclass(frozen=True)
+class ContinuousBeam:
+    """Resposta de uma viga contínua, vão a vão.
+
+    Cada item de ``spans`` é um ``PiecewiseBeam`` do vão isolado com os
+    momentos de apoio impostos, e pode ser passado diretamente a
+    ``calculate_cb`` e às verificações de resistência e de ELS.
+    """
+
+    spans: tuple[PiecewiseBeam, ...]
+    support_positions: np.ndarray
+    support_moments: np.ndarray
+    reactions: np.ndarray
+    left_end: str
+    right_end: str
+
+    @property
+    def length(self) -> float:
+        return float(self.support_positions[-1])
+
+    @property
+    def max_moment(self) -> float:
+        return max(span.max_moment for span in self.spans)
+
+    @property
+    def max_shear(self) -> float:
+        return max(span.max_shear for span in self.spans)
+
+    @property
+    def max_deflection(self) -> float:
+        return max(span.max_deflection for span in self.spans)
+
+    def span_index(self, x) -> np.ndarray:
+        x = np.clip(np.asarray(x, dtype=float), 0.0, self.length)
+        return np.clip(
+            np.searchsorted(self.support_positions, x, side="right") - 1, 0, len(self.spans) - 1
+        )
+
+    def moment_at(self, x) -> np.ndarray:
+        """Momento em ``x``; cada vão é avaliado só nos pontos que caem nele."""
+        x = np.asarray(x, dtype=float)
+        flat = x.ravel()
+        index = self.span_index(flat)
+        order = np.argsort(index, kind="stable")
+        bounds = np.searchsorted(index[order], np.arange(len(self.spans) + 1))
+        moments = np.empty_like(flat)
+        for position, span in enumerate(self.spans):
+            points = order[bounds[position]:bounds[position + 1]]
+            if len(points):
+                local = flat[points] - self.support_positions[position]
+                moments[points] = span.moment_at(local)
+        return moments.reshape(x.shape)
+
+    def deflection_limits(self, divisor: float, absolute_limit: float | None = None) -> list[float]:
+        """Limite de flecha de cada vão, com o próprio vão como referência."""
+        return [
+            deflection_limit("simply_supported", span.length, divisor, absolute_limit)
+            for span in self.spans
+        ]
+
+
+def _solve_tridiagonal(
+    lower: np.ndarray, diagonal: np.ndarray, upper: np.ndarray, rhs: np.ndarray
+) -> np.ndarray:
+    """Algoritmo de Thomas: sistema tridiagonal em O(n)."""
+    n = len(diagonal)
+    c = np.zeros(n)
+    d = np.zeros(n)
+    c[0] = upper[0] / diagonal[0] if n > 1 else 0.0
+    d[0] = rhs[0] / diagonal[0]
+    for index in range(1, n):
+        pivot = diagonal[index] - lower[index] * c[index - 1]
+        if index < n - 1:
+            c[index] = upper[index] / pivot
+        d[index] = (rhs[index] - lower[index] * d[index - 1]) / pivot
+    solution = np.zeros(n)
+    solution[-1] = d[-1]
+    for index in range(n - 2, -1, -1):
+        solution[index] = d[index] - c[index] * solution[index + 1]
+    return solution
+
+
+def analyze_continuous_beam(
+    spans: Iterable[Span],
+    E: float,
+    left_end: str = "pinned",
+    right_end: str = "pinned",
+) -> ContinuousBeam:
+    """Viga contínua de n vãos pela equação dos três momentos.
+
+    As incógnitas são os momentos nos n + 1 apoios; cada equação impõe a
+    continuidade da rotação sobre um apoio interno (ou rotação nula em uma
+    extremidade engastada) e envolve só os apoios vizinhos. O sistema
+    tridiagonal é resolvido em O(n) e cada vão é então analisado isolado,
+    com seus momentos de apoio, por ``analyze_span_with_end_moments``.
+    """
+    spans = list(spans)
+    left, right = END_CONDITIONS.get(left_end), END_CONDITIONS.get(right_end)
+    if left is None or right is None:
+        raise ValueError(f"Condição de extremidade não suportada: {left_end} / {right_end}")
+    if not spans:
+        raise ValueError("Informe ao menos um vão.")
+    if E <= 0 or any(span.I <= 0 for span in spans):
+        raise ValueError("E e I de todos os vãos devem ser positivos.")
+
+    # Rotações (EI·θ) das extremidades de cada vão bi-apoiado sob as suas cargas.
+    lengths = np.array([float(span.length) for span in spans])
+    flexibility = lengths / (6.0 * E * np.array([float(span.I) for span in spans]))
+    theta_left = np.empty(len(spans))
+    theta_right = np.empty(len(spans))
+    span_loads = [_span_loads(span.length, span.point_loads, span.distributed_loads) for span in spans]
+    for index, (span, loads) in enumerate(zip(spans, span_loads)):
+        redundants = _solve_redundants(loads, ("ra", "theta0"), (1, 3))
+        end = loads.end_state() + sum(
+            redundants[name] * influence
+            for name, influence in _end_influence(loads.length).items()
+        )
+        EI = E * span.I
+        theta_left[index] = redundants["theta0"] / EI
+        theta_right[index] = end[2] / EI
+
+    count = len(spans) + 1
+    lower, diagonal, upper, rhs = (np.zeros(count) for _ in range(4))
+    lower[1:-1] = flexibility[:-1]
+    diagonal[1:-1] = 2.0 * (flexibility[:-1] + flexibility[1:])
+    upper[1:-1] = flexibility[1:]
+    rhs[1:-1] = theta_left[1:] - theta_right[:-1]
+    if left == "fixed":
+        diagonal[0], upper[0], rhs[0] = 2.0 * flexibility[0], flexibility[0], theta_left[0]
+    else:
+        diagonal[0] = 1.0
+    if right == "fixed":
+        lower[-1], diagonal[-1], rhs[-1] = flexibility[-1], 2.0 * flexibility[-1], -theta_right[-1]
+    else:
+        diagonal[-1] = 1.0
+    moments = _solve_tridiagonal(lower, diagonal, upper, rhs)
+
+    responses = tuple(
+        _assemble(
+            "continuous_span", loads,
+            _end_moment_redundants(loads, moments[index], moments[index + 1]), E, span.I,
+        )
+        for index, (span, loads) in enumerate(zip(spans, span_loads))
+    )
+    reactions = np.zeros(count)
+    reactions[:-1] += [response.reaction_left for response in responses]
+    reactions[1:] += [response.reaction_right for response in responses]
+    for values in (moments, reactions):
+        values.flags.writeable = False
+    positions = np.concatenate([[0.0], np.cumsum(lengths)])
+    positions.flags.writeable = False
+    return ContinuousBeam(responses, positions, moments, reactions, left, right)
+
+
+@dataclass(frozen=True)
+class MovingLoadEnvelope:
+    """Envoltórias de uma carga pontual móvel (mais carga uniforme fixa ``q``).
+
+    Os valores de cada seção de ``sections`` são os extremos exatos sobre
+    todas as posições da carga; ``*_load_position`` indica onde a carga
+    produz cada extremo. Deslocamentos só são calculados com E e I.
+    """
+
+    support: str
+    length: float
+    point_load: float
+    q: float
+    sections: np.ndarray
+    moment_max: np.ndarray
+    moment_max_load_position: np.ndarray
+    moment_min: np.ndarray
+    moment_min_load_position: np.ndarray
+    shear_max: np.ndarray
+    shear_min: np.ndarray
+    deflection_max: np.ndarray
+    reaction_left_max: float
+    reaction_right_max: float
+
+    @property
+    def max_moment(self) -> float:
+        return float(max(np.abs(self.moment_max).max(), np.abs(self.moment_min).max()))
+
+    @property
+    def max_shear(self) -> float:
+        return float(max(
+            np.abs(self.shear_max).max(), np.abs(self.shear_min).max(),
+            self.reaction_left_max, self.reaction_right_max,
+        ))
+
+    @property
+    def max_deflection(self) -> float:
+        return float(self.deflection_max.max())
+
+
+def _influence_polynomials(support: str, L: float) -> dict[str, np.ndarray]:
+    """RA, RB, M(0) e EI·θ(0) de P = 1 como polinômios de s = a/L.
+
+    Nos quatro modelos essas grandezas são no máximo cúbicas na posição da
+    carga; os coeficientes saem de ``_beam_end_actions`` em quatro posições.
+    """
+    nodes = np.linspace(0.0, 1.0, 4)
+    values = np.array([_beam_end_actions(support, L, 0.0, 1.0, s * L) for s in nodes])
+    ra, rb, m0 = values[:, 0], values[:, 1], values[:, 2]
+    c1 = np.zeros(4)
+    if support == "simply_supported":
+        c1 = -(m0 * L**2 / 2.0 + ra * L**3 / 6.0 - (L - nodes * L) ** 3 / 6.0) / L
+    vandermonde = np.vander(nodes, 4, increasing=True)
+    return {
+        name: np.linalg.solve(vandermonde, column)
+        for name, column in (("ra", ra), ("rb", rb), ("m0", m0), ("c1", c1))
+    }
+
+
+def _poly_extremes(
+    coefficients: np.ndarray, lower: np.ndarray, upper: np.ndarray
+) -> tuple[np.ndarray, ...]:
+    """Máximo e mínimo de cúbicas em s (linha a linha) no intervalo [lower, upper]."""
+    c0, c1, c2, c3 = (coefficients[:, index] for index in range(4))
+    roots = _real_cubic_roots_batch(np.zeros_like(c0), 3.0 * c3, 2.0 * c2, c1)
+    roots = np.where((roots >= lower[:, None]) & (roots <= upper[:, None]), roots, np.nan)
+    s = np.column_stack([lower, upper, roots])
+    values = _horner(coefficients[:, None, :], np.nan_to_num(s))
+    high = np.where(np.isnan(s), -np.inf, values)
+    low = np.where(np.isnan(s), np.inf, values)
+    rows = np.arange(len(c0))
+    top, bottom = np.argmax(high, axis=1), np.argmin(low, axis=1)
+    return high[rows, top], s[rows, top], low[rows, bottom], s[rows, bottom]
+
+
+def _piece_extremes(left: np.ndarray, right: np.ndarray, split: np.ndarray) -> tuple[np.ndarray, ...]:
+    """Extremos de uma função de s definida por duas cúbicas, antes e depois de ``split``."""
+    zeros, ones = np.zeros_like(split), np.ones_like(split)
+    left_max, left_at_max, left_min, left_at_min = _poly_extremes(left, zeros, split)
+    right_max, right_at_max, right_min, right_at_min = _poly_extremes(right, split, ones)
+    use_left_max = left_max >= right_max
+    use_left_min = left_min <= right_min
+    return (
+        np.where(use_left_max, left_max, right_max),
+        np.where(use_left_max, left_at_max, right_at_max),
+        np.where(use_left_min, left_min, right_min),
+        np.where(use_left_min, left_at_min, right_at_min),
+    )
+
+
+def moving_load_envelope(
+    support: str,
+    length: float,
+    point_load: float,
+    q: float = 0.0,
+    sections: int | Iterable[float] = 201,
+    E: float | None = None,
+    I: float | None = None,
+) -> MovingLoadEnvelope:
+    """Envoltórias de M, V, reações e flecha para uma carga pontual móvel.
+
+    As linhas de influência vêm da vinculação de ``_beam_end_actions``: para
+    cada seção x, M, V e EI·δ são cúbicas por partes na posição s = a/L da
+    carga (a quebra ocorre em a = x; para a flecha usa-se a reciprocidade de
+    Maxwell). Os extremos sobre todas as posições resultam das extremidades e
+    das raízes da derivada, numa única passagem vetorizada sobre as seções.
+    O momento máximo absoluto também considera, analiticamente, a carga sobre
+    a própria seção (diagonal a = x).
+    """
+    normalized = SUPPORT_ALIASES.get(support)
+    if normalized is None:
+        raise ValueError(f"Vinculação não suportada: {support}")
+    L, P = float(length), float(point_load)
+    _validate_beam_inputs(L, q, P, 0.0)
+    poly = _influence_polynomials(normalized, L)
+    ra, m0 = poly["ra"], poly["m0"]
+
+    if isinstance(sections, int):
+        if sections < 2:
+            raise ValueError("Use ao menos duas seções na envoltória.")
+        xs = np.linspace(0.0, L, sections)
+    else:
+        xs = np.asarray(list(sections), dtype=float)
+        if xs.size == 0 or np.any((xs < 0.0) | (xs > L)):
+            raise ValueError("As seções da envoltória devem estar dentro do vão.")
+    # Estacionários de M(a, a) (carga móvel sobre a própria seção), uma
+    # quártica em s: P·(M(0) + sL·RA) mais o momento da carga uniforme.
+    ra_q, rb_q, m0_q, _ = _beam_end_actions(normalized, L, q, 0.0, 0.0)
+    diagonal = np.zeros(5)
+    diagonal[:4] += P * m0
+    diagonal[1:] += P * L * ra
+    diagonal[:3] += (m0_q, ra_q * L, -q * L**2 / 2.0)
+    derivative = np.arange(1, 5) * diagonal[1:]
+    stationary = _real_cubic_roots_batch(derivative[3], derivative[2], derivative[1], derivative[0])
+    stationary = stationary[np.isfinite(stationary) & (stationary >= 0.0) & (stationary <= 1.0)]
+    xs = np.unique(np.concatenate([xs, [0.0, L], stationary * L]))
+    stiff = E is not None and I is not None and E > 0 and I > 0
+    if stiff:
+        xs = np.union1d(xs, _refine_deflection_peak(normalized, L, q, P, poly, xs))
+    split = xs / L
+    x = xs[:, None]
+
+    # Polinômios em s para cada seção (colunas: potências 0..3 de s); o trecho
+    # "left" corresponde à carga já antes da seção (a < x).
+    right_moment = m0[None, :] + x * ra[None, :]
+    passed = np.column_stack([xs, -np.full_like(xs, L), np.zeros_like(xs), np.zeros_like(xs)])
+    left_moment = right_moment - passed
+    m_max, m_max_s, m_min, m_min_s = _piece_extremes(left_moment, right_moment, split)
+
+    right_shear = np.broadcast_to(ra, (len(xs), 4)).copy()
+    left_shear = right_shear.copy()
+    left_shear[:, 0] -= 1.0
+    v_max, _, v_min, _ = _piece_extremes(left_shear, right_shear, split)
+
+    moment_q = m0_q + ra_q * xs - q * xs**2 / 2.0
+    shear_q = ra_q - q * xs
+    moment_max, moment_min = moment_q + P * m_max, moment_q + P * m_min
+    shear_max, shear_min = shear_q + P * v_max, shear_q + P * v_min
+
+    deflection = np.zeros_like(xs)
+    if stiff:
+        deflection = _deflection_envelope(normalized, L, q, P, poly, xs) / (E * I)
+
+    reaction_right = poly["rb"][None, :]
+    _, _, ra_min, _ = _poly_extremes(-ra[None, :], np.zeros(1), np.ones(1))
+    _, _, rb_min, _ = _poly_extremes(-reaction_right, np.zeros(1), np.ones(1))
+    for values in (xs, moment_max, moment_min, shear_max, shear_min, deflection):
+        values.flags.writeable = False
+    return MovingLoadEnvelope(
+        support=normalized, length=L, point_load=P, q=q, sections=xs,
+        moment_max=moment_max, moment_max_load_position=m_max_s * L,
+        moment_min=moment_min, moment_min_load_position=m_min_s * L,
+        shear_max=shear_max, shear_min=shear_min, deflection_max=deflection,
+        reaction_left_max=float(ra_q - P * ra_min[0]),
+        reaction_right_max=float(rb_q - P * rb_min[0]),
+    )
+
+
+def _deflection_envelope(
+    support: str, L: float, q: float, P: float, poly: dict, xs: np.ndarray
+) -> np.ndarray:
+    """EI·|δ| máximo em cada seção sobre todas as posições da carga (Maxwell)."""
+    x = xs[:, None]
+    right = x * poly["c1"][None, :] + x**2 / 2.0 * poly["m0"][None, :] + x**3 / 6.0 * poly["ra"][None, :]
+    left = right - _shifted_cube(xs, L) / 6.0
+    d_max, _, d_min, _ = _piece_extremes(left, right, xs / L)
+    static = _influence_static_deflection(support, L, q, xs)
+    return np.maximum(np.abs(static + P * d_max), np.abs(static + P * d_min))
+
+
+def _refine_deflection_peak(
+    support: str, L: float, q: float, P: float, poly: dict, xs: np.ndarray, steps: int = 3
+) -> np.ndarray:
+    """Seção da flecha máxima, refinada por interpolação parabólica na envoltória."""
+    values = _deflection_envelope(support, L, q, P, poly, xs)
+    k = int(np.argmax(values))
+    if k == 0 or k == len(xs) - 1:
+        return xs[k : k + 1]
+    points = np.array(xs[k - 1 : k + 2])
+    heights = np.array(values[k - 1 : k + 2])
+    for _ in range(steps):
+        (x0, x1, x2), (y0, y1, y2) = points, heights
+        denominator = (x0 - x1) * (x0 - x2) * (x1 - x2)
+        if denominator == 0.0:
+            break
+        a = (x2 * (y1 - y0) + x1 * (y0 - y2) + x0 * (y2 - y1)) / denominator
+        b = (x2**2 * (y0 - y1) + x1**2 * (y2 - y0) + x0**2 * (y1 - y2)) / denominator
+        if a >= 0.0:
+            break
+        vertex = min(max(-b / (2.0 * a), points[0]), points[-1])
+        candidates = np.sort(np.append(points, vertex))
+        heights = _deflection_envelope(support, L, q, P, poly, candidates)
+        k = int(np.clip(np.argmax(heights), 1, len(candidates) - 2))
+        points, heights = candidates[k - 1 : k + 2], heights[k - 1 : k + 2]
+        if np.ptp(points) <= 1e-9 * L:
+            break
+    return points[1:2]
+
+
+def _shifted_cube(xs: np.ndarray, L: float) -> np.ndarray:
+    """Coeficientes de (x − sL)³ em potências de s, uma linha por seção."""
+    return np.column_stack([xs**3, -3.0 * xs**2 * L, 3.0 * xs * L**2, np.full_like(xs, -(L**3))])
+
+
+def _influence_static_deflection(support: str, L: float, q: float, xs: np.ndarray) -> np.ndarray:
+    """EI·δ(x) da carga uniforme fixa, pelas mesmas funções de singularidade."""
+    ra, _, m0, _ = _beam_end_actions(support, L, q, 0.0, 0.0)
+    c1 = 0.0
+    if support == "simply_supported":
+        c1 = -(m0 * L**2 / 2.0 + ra * L**3 / 6.0 - q * L**4 / 24.0) / L
+    return c1 * xs + m0 * xs**2 / 2.0 + ra * xs**3 / 6.0 - q * xs**4 / 24.0
+
+
+def moving_load_checks(
+    elu: MovingLoadEnvelope,
+    els: MovingLoadEnvelope,
+    props: dict,
+    fy: float,
+    fu: float,
+    E: float,
+    Lb: float,
+    Cb: float,
+    fabrication: str,
+    deflection_divisor: float,
+    absolute_deflection_limit: float | None = None,
+    flt_applicable: bool = True,
+    tension_flange_net_ratio: float | None = None,
+) -> dict:
+    """Verificações de flexão, cisalhamento e flecha com as envoltórias móveis.
+
+    ``elu`` fornece Msd e Vsd (extremos sobre todas as posições da carga) e
+    ``els`` a flecha máxima; as resistências são as funções do núcleo. Como
+    em ``perform_all_checks``, fy/fu fora de ``validate_material`` e
+    condições fora do escopo da flexão (``scope_issues``) tornam o status
+    ``NÃO VERIFICADO``; com ``tension_flange_net_ratio`` (Afn/Afg da mesa
+    tracionada com furos), a ruptura da mesa também é verificada.
+    """
+    gross_area = props["bf"] * props["tf"] if tension_flange_net_ratio is not None else None
+    flexure = flexural_strength_i(
+        props, fy, fu, E, Lb, Cb, fabrication, flt_applicable=flt_applicable,
+        net_tension_flange_area=gross_area * tension_flange_net_ratio if gross_area is not None else None,
+        gross_tension_flange_area=gross_area,
+    )
+    shear = shear_strength_i(props, fy, E)
+    limit = deflection_limit(els.support, els.length, deflection_divisor, absolute_deflection_limit)
+    scope_issues = validate_material(fy, fu) + list(flexure["applicability_issues"])
+    verifications = {
+        "FLT": (elu.max_moment, flexure["Mrd_FLT"], flt_applicable),
+        "FLM": (elu.max_moment, flexure["Mrd_FLM"]),
+        "FLA": (elu.max_moment, flexure["Mrd_FLA_or_tension"]),
+        "Ruptura da mesa": (elu.max_moment, flexure["Mrd_rupture"], flexure["Mrd_rupture"] is not None),
+        "Cisalhamento": (elu.max_shear, shear["Vrd"]),
+        "Flecha": (els.max_deflection, limit),
+    }
+    checks = {}
+    for name, (demand, resistance, *applicable) in verifications.items():
+        efficiency, status = verification_status(demand, resistance, *applicable)
+        checks[name] = {"demand": demand, "resistance": resistance, "efficiency": efficiency, "status": status}
+    statuses = [check["status"] for check in checks.values()]
+    if scope_issues:
+        statuses.append("NÃO VERIFICADO")
+    return {
+        "checks": checks,
+        "status": overall_status(statuses),
+        "scope_issues": scope_issues,
+        "flexure": flexure,
+        "shear": shear,
+    }
@@ -0,0 +1,797 @@
+"""Versões vetorizadas do núcleo NBR 8800:2024 para análise em lote.
+
+Cada função recebe colunas NumPy com as propriedades de uma família inteira
+de perfis e reproduz, elemento a elemento, o resultado da função escalar
+homônima de ``calculos_nbr8800_2024``. As decisões normativas (regimes,
+Anexo E, validade dos enrijecedores) são expressas por máscaras booleanas em
+vez de cadeias de ``if``; ambos os ramos são avaliados e o ``np.where``
+seleciona o aplicável a cada perfil.
+
+Unidades internas: kN e cm, como no núcleo escalar. Valores que o núcleo
+escalar devolve como ``None`` são representados por ``NaN`` nas colunas.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from functools import lru_cache
+import math
+from typing import Mapping
+
+import numpy as np
+
+from calculos_nbr8800_2024 import (
+    ERRATA,
+    GAMMA_A1,
+    GAMMA_A2,
+    NORMA,
+    SUPPORT_ALIASES,
+    BeamResponse,
+    analyze_beam,
+)
+
+
+FLEXURE_PROPERTIES = ("d", "bf", "tw", "tf", "h_clear", "Wx", "Zx", "Iy", "J", "Cw", "ry")
+FLT_NOT_APPLICABLE = "não aplicável — mesa comprimida contida"
+ANNEX_E_TENSION_REGIME = "Anexo E — escoamento da mesa tracionada"
+SHEAR_PROPERTIES = ("d", "h_clear", "tw")
+LOCAL_PROPERTIES = ("d", "bf", "tw", "tf", "h_clear")
+LOCAL_LIMIT_STATES = ("escoamento local da alma", "enrugamento da alma", "flambagem lateral da alma")
+
+
+def _column(values) -> np.ndarray:
+    return np.asarray(values, dtype=float)
+
+
+def _property_columns(props: Mapping, names: tuple[str, ...]) -> tuple[np.ndarray, ...]:
+    columns = np.broadcast_arrays(*(_column(props[name]) for name in names))
+    invalid = [
+        name for name, column in zip(names, columns)
+        if not np.all(np.isfinite(column) & (column > 0))
+    ]
+    if invalid:
+        raise ValueError(f"Propriedades inválidas: {', '.join(invalid)}")
+    return tuple(columns)
+
+
+def _fabrication_mask(fabrication, shape: tuple[int, ...], prefix: str) -> np.ndarray:
+    """Aceita um rótulo único, uma coluna de rótulos ou uma máscara booleana de soldados.
+
+    Na máscara, os perfis não soldados são laminados.
+    """
+    if isinstance(fabrication, str):
+        return np.full(shape, fabrication.lower().startswith(prefix))
+    labels = np.asarray(fabrication)
+    if labels.dtype == bool:
+        return np.broadcast_to(labels if prefix == "sold" else ~labels, shape)
+    return np.broadcast_to(np.char.startswith(np.char.lower(labels.astype(str)), prefix), shape)
+
+
+def _is_welded(fabrication, shape: tuple[int, ...]) -> np.ndarray:
+    return _fabrication_mask(fabrication, shape, "sold")
+
+
+def _piecewise_strength_batch(
+    slenderness: np.ndarray,
+    lambda_p,
+    lambda_r,
+    plastic_or_yield: np.ndarray,
+    residual: np.ndarray,
+    critical: np.ndarray,
+    gamma_a1: float,
+) -> tuple[np.ndarray, np.ndarray]:
+    plastic = slenderness <= lambda_p
+    inelastic = ~plastic & (slenderness <= lambda_r)
+    fraction = (slenderness - lambda_p) / (lambda_r - lambda_p)
+    value = np.where(
+        plastic,
+        plastic_or_yield / gamma_a1,
+        np.where(
+            inelastic,
+            (plastic_or_yield - (plastic_or_yield - residual) * fraction) / gamma_a1,
+            critical / gamma_a1,
+        ),
+    )
+    regime = np.where(plastic, "plástico", np.where(inelastic, "inelástico", "elástico"))
+    return value, regime
+
+
+def flexural_strength_i_batch(
+    props: Mapping,
+    fy: float,
+    fu: float,
+    E: float,
+    Lb,
+    Cb,
+    fabrication,
+    stiffener_spacing: float | None = None,
+    flt_applicable: bool = True,
+    net_tension_flange_area=None,
+    gross_tension_flange_area=None,
+    gamma_a1: float = GAMMA_A1,
+    gamma_a2: float = GAMMA_A2,
+) -> dict:
+    """Contraparte colunar de ``flexural_strength_i`` para uma família de perfis.
+
+    ``Lb``, ``Cb`` e as áreas da mesa tracionada podem ser escalares ou colunas
+    alinhadas às propriedades. As pendências de aplicabilidade são devolvidas
+    como máscaras ``issue_*``; ``applicable`` é verdadeiro quando nenhuma delas
+    ocorre e, caso contrário, ``Mrd`` é zero, como no núcleo escalar.
+    """
+    d, bf, tw, tf, h, W, Z, Iy, J, Cw, ry = _property_columns(props, FLEXURE_PROPERTIES)
+    Lb, Cb = (_column(value) for value in (Lb, Cb))
+    if fy <= 0 or fu <= 0 or E <= 0 or np.any(Lb <= 0) or np.any(Cb <= 0):
+        raise ValueError("fy, fu, E, Lb e Cb devem ser positivos.")
+    d, Lb, Cb = np.broadcast_arrays(d, Lb, Cb)
+    shape = d.shape
+    welded = _is_welded(fabrication, shape)
+    sigma_r = 0.30 * fy
+    Mpl = Z * fy
+    cap = 1.50 * W * fy / gamma_a1
+    web_lambda = h / tw
+    web_lp = 3.76 * math.sqrt(E / fy)
+    web_lr = 5.70 * math.sqrt(E / fy)
+    slender = web_lambda > web_lr
+    flange_lambda = bf / (2.0 * tf)
+    flange_lp = 0.38 * math.sqrt(E / fy)
+    kc = np.maximum(0.35, np.minimum(4.0 / np.sqrt(h / tw), 0.76))
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        # Alma não esbelta: FLT pela alternativa de D.2.1 baseada em lambda_LT.
+        Mcr_ltb_d = (
+            Cb * math.pi**2 * E * Iy / Lb**2
+            * np.sqrt((Cw / Iy) * (1.0 + 0.039 * J * Lb**2 / Cw))
+        )
+        lambda_lt_d = np.where(Mcr_ltb_d > 0, np.sqrt(Mpl / Mcr_ltb_d), np.inf)
+        chi_plastic = lambda_lt_d <= 0.4
+        chi_inelastic = ~chi_plastic & (lambda_lt_d <= 1.4)
+        chi_lt = np.where(
+            chi_plastic, 1.0,
+            np.where(chi_inelastic, 1.0 - 0.49 * (lambda_lt_d - 0.4), 1.0 / lambda_lt_d**2),
+        )
+        regime_ltb_d = np.where(
+            chi_plastic, "plástico", np.where(chi_inelastic, "inelástico", "elástico")
+        )
+        mrd_ltb_d = np.minimum(chi_lt * Mpl / gamma_a1, cap)
+
+        flange_lr_d = np.where(
+            welded,
+            0.95 * np.sqrt(E * kc / (fy - sigma_r)),
+            0.83 * math.sqrt(E / (fy - sigma_r)),
+        )
+        Mcr_flange_d = np.where(
+            welded,
+            0.90 * E * kc * W / flange_lambda**2,
+            0.69 * E * W / flange_lambda**2,
+        )
+        Mr_flange = (fy - sigma_r) * W
+        mrd_flange_d, regime_flange_d = _piecewise_strength_batch(
+            flange_lambda, flange_lp, flange_lr_d, Mpl, Mr_flange, Mcr_flange_d, gamma_a1
+        )
+        mrd_flange_d = np.minimum(mrd_flange_d, cap)
+
+        Mr_web = fy * W
+        web_plastic = web_lambda <= web_lp
+        web_fraction = (web_lambda - web_lp) / (web_lr - web_lp)
+        mrd_web_d = np.minimum(
+            np.where(
+                web_plastic,
+                Mpl / gamma_a1,
+                (Mpl - (Mpl - Mr_web) * web_fraction) / gamma_a1,
+            ),
+            cap,
+        )
+        regime_web_d = np.where(web_plastic, "plástico", "inelástico")
+
+        # Anexo E: alma esbelta, aplicável a perfis soldados dentro de E.5.3.
+        a_h = (
+            math.inf if not stiffener_spacing or stiffener_spacing <= 0
+            else stiffener_spacing / h
+        )
+        annex_e_limit = np.minimum(
+            260.0, np.where(a_h <= 1.5, 11.7 * math.sqrt(E / fy), 0.42 * E / fy)
+        )
+        Ac = bf * tf
+        hc = d - 2.0 * tf
+        ar = hc * tw / Ac
+        kpg = np.minimum(
+            1.0 - ar / (1200.0 + 300.0 * ar) * (hc / tw - 5.70 * math.sqrt(E / fy)),
+            1.0,
+        )
+        M_y = kpg * fy * W
+        M_r = kpg * (fy - sigma_r) * W
+        web_segment = hc / 6.0
+        Iyc = tf * bf**3 / 12.0 + web_segment * tw**3 / 12.0
+        Ayc = Ac + web_segment * tw
+        ryc = np.sqrt(Iyc / Ayc)
+        ltb_lambda_e = Lb / ryc
+        ltb_lp = 1.10 * math.sqrt(E / fy)
+        ltb_lr = math.pi * math.sqrt(E / (fy - sigma_r))
+        Mcr_ltb_e = Cb * kpg * math.pi**2 * E * W / ltb_lambda_e**2
+        mrd_ltb_e, regime_ltb_e = _piecewise_strength_batch(
+            ltb_lambda_e, ltb_lp, ltb_lr, M_y, M_r, Mcr_ltb_e, gamma_a1
+        )
+        mrd_ltb_e = np.minimum(mrd_ltb_e, cap)
+        flange_lr_e = 0.95 * np.sqrt(E * kc / (fy - sigma_r))
+        Mcr_flange_e = 0.90 * kpg * E * kc * W / flange_lambda**2
+        mrd_flange_e, regime_flange_e = _piecewise_strength_batch(
+            flange_lambda, flange_lp, flange_lr_e, M_y, M_r, Mcr_flange_e, gamma_a1
+        )
+        mrd_flange_e = np.minimum(mrd_flange_e, cap)
+        mrd_tension = np.minimum(fy * W / gamma_a1, cap)
+
+    issue_rolled_slender_web = slender & ~welded
+    issue_annex_e_limit = slender & (web_lambda > annex_e_limit + 1e-9)
+    issue_ar = slender & (ar > 10.0 + 1e-9)
+    issue_kpg = slender & (kpg <= 0)
+
+    mrd_ltb = np.where(slender, mrd_ltb_e, mrd_ltb_d)
+    mrd_flange = np.where(slender, mrd_flange_e, mrd_flange_d)
+    mrd_web = np.where(slender, mrd_tension, mrd_web_d)
+    nan = np.full(shape, np.nan)
+
+    Yt = 1.0 if fy / fu <= 0.8 else 1.10
+    holes_checked = net_tension_flange_area is not None or gross_tension_flange_area is not None
+    Afg = Afn = nan
+    issue_holes = np.zeros(shape, dtype=bool)
+    rupture_condition_ok = np.ones(shape, dtype=bool)
+    rupture_limit = nan
+    if holes_checked:
+        Afg = nan.copy()
+        if gross_tension_flange_area is not None:
+            Afg = np.broadcast_to(_column(gross_tension_flange_area), shape)
+        # O núcleo escalar adota bf·tf quando a área bruta é omitida ou nula.
+        Afg = np.where(np.isnan(Afg) | (Afg == 0), Ac, Afg)
+        Afn = (
+            Afg if net_tension_flange_area is None
+            else np.broadcast_to(_column(net_tension_flange_area), shape)
+        )
+        issue_holes = (Afn <= 0) | (Afg <= 0) | (Afn > Afg + 1e-9)
+        rupture_condition_ok = issue_holes | (fu * Afn >= Yt * fy * Afg)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            rupture_limit = np.where(
+                rupture_condition_ok, np.nan, fu * (Afn / Afg) * W / gamma_a2
+            )
+
+    applicable = ~(
+        issue_rolled_slender_web | issue_annex_e_limit | issue_ar | issue_kpg | issue_holes
+    )
+    governing = np.minimum(np.minimum(mrd_flange, mrd_web), cap)
+    if flt_applicable:
+        governing = np.minimum(governing, mrd_ltb)
+    governing = np.fmin(governing, rupture_limit)
+    mrd = np.where(applicable, governing, 0.0)
+
+    return {
+        "Mrd": mrd,
+        "Mrd_FLT": mrd_ltb if flt_applicable else None,
+        "Mrd_FLM": mrd_flange,
+        "Mrd_FLA_or_tension": mrd_web,
+        "Mrd_rupture": rupture_limit,
+        "Mpl": Mpl,
+        "cap_5_4_2_2": cap,
+        "Mcr_FLT": np.where(slender, Mcr_ltb_e, Mcr_ltb_d),
+        "Mcr_FLM": np.where(slender, Mcr_flange_e, Mcr_flange_d),
+        "Mr_FLM": np.where(slender, np.nan, Mr_flange),
+        "Mr_FLA": np.where(slender, np.nan, Mr_web),
+        "lambda_LT": np.where(slender, ltb_lambda_e, lambda_lt_d),
+        "chi_LT": np.where(slender, np.nan, chi_lt),
+        "regime_FLT": (
+            np.where(slender, regime_ltb_e, regime_ltb_d) if flt_applicable
+            else np.full(shape, FLT_NOT_APPLICABLE)
+        ),
+        "lambda_FLM": flange_lambda,
+        "lambda_p_FLM": flange_lp,
+        "lambda_r_FLM": np.where(slender, flange_lr_e, flange_lr_d),
+        "kc": kc,
+        "regime_FLM": np.where(slender, regime_flange_e, regime_flange_d),
+        "lambda_FLA": web_lambda,
+        "lambda_p_FLA": web_lp,
+        "lambda_r_FLA": web_lr,
+        "regime_FLA": np.where(slender, ANNEX_E_TENSION_REGIME, regime_web_d),
+        "slender_web": slender,
+        "kpg": np.where(slender, kpg, np.nan),
+        "ar": np.where(slender, ar, np.nan),
+        "annex_e_limit": np.where(slender, annex_e_limit, np.nan),
+        "M_y_annex_e": np.where(slender, M_y, np.nan),
+        "M_r_annex_e": np.where(slender, M_r, np.nan),
+        "Wxc": np.where(slender, W, np.nan),
+        "hc": np.where(slender, hc, np.nan),
+        "Iyc": np.where(slender, Iyc, np.nan),
+        "Ayc": np.where(slender, Ayc, np.nan),
+        "ryc": np.where(slender, ryc, np.nan),
+        "lambda_p_LT_annex_e": np.where(slender, ltb_lp, np.nan),
+        "lambda_r_LT_annex_e": np.where(slender, ltb_lr, np.nan),
+        "sigma_r": sigma_r,
+        "Yt": Yt,
+        "holes_checked": holes_checked,
+        "Afg_tension": Afg,
+        "Afn_tension": Afn,
+        "rupture_condition_ok": rupture_condition_ok,
+        "issue_rolled_slender_web": issue_rolled_slender_web,
+        "issue_annex_e_limit": issue_annex_e_limit,
+        "issue_ar": issue_ar,
+        "issue_kpg": issue_kpg,
+        "issue_holes": issue_holes,
+        "applicable": applicable,
+        "reference": "ABNT NBR 8800:2024, 5.4.2, Anexo D e Anexo E",
+    }
+
+
+def flexural_applicability_issues(result: dict, index) -> list[str]:
+    """Reconstrói, para um perfil, as pendências textuais do núcleo escalar."""
+    issues: list[str] = []
+    if result["issue_rolled_slender_web"][index]:
+        issues.append("Alma esbelta em perfil laminado fora do escopo do Anexo E.")
+    if result["issue_annex_e_limit"][index]:
+        issues.append(
+            f"h/tw={result['lambda_FLA'][index]:.2f} excede o limite "
+            f"{result['annex_e_limit'][index]:.2f} do Anexo E."
+        )
+    if result["issue_ar"][index]:
+        issues.append(f"ar={result['ar'][index]:.2f} excede 10,0 (Anexo E).")
+    if result["issue_kpg"][index]:
+        issues.append("O fator kpg resultou não positivo.")
+    if result["issue_holes"][index]:
+        issues.append("Áreas líquida/bruta da mesa tracionada inválidas.")
+    return issues
+
+
+def shear_strength_i_batch(
+    props: Mapping,
+    fy: float,
+    E: float,
+    stiffener_spacing: float | None = None,
+    stiffener_width: float | None = None,
+    stiffener_thickness: float | None = None,
+    stiffener_pair: bool = True,
+    stiffener_welded_to_web_and_flanges: bool = False,
+    gamma_a1: float = GAMMA_A1,
+) -> dict:
+    """Contraparte colunar de ``shear_strength_i``, incluindo a Errata 1:2025.
+
+    A geometria do enrijecedor é comum a todos os perfis: b/t e o limite de
+    esbeltez são escalares, e apenas a/h, j, I_st (que depende de tw) e
+    I_required variam por perfil. Cada critério de validade é devolvido como
+    máscara ``stiffener_*_ok``.
+    """
+    d, h, tw = _property_columns(props, SHEAR_PROPERTIES)
+    if fy <= 0 or E <= 0:
+        raise ValueError("Propriedades inválidas para o cálculo de cisalhamento.")
+    shape = d.shape
+    slenderness = h / tw
+    stiffener_requested = bool(stiffener_spacing and stiffener_spacing > 0)
+    nan = np.full(shape, np.nan)
+    a_h = np.full(shape, np.inf)
+    j = I_st = I_req = one_plate_inertia = nan
+    slender_limit = b_t = None
+    welded_ok = bool(stiffener_welded_to_web_and_flanges)
+    slenderness_ok = np.zeros(shape, dtype=bool)
+    inertia_ok = np.zeros(shape, dtype=bool)
+    stiffener_valid = np.zeros(shape, dtype=bool)
+
+    if stiffener_requested:
+        a = float(stiffener_spacing)
+        a_h = a / h
+        b = float(stiffener_width or 0.0)
+        t = float(stiffener_thickness or 0.0)
+        slender_limit = 0.56 * math.sqrt(E / fy)
+        b_t = b / t if t > 0 else math.inf
+        j = np.maximum(2.5 / a_h**2 - 2.0, 0.5)  # Errata 1:2025.
+        I_req = a * tw**3 * j
+        # Inércia das chapas em relação ao eixo contido no plano médio da alma.
+        if t > 0 and b > 0:
+            plate_centroid = (tw + b) / 2.0
+            one_plate_inertia = t * b**3 / 12.0 + t * b * plate_centroid**2
+            I_st = (2.0 if stiffener_pair else 1.0) * one_plate_inertia
+        else:
+            I_st = np.zeros(shape)
+        slenderness_ok = np.full(shape, b_t <= slender_limit)
+        inertia_ok = I_st >= I_req
+        stiffener_valid = welded_ok & slenderness_ok & inertia_ok
+
+    stiffened = stiffener_valid & (a_h <= 3.0)
+    with np.errstate(divide="ignore"):
+        kv = np.where(stiffened, 5.0 + 5.0 / a_h**2, 5.34)
+    lambda_p = 1.10 * np.sqrt(kv * E / fy)
+    lambda_r = 1.37 * np.sqrt(kv * E / fy)
+    Vpl = 0.60 * d * tw * fy
+    yielding = slenderness <= lambda_p
+    inelastic = ~yielding & (slenderness <= lambda_r)
+    Vrd = np.where(
+        yielding,
+        Vpl / gamma_a1,
+        np.where(
+            inelastic,
+            (lambda_p / slenderness) * Vpl / gamma_a1,
+            1.24 * (lambda_p / slenderness) ** 2 * Vpl / gamma_a1,
+        ),
+    )
+    regime = np.where(
+        yielding, "escoamento",
+        np.where(inelastic, "flambagem inelástica", "flambagem elástica"),
+    )
+    return {
+        "Vrd": Vrd,
+        "Vpl": Vpl,
+        "lambda": slenderness,
+        "lambda_p": lambda_p,
+        "lambda_r": lambda_r,
+        "kv": kv,
+        "kv_basis": np.where(
+            stiffened,
+            "alma com enrijecedores transversais validados",
+            "alma sem enrijecedores eficazes ou a/h > 3",
+        ),
+        "regime": regime,
+        "stiffener_requested": stiffener_requested,
+        "stiffener_valid": stiffener_valid,
+        "stiffener_welded_ok": welded_ok,
+        "stiffener_slenderness_ok": slenderness_ok,
+        "stiffener_inertia_ok": inertia_ok,
+        "a_h": a_h,
+        "j": j,
+        "I_st": I_st,
+        "I_required": I_req,
+        "stiffener_width": stiffener_width,
+        "stiffener_thickness": stiffener_thickness,
+        "stiffener_pair": stiffener_pair,
+        "stiffener_slenderness": b_t,
+        "stiffener_slenderness_limit": slender_limit,
+        "one_plate_inertia": one_plate_inertia,
+        "reference": f"{NORMA}, 5.4.3.1; {ERRATA}",
+    }
+
+
+def _location_row(values, dtype=float) -> np.ndarray:
+    """Converte parâmetros por local de carga em uma linha (1, locais).
+
+    Matrizes (perfis × locais) são mantidas como estão.
+    """
+    values = np.asarray(values, dtype=dtype)
+    return values if values.ndim == 2 else np.atleast_1d(values)[np.newaxis, :]
+
+
+def local_compression_strength_batch(
+    props: Mapping,
+    fy: float,
+    E: float,
+    bearing_length,
+    distance_to_end,
+    fabrication,
+    weld_root_or_radius: float | None = None,
+    lateral_unbraced_length=None,
+    flange_rotation_restrained=True,
+    relative_lateral_movement_restrained=True,
+    moment_at_load=0.0,
+    gamma_a1: float = GAMMA_A1,
+) -> dict:
+    """Contraparte matricial de ``local_compression_strength`` (5.7.3 a 5.7.5).
+
+    As linhas do resultado são os perfis e as colunas, os locais de força.
+    ``bearing_length``, ``distance_to_end``, ``lateral_unbraced_length`` e as
+    duas condições de contenção são escalares, vetores com um valor por
+    local ou matrizes (perfis × locais); ``moment_at_load`` é escalar, vetor por local ou matriz
+    (perfis × locais). Acrescentar um local custa apenas uma coluna a mais.
+    """
+    d, bf, tw, tf, h = (
+        column[:, np.newaxis] for column in _property_columns(props, LOCAL_PROPERTIES)
+    )
+    h_faces = (
+        np.broadcast_to(_column(props["h_faces"]), d.shape[:1])[:, np.newaxis]
+        if "h_faces" in props else d - 2.0 * tf
+    )
+    ln = _location_row(bearing_length)
+    distance = _location_row(distance_to_end)
+    if np.any(ln <= 0):
+        raise ValueError("Geometria inválida para forças localizadas.")
+    ell = _location_row(0.0 if lateral_unbraced_length is None else lateral_unbraced_length)
+    rotation_restrained = _location_row(flange_rotation_restrained, bool)
+    movement_restrained = _location_row(relative_lateral_movement_restrained, bool)
+    welded = _is_welded(fabrication, d.shape[:1])[:, np.newaxis]
+    rolled = _fabrication_mask(fabrication, d.shape[:1], "lam")[:, np.newaxis]
+
+    k_extra = np.where(
+        rolled,
+        np.maximum((h_faces - h) / 2.0, 0.0),
+        max(float(weld_root_or_radius or 0.0), 0.0),
+    )
+    k = tf + k_extra
+
+    interior_yielding = distance > d
+    yielding = np.where(
+        interior_yielding,
+        1.10 * (5.0 * k + ln) * fy * tw / gamma_a1,
+        1.10 * (2.5 * k + ln) * fy * tw / gamma_a1,
+    )
+    yielding_case = np.where(
+        interior_yielding,
+        "seção interna (distância > d)",
+        "próxima à extremidade (distância ≤ d)",
+    )
+
+    ratio_tw_tf = (tw / tf) ** 1.5
+    root_term = np.sqrt(E * fy * tf / tw)
+    interior_crippling = distance >= d / 2.0
+    short_bearing = ln / d <= 0.2
+    crippling = np.where(
+        interior_crippling,
+        0.66 * tw**2 / gamma_a1 * (1.0 + 3.0 * (ln / d) * ratio_tw_tf) * root_term,
+        np.where(
+            short_bearing,
+            0.33 * tw**2 / gamma_a1 * (1.0 + 3.0 * (ln / d) * ratio_tw_tf) * root_term,
+            0.33 * tw**2 / gamma_a1 * (1.0 + (4.0 * ln / d - 0.2) * ratio_tw_tf) * root_term,
+        ),
+    )
+    crippling_case = np.where(
+        interior_crippling,
+        "seção interna",
+        np.where(short_bearing, "extremidade, ln/d ≤ 0,2", "extremidade, ln/d > 0,2"),
+    )
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        sidesway_ratio = (h / tw) / (ell / bf)
+    unrestrained = ~movement_restrained & np.ones_like(d, dtype=bool)
+    informed = unrestrained & (ell > 0)
+    sidesway_limit = np.where(rotation_restrained, 2.30, 1.70)
+    occurs = informed & (sidesway_ratio <= sidesway_limit)
+
+    # Momento de início de escoamento; para alma esbelta soldada, reduzido por kpg.
+    web_lambda_r = 5.70 * math.sqrt(E / fy)
+    ar = h * tw / (bf * tf)
+    kpg_local = np.where(
+        occurs & welded & (h / tw > web_lambda_r),
+        np.minimum(1.0, 1.0 - ar / (1200.0 + 300.0 * ar) * (h / tw - web_lambda_r)),
+        1.0,
+    )
+    Mr = np.maximum(kpg_local, 0.0) * fy * _column(props["Wx"])[:, np.newaxis]
+    Cr = np.where(np.abs(np.asarray(moment_at_load, dtype=float)) < Mr, 32.0, 16.0) * E
+    base = Cr * tw**3 * tf / (gamma_a1 * h**2)
+    sidesway = np.where(
+        occurs,
+        np.where(
+            rotation_restrained,
+            base * (0.94 + 0.37 * sidesway_ratio**3),
+            base * (0.37 * sidesway_ratio**3),
+        ),
+        np.nan,
+    )
+    sidesway_case = np.select(
+        [
+            ~unrestrained,
+            ~informed,
+            ~occurs,
+            rotation_restrained,
+        ],
+        [
+            "não aplicável — deslocamento lateral relativo impedido",
+            "não verificado — comprimento destravado local não informado",
+            "não ocorre pelo critério geométrico de 5.7.5.3",
+            "rotação da mesa impedida",
+        ],
+        "rotação da mesa não impedida",
+    )
+
+    stacked = np.stack(np.broadcast_arrays(yielding, crippling, np.where(occurs, sidesway, np.inf)))
+    governing_index = np.argmin(stacked, axis=0)
+    shape = governing_index.shape
+    return {
+        "FRd": np.min(stacked, axis=0),
+        "governing_index": governing_index,
+        "governing": np.asarray(LOCAL_LIMIT_STATES)[governing_index],
+        "yielding_FRd": np.broadcast_to(yielding, shape),
+        "yielding_case": np.broadcast_to(yielding_case, shape),
+        "crippling_FRd": np.broadcast_to(crippling, shape),
+        "crippling_case": np.broadcast_to(crippling_case, shape),
+        "sidesway_FRd": np.broadcast_to(sidesway, shape),
+        "sidesway_ratio": np.broadcast_to(np.where(informed, sidesway_ratio, np.nan), shape),
+        "sidesway_limit": np.broadcast_to(np.where(informed, sidesway_limit, np.nan), shape),
+        "sidesway_case": np.broadcast_to(sidesway_case, shape),
+        "Cr": np.broadcast_to(np.where(occurs, Cr, np.nan), shape),
+        "Mr": np.broadcast_to(np.where(occurs, Mr, np.nan), shape),
+        "kpg_local": np.broadcast_to(kpg_local, shape),
+        "k": np.broadcast_to(k, shape),
+        "bearing_length": np.broadcast_to(ln, shape),
+        "distance_to_end": np.broadcast_to(distance, shape),
+        "reference": f"{NORMA}, 5.7.3 a 5.7.5",
+    }
+
+
+def _real_cubic_roots_batch(c3, c2, c1, c0) -> np.ndarray:
+    """Versão colunar de ``_real_cubic_roots``: matriz (n, 3) com NaN nas lacunas."""
+    c3, c2, c1, c0 = np.broadcast_arrays(*(_column(value) for value in (c3, c2, c1, c0)))
+    roots = np.full(c3.shape + (3,), np.nan)
+    tolerance = 1e-13 * np.maximum.reduce([np.abs(c3), np.abs(c2), np.abs(c1), np.abs(c0)])
+    cubic = np.abs(c3) > tolerance
+    quadratic = ~cubic & (np.abs(c2) > tolerance)
+    linear = ~cubic & ~quadratic & (np.abs(c1) > tolerance)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        b, c, d = c2 / c3, c1 / c3, c0 / c3
+        p = c - b * b / 3.0
+        q = 2.0 * b**3 / 27.0 - b * c / 3.0 + d
+        discriminant = (q / 2.0) ** 2 + (p / 3.0) ** 3
+        shift = -b / 3.0
+        one_root = cubic & (discriminant > 0.0)
+        triple = cubic & ~one_root & (p == 0.0)
+        three_roots = cubic & ~one_root & ~triple
+        root = np.sqrt(np.where(one_root, discriminant, 0.0))
+        roots[..., 0] = np.where(
+            one_root, np.cbrt(-q / 2.0 + root) + np.cbrt(-q / 2.0 - root) + shift,
+            np.where(triple, shift, roots[..., 0]),
+        )
+        radius = 2.0 * np.sqrt(-p / 3.0)
+        argument = np.clip(3.0 * q / (2.0 * p) * np.sqrt(-3.0 / p), -1.0, 1.0)
+        angle = np.arccos(argument) / 3.0
+        for k in range(3):
+            roots[..., k] = np.where(
+                three_roots, radius * np.cos(angle - 2.0 * math.pi * k / 3.0) + shift, roots[..., k]
+            )
+
+        quadratic_discriminant = c1 * c1 - 4.0 * c2 * c0
+        real_pair = quadratic & (quadratic_discriminant >= 0.0)
+        quadratic_root = np.sqrt(np.where(real_pair, quadratic_discriminant, 0.0))
+        roots[..., 0] = np.where(real_pair, (-c1 + quadratic_root) / (2.0 * c2), roots[..., 0])
+        roots[..., 1] = np.where(real_pair, (-c1 - quadratic_root) / (2.0 * c2), roots[..., 1])
+        roots[..., 0] = np.where(linear, -c0 / c1, roots[..., 0])
+
+        coefficients = [value[..., np.newaxis] for value in (c3, c2, c1, c0)]
+        k3, k2, k1, k0 = coefficients
+        for _ in range(2):
+            derivative = (3.0 * k3 * roots + 2.0 * k2) * roots + k1
+            step = (((k3 * roots + k2) * roots + k1) * roots + k0) / derivative
+            roots = np.where(derivative != 0.0, roots - step, roots)
+    return roots
+
+
+@dataclass(frozen=True)
+class UnitLoadBeam:
+    """Viga resolvida uma única vez para q = 1 e P = 1, pronta para superposição.
+
+    Como a análise é linear, reações, momentos de extremidade e a constante de
+    integração da rotação de qualquer par (q, P) são combinações das duas
+    respostas unitárias. Cada coluna de q (por exemplo, com o peso próprio de
+    cada perfil) é então resolvida sem nova análise; q e P podem ter eixos
+    extras, como um por combinação de ações, desde que sejam compatíveis por
+    broadcasting.
+    """
+
+    support: str
+    length: float
+    point_position: float
+    unit_q: BeamResponse
+    unit_point: BeamResponse
+
+    def end_actions(self, q, point_load) -> tuple[np.ndarray, ...]:
+        """RA, RB, M(0), M(L) e constante de rotação superpostos por coluna."""
+        q, P = _column(q), _column(point_load)
+        return tuple(
+            q * getattr(self.unit_q, name) + P * getattr(self.unit_point, name)
+            for name in (
+                "reaction_left", "reaction_right", "moment_left", "moment_right",
+                "rotation_integration_constant",
+            )
+        )
+
+    def moment_at(self, q, point_load, x) -> np.ndarray:
+        ra, _, m0, _, _ = self.end_actions(q, point_load)
+        x = np.clip(x, 0.0, self.length)
+        macaulay = np.maximum(x - self.point_position, 0.0)
+        return m0 + ra * x - _column(q) * x**2 / 2.0 - _column(point_load) * macaulay
+
+    def max_moment(
+        self, q, point_load, segment_start: float = 0.0, segment_end: float | None = None,
+        fixed_points: tuple[float, ...] = (),
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Maior |M| no trecho: extremidades, pontos fixos, carga pontual e raízes de V."""
+        x0 = segment_start
+        x1 = self.length if segment_end is None else segment_end
+        q, P = np.broadcast_arrays(_column(q), _column(point_load))
+        a = self.point_position
+        ra, _, _, _, _ = self.end_actions(q, P)
+        candidates = [np.full(ra.shape, x) for x in (x0, x1, *fixed_points)]
+        if x0 <= a <= x1:
+            candidates.append(np.full(ra.shape, a))
+        with np.errstate(divide="ignore", invalid="ignore"):
+            root_before = np.where(q > 0, ra / q, np.nan)
+            root_after = np.where(q > 0, (ra - P) / q, np.nan)
+        candidates.append(np.where((x0 <= root_before) & (root_before <= min(a, x1)), root_before, np.nan))
+        candidates.append(np.where((max(a, x0) <= root_after) & (root_after <= x1), root_after, np.nan))
+        xs = np.stack(candidates, axis=-1)
+        values = np.abs(self.moment_at(q[..., None], P[..., None], np.nan_to_num(xs)))
+        values = np.where(np.isnan(xs), -np.inf, values)
+        index = np.argmax(values, axis=-1)[..., None]
+        return (
+            np.take_along_axis(values, index, axis=-1)[..., 0],
+            np.take_along_axis(xs, index, axis=-1)[..., 0],
+        )
+
+    def max_shear(self, q, point_load) -> np.ndarray:
+        q, P = np.broadcast_arrays(_column(q), _column(point_load))
+        a = self.point_position
+        ra, rb, _, _, _ = self.end_actions(q, P)
+        return np.max(np.abs(np.stack([ra, ra - q * a, ra - q * a - P, -rb])), axis=0)
+
+    def cb(self, q, point_load, segment_start: float = 0.0, unbraced_length: float | None = None) -> dict:
+        """Versão colunar de ``calculate_cb``: Cb e momentos dos quartos do trecho."""
+        lb = self.length if unbraced_length is None else unbraced_length
+        x0 = segment_start
+        if lb <= 0 or x0 < 0 or x0 + lb > self.length + 1e-9:
+            raise ValueError("O trecho destravado deve estar contido no comprimento da viga.")
+        quarter_points = (x0 + lb / 4.0, x0 + lb / 2.0, x0 + 3.0 * lb / 4.0)
+        ma, mb, mc = (np.abs(self.moment_at(q, point_load, xv)) for xv in quarter_points)
+        mmax, mmax_x = self.max_moment(q, point_load, x0, x0 + lb, quarter_points)
+        denominator = 2.5 * mmax + 3.0 * ma + 4.0 * mb + 3.0 * mc
+        with np.errstate(divide="ignore", invalid="ignore"):
+            cb = np.where(denominator <= 0, 1.0, 12.5 * mmax / denominator)
+        return {"Cb": cb, "Mmax": mmax, "MA": ma, "MB": mb, "MC": mc, "xMmax": mmax_x}
+
+    def max_deflection(self, q, point_load, E: float, I) -> tuple[np.ndarray, np.ndarray]:
+        """Flecha máxima analítica e posição, pelas raízes da cúbica de rotação."""
+        q, P, I = np.broadcast_arrays(_column(q), _column(point_load), _column(I))
+        L, a = self.length, self.point_position
+        ra, _, m0, _, c1 = (np.broadcast_to(value, q.shape) for value in self.end_actions(q, P))
+        candidates = [np.zeros(q.shape), np.full(q.shape, L), np.full(q.shape, a)]
+        segments = (
+            (0.0, a, (-q / 6.0, ra / 2.0, m0, c1)),
+            (a, L, (-q / 6.0, ra / 2.0 - P / 2.0, m0 + P * a, c1 - P * a**2 / 2.0)),
+        )
+        for start, end, (k3, k2, k1, k0) in segments:
+            if end <= start:
+                continue
+            roots = _real_cubic_roots_batch(k3 * L**3, k2 * L**2, k1 * L, k0) * L
+            for index in range(3):
+                xv = roots[..., index]
+                candidates.append(np.where((start <= xv) & (xv <= end), xv, np.nan))
+
+        x = np.stack(candidates, axis=-1)
+        xc = np.nan_to_num(x)
+        numerator = (
+            c1[..., None] * xc
+            + m0[..., None] * xc**2 / 2.0
+            + ra[..., None] * xc**3 / 6.0
+            - q[..., None] * xc**4 / 24.0
+            - P[..., None] * np.maximum(xc - a, 0.0) ** 3 / 6.0
+        )
+        deflections = np.where(np.isnan(x), -np.inf, np.abs(numerator / (E * I[..., None])))
+        index = np.argmax(deflections, axis=-1)[..., None]
+        return (
+            np.take_along_axis(deflections, index, axis=-1)[..., 0],
+            np.take_along_axis(x, index, axis=-1)[..., 0],
+        )
+
+
+@lru_cache(maxsize=64)
+def unit_load_beam(support: str, length: float, point_position: float) -> UnitLoadBeam:
+    """Resolve (e guarda) as respostas unitárias de uma geometria de viga."""
+    normalized = SUPPORT_ALIASES.get(support)
+    if normalized is None:
+        raise ValueError(f"Vinculação não suportada: {support}")
+    length, point_position = float(length), float(point_position)
+    return UnitLoadBeam(
+        support=normalized,
+        length=length,
+        point_position=point_position,
+        unit_q=analyze_beam(normalized, length, q=1.0, point_position=point_position, samples=None),
+        unit_point=analyze_beam(
+            normalized, length, point_load=1.0, point_position=point_position, samples=None,
+        ),
+    )
+
+
+def max_deflection_batch(
+    support: str,
+    length: float,
+    q,
+    point_load: float,
+    point_position: float,
+    E: float,
+    I,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Flecha máxima analítica e sua posição para colunas de q e de inércia.
+
+    Contraparte colunar do extremo calculado por ``analyze_beam``: em cada
+    trecho, as raízes da cúbica de rotação são candidatas, ao lado das
+    extremidades e da posição da carga pontual. Nenhuma malha é amostrada.
+    """
+    return unit_load_beam(support, length, point_position).max_deflection(q, point_load, E, I)
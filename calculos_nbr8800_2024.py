@@ -7,10 +7,12 @@ para permitir ensaios unitários e revisão das equações.
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 import math
 from typing import Iterable
 
+import numpy as np
+
 
 NORMA = "ABNT NBR 8800:2024"
 ERRATA = "ABNT NBR 8800:2024/Er1:2025 — Errata 1 (25/02/2025)"
@@ -29,8 +31,25 @@ SUPPORT_ALIASES = {
 }
 
 
+@dataclass(frozen=True)
+class BeamDiagrams:
+    """Diagramas amostrados de uma ``BeamResponse`` (arrays NumPy)."""
+
+    x: np.ndarray
+    moments: np.ndarray
+    shears: np.ndarray
+    deflections: np.ndarray
+
+
 @dataclass(frozen=True)
 class BeamResponse:
+    """Resposta elástica com extremos analíticos e diagramas sob demanda.
+
+    ``x``, ``moments``, ``shears`` e ``deflections`` só são amostrados no
+    primeiro acesso, na resolução ``samples`` da análise; ``diagrams`` permite
+    escolher outra resolução. Cada malha calculada fica guardada na instância.
+    """
+
     support: str
     length: float
     q: float
@@ -45,11 +64,11 @@ class BeamResponse:
     max_shear: float
     max_deflection: float
     max_deflection_position: float
-    x: tuple[float, ...]
-    moments: tuple[float, ...]
-    shears: tuple[float, ...]
-    deflections: tuple[float, ...]
     rotation_integration_constant: float
+    E: float | None = None
+    I: float | None = None
+    samples: int | None = 2001
+    _diagrams: dict = field(default_factory=dict, init=False, repr=False, compare=False)
 
     def moment_at(self, x_value: float) -> float:
         x_value = min(max(float(x_value), 0.0), self.length)
@@ -61,6 +80,88 @@ class BeamResponse:
             - self.point_load * macaulay
         )
 
+    def moment_extremum(
+        self, x0: float, x1: float, points: Iterable[float] = ()
+    ) -> tuple[float, float]:
+        """Maior |M| em [x0, x1] e sua posição.
+
+        O extremo ocorre em uma extremidade do trecho, na descontinuidade
+        causada por P ou onde V(x)=dM/dx=0; ``points`` acrescenta candidatos.
+        """
+        candidates = {x0, x1, *points}
+        a, q, p = self.point_position, self.q, self.point_load
+        if x0 <= a <= x1:
+            candidates.add(a)
+        if q > 0:
+            root_before = self.reaction_left / q
+            root_after = (self.reaction_left - p) / q
+            if x0 <= root_before <= min(a, x1):
+                candidates.add(root_before)
+            if max(a, x0) <= root_after <= x1:
+                candidates.add(root_after)
+        position = max(candidates, key=lambda xv: abs(self.moment_at(xv)))
+        return abs(self.moment_at(position)), position
+
+    def diagrams(self, samples: int | None = None) -> BeamDiagrams:
+        """Amostra M, V e δ em ``samples`` pontos (padrão: resolução da análise).
+
+        A posição da carga pontual é acrescentada à malha quando nenhum ponto
+        cai a menos de L/samples dela. Sem resolução, os arrays ficam vazios.
+        """
+        samples = self.samples if samples is None else samples
+        cached = self._diagrams.get(samples)
+        if cached is not None:
+            return cached
+        if samples is None:
+            xs = np.empty(0)
+        else:
+            _validate_samples(samples)
+            xs = self.length * np.arange(samples) / (samples - 1)
+            a = self.point_position
+            if 0.0 < a < self.length and np.all(np.abs(xs - a) > self.length / samples):
+                xs = np.sort(np.append(xs, a))
+        P, a = self.point_load, self.point_position
+        macaulay = np.maximum(xs - a, 0.0)
+        moments = self.moment_left + self.reaction_left * xs - self.q * xs**2 / 2.0 - P * macaulay
+        after_point = (xs > a) | np.isclose(xs, a, rtol=1e-9, atol=0.0)
+        shears = self.reaction_left - self.q * xs - np.where(after_point, P, 0.0)
+        if self.E is not None and self.I is not None and self.E > 0 and self.I > 0:
+            deflections = (
+                self.rotation_integration_constant * xs
+                + self.moment_left * xs**2 / 2.0
+                + self.reaction_left * xs**3 / 6.0
+                - self.q * xs**4 / 24.0
+                - P * macaulay**3 / 6.0
+            ) / (self.E * self.I)
+        else:
+            deflections = np.zeros_like(xs)
+        result = BeamDiagrams(xs, moments, shears, deflections)
+        for values in (xs, moments, shears, deflections):
+            values.flags.writeable = False
+        self._diagrams[samples] = result
+        return result
+
+    @property
+    def x(self) -> np.ndarray:
+        return self.diagrams().x
+
+    @property
+    def moments(self) -> np.ndarray:
+        return self.diagrams().moments
+
+    @property
+    def shears(self) -> np.ndarray:
+        return self.diagrams().shears
+
+    @property
+    def deflections(self) -> np.ndarray:
+        return self.diagrams().deflections
+
+
+def _validate_samples(samples: int) -> None:
+    if samples < 101:
+        raise ValueError("Use ao menos 101 pontos para amostrar os diagramas.")
+
 
 def _validate_beam_inputs(length: float, q: float, point_load: float, point_position: float) -> None:
     if length <= 0:
@@ -102,6 +203,81 @@ def _beam_end_actions(
     return ra, rb, m0, mL
 
 
+def _real_cubic_roots(c3: float, c2: float, c1: float, c0: float) -> list[float]:
+    """Raízes reais de c3·s³ + c2·s² + c1·s + c0 = 0, polidas por Newton.
+
+    Os coeficientes devem estar adimensionalizados (s = x/L) para que o teste
+    de degeneração do grau do polinômio seja relativo.
+    """
+    scale = max(abs(c3), abs(c2), abs(c1), abs(c0))
+    if scale == 0.0:
+        return []
+    tolerance = 1e-13 * scale
+    roots: list[float] = []
+    if abs(c3) > tolerance:
+        b, c, d = c2 / c3, c1 / c3, c0 / c3
+        p = c - b * b / 3.0
+        q = 2.0 * b**3 / 27.0 - b * c / 3.0 + d
+        discriminant = (q / 2.0) ** 2 + (p / 3.0) ** 3
+        shift = -b / 3.0
+        if discriminant > 0.0:
+            root = math.sqrt(discriminant)
+            roots.append(math.cbrt(-q / 2.0 + root) + math.cbrt(-q / 2.0 - root) + shift)
+        elif p == 0.0:
+            roots.append(shift)
+        else:
+            radius = 2.0 * math.sqrt(-p / 3.0)
+            argument = max(-1.0, min(1.0, 3.0 * q / (2.0 * p) * math.sqrt(-3.0 / p)))
+            angle = math.acos(argument) / 3.0
+            roots.extend(
+                radius * math.cos(angle - 2.0 * math.pi * k / 3.0) + shift for k in range(3)
+            )
+    elif abs(c2) > tolerance:
+        discriminant = c1 * c1 - 4.0 * c2 * c0
+        if discriminant >= 0.0:
+            root = math.sqrt(discriminant)
+            roots.extend(((-c1 + root) / (2.0 * c2), (-c1 - root) / (2.0 * c2)))
+    elif abs(c1) > tolerance:
+        roots.append(-c0 / c1)
+
+    polished = []
+    for root in roots:
+        for _ in range(2):
+            derivative = (3.0 * c3 * root + 2.0 * c2) * root + c1
+            if derivative == 0.0:
+                break
+            root -= (((c3 * root + c2) * root + c1) * root + c0) / derivative
+        polished.append(root)
+    return polished
+
+
+def _deflection_extremum(
+    length: float, q: float, point_load: float, point_position: float,
+    ra: float, m0: float, c1: float, displacement,
+) -> tuple[float, float]:
+    """Localiza |δ|max onde a rotação se anula em cada trecho da linha elástica.
+
+    A rotação EI·θ(x) = c1 + M0·x + RA·x²/2 - q·x³/6 - P·<x-a>²/2 é uma cúbica
+    em cada lado da carga pontual. Os candidatos são as extremidades, a posição
+    da carga e as raízes reais de θ em cada trecho.
+    """
+    L, P, a = length, point_load, point_position
+    segments = (
+        (0.0, a, (-q / 6.0, ra / 2.0, m0, c1)),
+        (a, L, (-q / 6.0, ra / 2.0 - P / 2.0, m0 + P * a, c1 - P * a**2 / 2.0)),
+    )
+    candidates = {0.0, L, a}
+    for start, end, (k3, k2, k1, k0) in segments:
+        if end <= start:
+            continue
+        for root in _real_cubic_roots(k3 * L**3, k2 * L**2, k1 * L, k0):
+            xv = root * L
+            if start <= xv <= end:
+                candidates.add(xv)
+    position = max(sorted(candidates), key=lambda xv: abs(displacement(xv)))
+    return abs(displacement(position)), position
+
+
 def analyze_beam(
     support: str,
     length: float,
@@ -110,21 +286,23 @@ def analyze_beam(
     point_position: float | None = None,
     E: float | None = None,
     I: float | None = None,
-    samples: int = 2001,
+    samples: int | None = 2001,
 ) -> BeamResponse:
     """Análise elástica de primeira ordem para q uniforme e uma carga pontual.
 
     As expressões de esforços e deslocamentos são obtidas por funções de
     singularidade. Assim, q e P são combinados na mesma seção, sem somar máximos
-    que ocorram em posições distintas.
+    que ocorram em posições distintas. Os extremos de momento, cortante e flecha
+    são analíticos; ``samples`` define apenas a resolução padrão dos
+    diagramas, amostrados sob demanda (``samples=None``: diagramas vazios).
     """
     normalized = SUPPORT_ALIASES.get(support)
     if normalized is None:
         raise ValueError(f"Vinculação não suportada: {support}")
     a = length / 2.0 if point_position is None else float(point_position)
     _validate_beam_inputs(length, q, point_load, a)
-    if samples < 101:
-        raise ValueError("Use ao menos 101 pontos para localizar a flecha máxima.")
+    if samples is not None:
+        _validate_samples(samples)
 
     ra, rb, m0, mL = _beam_end_actions(normalized, length, q, point_load, a)
     L, P = length, point_load
@@ -132,10 +310,6 @@ def analyze_beam(
     def moment(xv: float) -> float:
         return m0 + ra * xv - q * xv**2 / 2.0 - P * max(xv - a, 0.0)
 
-    def shear(xv: float, after_point: bool = True) -> float:
-        p_term = P if (xv > a or (after_point and math.isclose(xv, a))) else 0.0
-        return ra - q * xv - p_term
-
     # Constante de integração da rotação. Nos três modelos engastados ela é zero.
     c1 = 0.0
     if normalized == "simply_supported":
@@ -161,14 +335,6 @@ def analyze_beam(
         )
         return numerator / (E * I)
 
-    xs = [L * i / (samples - 1) for i in range(samples)]
-    if 0.0 < a < L and all(not math.isclose(xv, a, abs_tol=L / samples) for xv in xs):
-        xs.append(a)
-        xs.sort()
-    moments = [moment(xv) for xv in xs]
-    shears = [shear(xv) for xv in xs]
-    deflections = [displacement(xv) for xv in xs]
-
     # Pontos exatos de extremo de M: extremidades, descontinuidade e V=0.
     candidates = {0.0, L, a}
     if q > 0:
@@ -183,7 +349,9 @@ def analyze_beam(
 
     shear_candidates = [abs(ra), abs(ra - q * a), abs(ra - q * a - P), abs(-rb)]
     max_v = max(shear_candidates)
-    max_d_index = max(range(len(xs)), key=lambda idx: abs(deflections[idx]))
+    max_d, max_d_x = 0.0, 0.0
+    if use_deflection:
+        max_d, max_d_x = _deflection_extremum(L, q, P, a, ra, m0, c1, displacement)
 
     return BeamResponse(
         support=normalized,
@@ -198,20 +366,23 @@ def analyze_beam(
         max_moment=max_m,
         max_moment_position=max_m_x,
         max_shear=max_v,
-        max_deflection=abs(deflections[max_d_index]),
-        max_deflection_position=xs[max_d_index],
-        x=tuple(xs),
-        moments=tuple(moments),
-        shears=tuple(shears),
-        deflections=tuple(deflections),
+        max_deflection=max_d,
+        max_deflection_position=max_d_x,
         rotation_integration_constant=c1,
+        E=E if use_deflection else None,
+        I=I if use_deflection else None,
+        samples=samples,
     )
 
 
 def calculate_cb(
-    response: BeamResponse, segment_start: float = 0.0, unbraced_length: float | None = None
+    response, segment_start: float = 0.0, unbraced_length: float | None = None
 ) -> dict:
-    """Calcula Cb para seção duplamente simétrica conforme 5.4.2.3-a."""
+    """Calcula Cb para seção duplamente simétrica conforme 5.4.2.3-a.
+
+    ``response`` pode ser qualquer resposta de viga com ``length``,
+    ``moment_at`` e ``moment_extremum`` (``BeamResponse`` ou ``PiecewiseBeam``).
+    """
     lb = response.length if unbraced_length is None else unbraced_length
     if lb <= 0 or segment_start < 0 or segment_start + lb > response.length + 1e-9:
         raise ValueError("O trecho destravado deve estar contido no comprimento da viga.")
@@ -219,22 +390,10 @@ def calculate_cb(
     quarter_points = [x0 + lb / 4.0, x0 + lb / 2.0, x0 + 3.0 * lb / 4.0]
     ma, mb, mc = [abs(response.moment_at(xv)) for xv in quarter_points]
 
-    # O extremo de M(x) ocorre em uma extremidade do trecho, na descontinuidade
-    # causada por P ou onde V(x)=dM/dx=0. A busca analítica evita que Mmax e Cb
-    # dependam do espaçamento da malha usada apenas para a linha elástica.
-    candidates = {x0, x1, *quarter_points}
-    a, q, p = response.point_position, response.q, response.point_load
-    if x0 <= a <= x1:
-        candidates.add(a)
-    if q > 0:
-        root_before = response.reaction_left / q
-        root_after = (response.reaction_left - p) / q
-        if x0 <= root_before <= min(a, x1):
-            candidates.add(root_before)
-        if max(a, x0) <= root_after <= x1:
-            candidates.add(root_after)
-    mmax_x = max(candidates, key=lambda xv: abs(response.moment_at(xv)))
-    mmax = abs(response.moment_at(mmax_x))
+    # O extremo de M(x) é buscado analiticamente (ver ``moment_extremum``), o que
+    # evita que Mmax e Cb dependam do espaçamento da malha usada apenas para a
+    # linha elástica.
+    mmax, mmax_x = response.moment_extremum(x0, x1, quarter_points)
     denominator = 2.5 * mmax + 3.0 * ma + 4.0 * mb + 3.0 * mc
     cb = 1.0 if denominator <= 0 else 12.5 * mmax / denominator
     return {
@@ -327,6 +486,101 @@ def combine_els(
     }
 
 
+@dataclass(frozen=True)
+class VariableAction:
+    """Ação variável gravitacional (q em kN/cm, P em kN) com γq e fatores ψ."""
+
+    name: str
+    q: float = 0.0
+    point_load: float = 0.0
+    gamma_q: float = 1.50
+    psi0: float = 0.7
+    psi1: float = 0.6
+    psi2: float = 0.4
+
+
+ELS_COMBINATION_LABELS = {
+    "rare": "Rara",
+    "frequent": "Frequente",
+    "quasi_permanent": "Quase permanente",
+}
+
+
+def load_combinations(
+    variable_actions: Iterable[VariableAction],
+    gamma_g: float = 1.50,
+    gamma_self_weight: float = 1.25,
+    els_combinations: Iterable[str] = ("rare", "frequent", "quasi_permanent"),
+) -> dict:
+    """Matriz de combinações ELU normais e ELS para várias ações variáveis.
+
+    Cada linha traz os fatores das ações permanentes, do peso próprio e de
+    cada ação variável, na ordem de ``variable_actions``. No ELU e nas
+    combinações rara e frequente, cada ação variável é a principal uma vez,
+    com as demais reduzidas por ψ0 (ELU), ψ1 (rara) ou ψ2 (frequente); a
+    quase permanente usa ψ2 em todas.
+    """
+    actions = list(variable_actions)
+    if not actions:
+        raise ValueError("Informe ao menos uma ação variável.")
+    if len({action.name for action in actions}) != len(actions):
+        raise ValueError("As ações variáveis devem ter nomes distintos.")
+    for action in actions:
+        if action.q < 0 or action.point_load < 0:
+            raise ValueError("A rotina simplificada de gravidade não admite ações favoráveis negativas.")
+        if not all(0.0 <= psi <= 1.0 for psi in (action.psi0, action.psi1, action.psi2)):
+            raise ValueError("Os fatores ψ0, ψ1 e ψ2 devem estar entre 0 e 1.")
+
+    def leading(leader_factor, companion_factor):
+        return [
+            tuple(
+                leader_factor(action) if index == leader else companion_factor(action)
+                for index, action in enumerate(actions)
+            )
+            for leader in range(len(actions))
+        ]
+
+    elu = [
+        {
+            "label": f"ELU: {actions[leader].name} principal",
+            "permanent": gamma_g,
+            "self_weight": gamma_self_weight,
+            "variable": factors,
+        }
+        for leader, factors in enumerate(
+            leading(lambda action: action.gamma_q, lambda action: action.gamma_q * action.psi0)
+        )
+    ]
+    els = []
+    for combination in els_combinations:
+        if combination not in ELS_COMBINATION_LABELS:
+            raise ValueError("Combinação ELS inválida.")
+        label = ELS_COMBINATION_LABELS[combination]
+        if combination == "quasi_permanent":
+            rows = [(label, tuple(action.psi2 for action in actions))]
+        else:
+            leader, companion = (
+                (lambda action: 1.0, lambda action: action.psi1)
+                if combination == "rare"
+                else (lambda action: action.psi1, lambda action: action.psi2)
+            )
+            rows = [
+                (f"{label}: {actions[index].name} principal", factors)
+                for index, factors in enumerate(leading(leader, companion))
+            ]
+        els.extend(
+            {"label": row_label, "combination": combination, "permanent": 1.0,
+             "self_weight": 1.0, "variable": factors}
+            for row_label, factors in rows
+        )
+    return {
+        "actions": actions,
+        "elu": elu,
+        "els": els,
+        "reference": "ABNT NBR 8800:2024, 4.8.7.2.1 e 4.8.7.3; Tabelas 1 e 2",
+    }
+
+
 def validate_material(fy: float, fu: float) -> list[str]:
     issues: list[str] = []
     if fy <= 0 or fu <= 0:
@@ -833,6 +1087,16 @@ def deflection_limit(
     return min(limit, absolute_limit) if absolute_limit and absolute_limit > 0 else limit
 
 
+def verification_status(demand, resistance, applicable=True) -> tuple[float, str]:
+    """Eficiência (%) e status de uma verificação; resistência ausente ou nula fica NÃO VERIFICADO."""
+    if not applicable:
+        return 0.0, "N/A"
+    if resistance is None or resistance <= 0:
+        return float('inf'), "NÃO VERIFICADO"
+    efficiency = demand / resistance * 100.0
+    return efficiency, "APROVADO" if demand <= resistance else "REPROVADO"
+
+
 def overall_status(statuses: Iterable[str]) -> str:
     values = list(statuses)
     # Uma reprovação comprovada é conclusiva; pendências só governam quando
@@ -0,0 +1,181 @@
+"""Catálogo de perfis pré-compilado, carregado por mapeamento de memória.
+
+``compile_catalog`` converte ``perfis.xlsx`` em um diretório ``perfis.catalog``
+com dois arquivos:
+
+* ``values.npy``: todas as colunas numéricas das planilhas como um único
+  vetor float64; em cada planilha, as colunas float64 vêm juntas (um bloco
+  contíguo) e as inteiras em seguida;
+* ``manifest.json``: planilhas, nomes e tipos das colunas, trecho de cada
+  coluna em ``values.npy``, colunas de texto e o SHA-256 da planilha de origem.
+
+``load_catalog`` abre ``values.npy`` com ``mmap_mode="r"``; as páginas vêm do
+cache de arquivos do sistema operacional e são compartilhadas entre os
+processos do servidor. As colunas float64 de cada DataFrame formam um único
+bloco que é vista do mapeamento, somente leitura; as colunas inteiras e de
+texto, pequenas, são montadas em cada processo. A planilha só é lida pelo openpyxl quando o hash
+registrado difere do arquivo atual (ou o catálogo compilado não existe), e
+nesse caso o catálogo é recompilado se o diretório permitir escrita.
+
+Uso: ``python catalogo_binario.py [perfis.xlsx]``.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from pathlib import Path
+import sys
+
+import numpy as np
+import pandas as pd
+
+
+CATALOG_FORMAT = 2
+DEFAULT_WORKBOOK = Path(__file__).resolve().with_name("perfis.xlsx")
+MANIFEST_NAME = "manifest.json"
+VALUES_NAME = "values.npy"
+
+
+def compiled_path(workbook: str | Path) -> Path:
+    """Diretório do catálogo compilado ao lado da planilha (``perfis.catalog``)."""
+    return Path(workbook).with_suffix(".catalog")
+
+
+def workbook_digest(workbook: str | Path) -> str:
+    digest = hashlib.sha256()
+    with open(workbook, "rb") as handle:
+        for chunk in iter(lambda: handle.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _replace(path: Path, write) -> None:
+    # Grava ao lado e troca de uma vez: leitores nunca veem um arquivo parcial.
+    temporary = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    try:
+        with open(temporary, "wb") as handle:
+            write(handle)
+        os.replace(temporary, path)
+    finally:
+        temporary.unlink(missing_ok=True)
+
+
+def compile_catalog(
+    workbook: str | Path = DEFAULT_WORKBOOK,
+    output: str | Path | None = None,
+    sheets: dict[str, pd.DataFrame] | None = None,
+) -> Path:
+    """Compila a planilha (ou ``sheets`` já lidas dela) no formato binário."""
+    workbook = Path(workbook)
+    output = compiled_path(workbook) if output is None else Path(output)
+    digest = workbook_digest(workbook)
+    if sheets is None:
+        sheets = pd.read_excel(workbook, sheet_name=None)
+
+    blocks: list[np.ndarray] = []
+    offset = 0
+    manifest_sheets = []
+    for sheet_name, frame in sheets.items():
+        columns = []
+        numeric = []
+        for name, series in frame.items():
+            if pd.api.types.is_numeric_dtype(series) and not pd.api.types.is_bool_dtype(series):
+                column = {"name": str(name), "dtype": series.dtype.str, "length": len(series)}
+                numeric.append((column, series.to_numpy(dtype=float)))
+                columns.append(column)
+            else:
+                columns.append({
+                    "name": str(name),
+                    "text": [None if pd.isna(value) else str(value) for value in series],
+                })
+        # Colunas float64 primeiro, contíguas: ``_frames`` as entrega como um só bloco.
+        numeric.sort(key=lambda item: item[0]["dtype"] != np.dtype(float).str)
+        for column, values in numeric:
+            column["offset"] = offset
+            blocks.append(values)
+            offset += len(values)
+        manifest_sheets.append({"name": str(sheet_name), "rows": len(frame), "columns": columns})
+
+    output.mkdir(parents=True, exist_ok=True)
+    values = np.concatenate(blocks) if blocks else np.empty(0)
+    _replace(output / VALUES_NAME, lambda handle: np.save(handle, values, allow_pickle=False))
+    manifest = {
+        "format": CATALOG_FORMAT,
+        "source": workbook.name,
+        "source_sha256": digest,
+        "values": len(values),
+        "sheets": manifest_sheets,
+    }
+    # O manifesto é gravado por último: é ele que torna o catálogo válido.
+    _replace(
+        output / MANIFEST_NAME,
+        lambda handle: handle.write(json.dumps(manifest, ensure_ascii=False).encode("utf-8")),
+    )
+    return output
+
+
+def _read_manifest(compiled: Path) -> dict | None:
+    try:
+        manifest = json.loads((compiled / MANIFEST_NAME).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    return manifest if manifest.get("format") == CATALOG_FORMAT else None
+
+
+def _frames(manifest: dict, values: np.ndarray) -> dict[str, pd.DataFrame]:
+    sheets = {}
+    for sheet in manifest["sheets"]:
+        rows = sheet["rows"]
+        floats = [column for column in sheet["columns"] if column.get("dtype") == values.dtype.str]
+        start = floats[0]["offset"] if floats else 0
+        block = values[start:start + rows * len(floats)].reshape(len(floats), rows)
+        # Um único bloco float64, vista do mapeamento: o pandas não tem o que
+        # consolidar e as páginas continuam compartilhadas e somente leitura.
+        frame = pd.DataFrame(block.T, columns=[column["name"] for column in floats], copy=False)
+        for position, column in enumerate(sheet["columns"]):
+            if "text" in column:
+                frame.insert(position, column["name"], np.array(column["text"], dtype=object))
+            elif column.get("dtype") != values.dtype.str:
+                view = values[column["offset"]:column["offset"] + column["length"]]
+                frame.insert(position, column["name"], view.astype(np.dtype(column["dtype"])))
+        sheets[sheet["name"]] = frame
+    return sheets
+
+
+def load_catalog(
+    workbook: str | Path = DEFAULT_WORKBOOK,
+    compiled: str | Path | None = None,
+    refresh: bool = True,
+) -> dict[str, pd.DataFrame]:
+    """Planilhas do catálogo, do binário compilado quando o hash confere.
+
+    Devolve o mesmo dicionário de ``pd.read_excel(workbook, sheet_name=None)``.
+    Com ``refresh``, uma planilha alterada é recompilada após a leitura; falta
+    de permissão de escrita apenas mantém a leitura pela planilha.
+    """
+    workbook = Path(workbook)
+    compiled = compiled_path(workbook) if compiled is None else Path(compiled)
+    digest = workbook_digest(workbook)
+    manifest = _read_manifest(compiled)
+    if manifest is not None and manifest["source_sha256"] == digest:
+        try:
+            values = np.load(compiled / VALUES_NAME, mmap_mode="r", allow_pickle=False)
+        except (OSError, ValueError):
+            values = None
+        if values is not None and values.shape == (manifest["values"],):
+            return _frames(manifest, values)
+
+    sheets = pd.read_excel(workbook, sheet_name=None)
+    if refresh:
+        try:
+            compile_catalog(workbook, compiled, sheets)
+        except OSError:
+            pass
+    return sheets
+
+
+if __name__ == "__main__":
+    source = Path(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_WORKBOOK
+    print(f"Catálogo compilado em {compile_catalog(source)}")
@@ -0,0 +1,298 @@
+"""Dados de projeto canônicos, validados e com hash estável.
+
+``DesignInput`` é a forma imutável de ``input_params``: cada campo já está
+na unidade do motor (cm, kN, kN/cm, kN·cm e kN/cm²), com números como
+``float``, opções como ``bool`` e listas como tuplas. Valores derivados
+(carga de serviço, largura de influência, força pontual de serviço, texto
+da combinação ELU e esforços do memorial) não são guardados; ``to_params``
+os recalcula ao montar o dicionário esperado por ``perform_all_checks`` e
+``evaluate_catalog``.
+
+``scope_reasons`` monta ``unsupported_reasons`` a partir da triagem de
+aplicabilidade da barra lateral (``SCOPE_FLAGS``) e da origem do Cb manual;
+a interface, os arquivos de casos e o serviço HTTP usam a mesma regra.
+
+Os campos de apresentação (``PRESENTATION_FIELDS``: identificação do
+projeto e rótulo da combinação ELS) não participam de ``==``, ``hash`` nem
+de ``content_hash``. Assim, duas sessões com os mesmos dados de engenharia
+e projetos diferentes têm a mesma chave em qualquer cache de resultados,
+memoriais ou exportações.
+"""
+
+from __future__ import annotations
+
+from dataclasses import asdict, dataclass, field, fields
+import hashlib
+import json
+import math
+from types import MappingProxyType
+from typing import Mapping
+
+from calculos_nbr8800_2024 import VariableAction
+
+
+DESIGN_INPUT_FORMAT = 1
+SUPPORTS = ("Bi-apoiada", "Engastada e Livre (Balanço)", "Bi-engastada", "Engastada e Apoiada")
+INPUT_MODES = ("Calcular a partir de Cargas na Viga", "Inserir Esforços Manualmente")
+ELS_COMBINATIONS = ("rare", "frequent", "quasi_permanent", "variable_only")
+PRESENTATION_FIELDS = ("projeto_info", "els_combination_text")
+# Chaves de ``input_params`` recalculadas por ``to_params``.
+DERIVED_PARAMS = (
+    "q_serv_kn_cm", "p_load_serv", "larg_inf_total_m", "elu_combination_text",
+    "detalhes_esforcos_memorial", "detalhes_cb_memorial",
+)
+# Triagem de aplicabilidade da barra lateral: campo, valor padrão e o motivo
+# registrado quando o campo difere do padrão.
+SCOPE_FLAGS = (
+    ("scope_axial_torsion", False, "Interação com força axial/torção/flexão biaxial não verificada por este módulo."),
+    ("scope_openings", False, "Aberturas na alma exigem o Anexo F e não foram modeladas."),
+    ("scope_fatigue", False, "Fadiga aplicável: detalhamento e faixa de tensões do Anexo H não informados."),
+    ("scope_vibration", False, "Vibrações aplicáveis: avaliação do Anexo I não realizada."),
+    ("scope_external", False, "Situação fora do escopo à temperatura ambiente de perfis laminados/soldados."),
+    (
+        "material_qualified", True,
+        "Qualificação estrutural do aço e requisitos efetivamente medidos de 4.6.2.2.1 não confirmados.",
+    ),
+    (
+        "support_torsion_restrained", True,
+        "5.7.8 exige enrijecedores nos apoios/extremidades declarados sem restrição torcional e com alma livre.",
+    ),
+)
+MANUAL_CB_REASON = "Cb manual sem origem documentada por análise de estabilidade ou procedimento técnico aceito."
+# Fração de L tolerada nas comparações de posições ao longo da viga.
+POSITION_TOLERANCE = 1e-9
+
+
+def _number(name: str, value) -> float:
+    try:
+        number = float(value)
+    except (TypeError, ValueError):
+        raise ValueError(f"{name} deve ser numérico, não {value!r}.") from None
+    if not math.isfinite(number):
+        raise ValueError(f"{name} deve ser finito.")
+    return number + 0.0  # -0.0 vira 0.0: o hash não distingue o sinal do zero.
+
+
+def _variable_action(value) -> VariableAction:
+    if isinstance(value, VariableAction):
+        value = asdict(value)
+    if not isinstance(value, Mapping):
+        raise ValueError("Cada ação variável deve ser uma VariableAction ou um dicionário.")
+    action = dict(value)
+    if "name" not in action:
+        raise ValueError("Cada ação variável precisa de um nome (name).")
+    unknown = set(action) - {item.name for item in fields(VariableAction)}
+    if unknown:
+        raise ValueError(f"Campos de ação variável desconhecidos: {', '.join(sorted(unknown))}.")
+    return VariableAction(
+        name=str(action.pop("name")).strip(),
+        **{key: _number(f"Ação variável {key}", item) for key, item in action.items()},
+    )
+
+
+def scope_reasons(flags: Mapping[str, bool], params: Mapping) -> list[str]:
+    """Motivos de ``unsupported_reasons`` para a triagem ``flags`` e os dados ``params``.
+
+    ``flags`` usa os nomes de ``SCOPE_FLAGS`` (ausentes valem o padrão);
+    ``params`` precisa de ``tipo_viga``, ``flt_applicable``, ``cb_modo_auto``,
+    ``cantilever_standard_cb`` e ``cb_source``. Com FLT aplicável e Cb
+    manual fora do balanço padrão de 5.4.2.3-b, falta de origem do Cb
+    acrescenta ``MANUAL_CB_REASON``.
+    """
+    reasons = [reason for name, default, reason in SCOPE_FLAGS if bool(flags.get(name, default)) != default]
+    standard_cantilever_cb = params["tipo_viga"] == SUPPORTS[1] and params["cantilever_standard_cb"]
+    if (
+        params["flt_applicable"] and not params["cb_modo_auto"] and not standard_cantilever_cb
+        and not str(params["cb_source"]).strip()
+    ):
+        reasons.append(MANUAL_CB_REASON)
+    return reasons
+
+
+@dataclass(frozen=True)
+class DesignInput:
+    """Dados de uma verificação, com os nomes e unidades de ``input_params``.
+
+    A construção normaliza os tipos e levanta ``ValueError`` para opções
+    desconhecidas, números não finitos e geometria ou cargas incoerentes.
+    """
+
+    tipo_viga: str = "Bi-apoiada"
+    L_cm: float = 500.0
+    input_mode: str = INPUT_MODES[0]
+    Msd: float = 0.0
+    Vsd: float = 0.0
+    q_g_kn_cm: float = 0.0
+    q_q_kn_cm: float = 0.0
+    larg_esq_cm: float = 0.0
+    larg_dir_cm: float = 0.0
+    g_area: float = 0.0
+    q_area: float = 0.0
+    p_g_kn: float = 0.0
+    p_q_kn: float = 0.0
+    p_pos_cm: float | None = None
+    point_bearing_cm: float = 10.0
+    fy_aco: float = 34.5
+    fu_aco: float = 45.0
+    E_aco: float = 20_000.0
+    has_tension_flange_holes: bool = False
+    tension_flange_net_ratio: float = 1.0
+    Lb_projeto: float | None = None
+    lb_start_cm: float = 0.0
+    Cb_projeto: float = 1.0
+    flt_applicable: bool = True
+    cb_modo_auto: bool = False
+    cb_source: str = ""
+    cantilever_standard_cb: bool = True
+    usa_enrijecedores: bool = False
+    a_enr: float = 0.0
+    stiffener_width: float | None = None
+    stiffener_thickness: float | None = None
+    stiffener_pair: bool = True
+    stiffener_welded: bool = False
+    bearing_left_cm: float = 10.0
+    bearing_right_cm: float = 10.0
+    support_relative_lateral_restrained: bool = True
+    point_relative_lateral_restrained: bool = False
+    loaded_flange_rotation_restrained: bool = False
+    local_unbraced_cm: float | None = None
+    weld_root_cm: float = 0.0
+    limite_flecha_divisor: float = 350.0
+    masonry_on_beam: bool = False
+    include_self_weight: bool = True
+    gamma_g: float = 1.50
+    gamma_q: float = 1.50
+    gamma_self_weight: float = 1.25
+    els_combination: str = "rare"
+    psi1: float = 0.6
+    psi2: float = 0.4
+    manual_local_checks_confirmed: bool = False
+    combination_envelope: bool = False
+    variable_actions: tuple[VariableAction, ...] = ()
+    els_combinations: tuple[str, ...] = ("rare", "frequent", "quasi_permanent")
+    unsupported_reasons: tuple[str, ...] = ()
+    scope_notes: tuple[str, ...] = ()
+    projeto_info: Mapping[str, str] = field(default_factory=dict, compare=False)
+    els_combination_text: str = field(default="Rara: G + Q principal", compare=False)
+
+    def __post_init__(self):
+        values = {}
+        for item in fields(self):
+            value = getattr(self, item.name)
+            if item.name == "projeto_info":
+                value = MappingProxyType({str(key): str(text) for key, text in dict(value or {}).items()})
+            elif item.name == "variable_actions":
+                value = tuple(_variable_action(action) for action in value or ())
+            elif item.type.startswith("tuple"):
+                value = tuple(str(text) for text in (value or ()))
+            elif item.type == "bool":
+                value = bool(value)
+            elif item.type == "str":
+                value = str(value).strip()
+            elif value is not None or item.type == "float":
+                value = _number(item.name, value)
+            values[item.name] = value
+
+        L_cm = values["L_cm"]
+        if values["Lb_projeto"] is None:
+            values["Lb_projeto"] = L_cm
+        if values["local_unbraced_cm"] is None:
+            values["local_unbraced_cm"] = values["Lb_projeto"]
+        if values["p_pos_cm"] is None:
+            values["p_pos_cm"] = L_cm / 2.0
+        for name, value in values.items():
+            object.__setattr__(self, name, value)
+        self._validate()
+
+    def _validate(self) -> None:
+        if self.tipo_viga not in SUPPORTS:
+            raise ValueError(f"Tipo de viga desconhecido: {self.tipo_viga}.")
+        if self.input_mode not in INPUT_MODES:
+            raise ValueError(f"Método de entrada desconhecido: {self.input_mode}.")
+        if self.els_combination not in ELS_COMBINATIONS:
+            raise ValueError(f"Combinação ELS desconhecida: {self.els_combination}.")
+        positive = (
+            "L_cm", "E_aco", "fy_aco", "fu_aco", "Lb_projeto", "Cb_projeto", "point_bearing_cm",
+            "bearing_left_cm", "bearing_right_cm", "local_unbraced_cm", "limite_flecha_divisor",
+            "gamma_g", "gamma_q", "gamma_self_weight",
+        )
+        for name in positive:
+            if getattr(self, name) <= 0:
+                raise ValueError(f"{name} deve ser positivo.")
+        not_negative = (
+            "Msd", "Vsd", "q_g_kn_cm", "q_q_kn_cm", "larg_esq_cm", "larg_dir_cm", "g_area", "q_area",
+            "p_g_kn", "p_q_kn", "lb_start_cm", "weld_root_cm",
+        )
+        for name in not_negative:
+            if getattr(self, name) < 0:
+                raise ValueError(f"{name} não pode ser negativo.")
+        slack = POSITION_TOLERANCE * self.L_cm
+        if self.Lb_projeto > self.L_cm + slack or self.lb_start_cm + self.Lb_projeto > self.L_cm + slack:
+            raise ValueError("O trecho destravado deve caber no vão.")
+        if not 0.0 <= self.p_pos_cm <= self.L_cm + slack:
+            raise ValueError("A força pontual deve estar dentro do vão.")
+        if not 0.0 < self.tension_flange_net_ratio <= 1.0:
+            raise ValueError("A relação Afn/Afg deve estar em (0, 1].")
+        if not (0.0 <= self.psi2 <= self.psi1 <= 1.0):
+            raise ValueError("Os fatores devem atender 0 ≤ ψ2 ≤ ψ1 ≤ 1.")
+        if self.usa_enrijecedores and self.a_enr <= 0:
+            raise ValueError("Com enrijecedores, o espaçamento a deve ser positivo.")
+        unknown = set(self.els_combinations) - set(ELS_COMBINATIONS)
+        if unknown:
+            raise ValueError(f"Combinações ELS desconhecidas: {', '.join(sorted(unknown))}.")
+
+    @classmethod
+    def from_params(cls, input_params: dict) -> "DesignInput":
+        """Modelo a partir de ``input_params``; as chaves derivadas são recalculadas.
+
+        Chaves que não são campos nem ``DERIVED_PARAMS`` levantam ``ValueError``.
+        """
+        names = {item.name for item in fields(cls)}
+        unknown = set(input_params) - names - set(DERIVED_PARAMS)
+        if unknown:
+            raise ValueError(f"Dados de projeto desconhecidos: {', '.join(sorted(unknown))}.")
+        return cls(**{name: value for name, value in input_params.items() if name in names})
+
+    def to_params(self) -> dict:
+        """Dicionário ``input_params`` completo, com as chaves derivadas."""
+        params = {item.name: getattr(self, item.name) for item in fields(self)}
+        params["projeto_info"] = dict(self.projeto_info)
+        for name in ("variable_actions", "els_combinations", "unsupported_reasons", "scope_notes"):
+            params[name] = list(params[name])
+        point_load = self.p_g_kn + self.p_q_kn
+        params.update(
+            q_serv_kn_cm=self.q_g_kn_cm + self.q_q_kn_cm,
+            p_load_serv=(point_load, self.p_pos_cm) if point_load > 0 else None,
+            larg_inf_total_m=(self.larg_esq_cm + self.larg_dir_cm) / 200.0,
+            elu_combination_text=(
+                f"{_compact(self.gamma_g)}·G + {_compact(self.gamma_self_weight)}·PP aço + {_compact(self.gamma_q)}·Q"
+            ),
+            detalhes_esforcos_memorial={
+                "input_mode": self.input_mode, "Msd": self.Msd, "Vsd": self.Vsd, "L_cm": self.L_cm,
+            },
+            detalhes_cb_memorial=None,
+        )
+        return params
+
+    def canonical(self) -> dict:
+        """Campos de engenharia em forma JSON, base de ``content_hash``."""
+        values = {}
+        for item in fields(self):
+            if item.name in PRESENTATION_FIELDS:
+                continue
+            value = getattr(self, item.name)
+            if item.name == "variable_actions":
+                value = [asdict(action) for action in value]
+            values[item.name] = list(value) if isinstance(value, tuple) else value
+        return {"format": DESIGN_INPUT_FORMAT, "fields": values}
+
+    @property
+    def content_hash(self) -> str:
+        """SHA-256 dos campos de engenharia, estável entre processos e sessões."""
+        text = json.dumps(self.canonical(), sort_keys=True, ensure_ascii=False, separators=(",", ":"))
+        return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def _compact(value: float) -> str:
+    # Mesmo formato de ``compact_number(valor, 2)`` em ``main``.
+    return f"{round(value, 2) + 0.0:.2f}".rstrip("0").rstrip(".")
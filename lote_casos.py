@@ -0,0 +1,312 @@
+"""Verificação do catálogo para arquivos de casos de projeto, sem a interface.
+
+Cada caso (uma linha de CSV ou um objeto de uma lista JSON) traz os mesmos
+dados que a barra lateral de ``main`` monta em ``input_params``: vinculação,
+vão, ações Gk/Qk por área e larguras de influência, força pontual, material,
+Lb, modo de Cb e enrijecedores. Campos ausentes assumem os valores iniciais
+da barra lateral (``CASE_DEFAULTS``) e as derivações dela: Lb = L, ℓ = Lb,
+força pontual no meio do vão e cargas distribuídas a partir de Gk, Qk e das
+larguras, salvo quando ``q_g_kn_cm``/``q_q_kn_cm`` são informados.
+
+A triagem de aplicabilidade usa os campos de ``SCOPE_FLAGS`` (aço
+qualificado por padrão só para os materiais de ``MATERIALS``) e a origem do
+Cb manual (``cb_source``); ``unsupported_reasons`` sai de
+``entrada_projeto.scope_reasons``, como na barra lateral. Para a envoltória
+(``combination_envelope``), ``variable_actions`` é uma lista JSON de objetos
+com os campos de ``VariableAction``.
+
+``run_cases`` valida todos os casos antes de começar, distribui um caso por
+tarefa entre os processos e grava as linhas de ``evaluate_catalog`` de cada
+caso em CSV ou Parquet assim que ele termina; a ordem das linhas no arquivo
+é a de conclusão, identificada pela coluna ``Caso``.
+
+Uso: ``python lote_casos.py casos.csv resultados.parquet``.
+"""
+
+from __future__ import annotations
+
+import argparse
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+import json
+import math
+import os
+from pathlib import Path
+
+import pandas as pd
+
+from analise_catalogo import (
+    AUTOMATIC_INPUT_MODE, CANTILEVER, COMBINATION_COLUMNS, EFFICIENCY_COLUMNS, ProfileTable,
+    evaluate_catalog,
+)
+from catalogo_binario import DEFAULT_WORKBOOK, load_catalog
+from entrada_projeto import SCOPE_FLAGS, DesignInput, scope_reasons
+
+
+MATERIALS = {"ASTM A572 Grau 50": (34.5, 45.0), "ASTM A36": (25.0, 40.0)}
+OUTPUT_FORMATS = (".csv", ".parquet")
+
+# Valores iniciais da barra lateral de ``main``.
+CASE_DEFAULTS = dict(
+    tipo_viga="Bi-apoiada", L_cm=500.0, input_mode=AUTOMATIC_INPUT_MODE, Msd=0.0, Vsd=0.0,
+    larg_esq_cm=200.0, larg_dir_cm=200.0, g_area=1.5, q_area=3.0,
+    p_g_kn=0.0, p_q_kn=0.0, point_bearing_cm=10.0,
+    fy_aco=34.5, fu_aco=45.0, E_aco=20_000.0,
+    has_tension_flange_holes=False, tension_flange_net_ratio=1.0,
+    lb_start_cm=0.0, Cb_projeto=1.0, flt_applicable=True, cb_modo_auto=True, cb_source="",
+    cantilever_standard_cb=True,
+    usa_enrijecedores=False, a_enr=0.0, stiffener_welded=False,
+    bearing_left_cm=10.0, bearing_right_cm=10.0, support_relative_lateral_restrained=True,
+    point_relative_lateral_restrained=False, loaded_flange_rotation_restrained=False,
+    weld_root_cm=0.0, limite_flecha_divisor=350.0, masonry_on_beam=False,
+    include_self_weight=True, gamma_g=1.50, gamma_q=1.50, gamma_self_weight=1.25,
+    els_combination="rare", psi1=0.6, psi2=0.4, combination_envelope=False, variable_actions=(),
+    manual_local_checks_confirmed=False,
+)
+# Triagem de aplicabilidade: não vai a ``DesignInput``, vira ``unsupported_reasons``.
+SCOPE_DEFAULTS = {name: default for name, default, _ in SCOPE_FLAGS}
+# Campos cujo padrão depende de outros campos do caso.
+DERIVED_FIELDS = dict(
+    Lb_projeto=float, local_unbraced_cm=float, p_pos_cm=float, q_g_kn_cm=float, q_q_kn_cm=float,
+    stiffener_width=float, stiffener_thickness=float, material=str,
+)
+TRUE_TEXT = ("1", "true", "sim", "s", "yes", "y")
+FALSE_TEXT = ("0", "false", "não", "nao", "n", "no")
+
+_worker_table: ProfileTable | None = None
+
+
+def _is_missing(value) -> bool:
+    return value is None or (isinstance(value, float) and math.isnan(value)) or value == ""
+
+
+def _convert(name: str, kind: type, value):
+    if kind is bool:
+        if isinstance(value, str):
+            text = value.strip().lower()
+            if text in TRUE_TEXT or text in FALSE_TEXT:
+                return text in TRUE_TEXT
+        elif value in (0, 1):
+            return bool(value)
+        raise ValueError(f"{name} deve ser verdadeiro ou falso, não {value!r}.")
+    if kind is tuple:
+        if isinstance(value, str):
+            try:
+                value = json.loads(value)
+            except json.JSONDecodeError:
+                raise ValueError(f"{name} deve ser uma lista JSON.") from None
+        if not isinstance(value, (list, tuple)):
+            raise ValueError(f"{name} deve ser uma lista, não {value!r}.")
+        return tuple(value)
+    if kind is float:
+        try:
+            # Aceita a vírgula decimal de planilhas em português.
+            number = float(value.replace(",", ".")) if isinstance(value, str) else float(value)
+        except (TypeError, ValueError):
+            raise ValueError(f"{name} deve ser numérico, não {value!r}.") from None
+        if not math.isfinite(number):
+            raise ValueError(f"{name} deve ser finito.")
+        return number
+    return str(value).strip()
+
+
+def case_params(case: dict) -> dict:
+    """``input_params`` de um caso, com padrões e derivações da barra lateral.
+
+    Campos desconhecidos, valores não numéricos e materiais fora de
+    ``MATERIALS`` (sem ``fy_aco``/``fu_aco``) levantam ``ValueError``, assim
+    como os dados que ``DesignInput`` rejeita.
+    """
+    values = {}
+    for name, value in case.items():
+        if name == "caso" or _is_missing(value):
+            continue
+        if name in CASE_DEFAULTS:
+            kind = type(CASE_DEFAULTS[name])
+        elif name in DERIVED_FIELDS:
+            kind = DERIVED_FIELDS[name]
+        elif name in SCOPE_DEFAULTS:
+            kind = bool
+        else:
+            raise ValueError(f"Campo desconhecido: {name}.")
+        values[name] = _convert(name, kind, value)
+
+    scope = {name: values.pop(name) for name in list(values) if name in SCOPE_DEFAULTS}
+    material = values.pop("material", None)
+    if material is not None:
+        if material not in MATERIALS:
+            if "fy_aco" not in values or "fu_aco" not in values:
+                raise ValueError(f"Material {material!r} desconhecido; informe fy_aco e fu_aco.")
+        else:
+            values = dict(zip(("fy_aco", "fu_aco"), MATERIALS[material])) | values
+    params = dict(CASE_DEFAULTS, **values)
+    # Como a barra lateral: só os aços de ``MATERIALS`` nascem com a qualificação confirmada.
+    scope.setdefault("material_qualified", (
+        material in MATERIALS if material is not None
+        else (params["fy_aco"], params["fu_aco"]) in MATERIALS.values()
+    ))
+    larg_inf_total_m = (params["larg_esq_cm"] + params["larg_dir_cm"]) / 200.0
+    params.setdefault("q_g_kn_cm", params["g_area"] * larg_inf_total_m / 100.0)
+    params.setdefault("q_q_kn_cm", params["q_area"] * larg_inf_total_m / 100.0)
+    # Como o checkbox da barra lateral: Cb automático só com cargas na viga e FLT aplicável.
+    params["cb_modo_auto"] = (
+        params["cb_modo_auto"] and params["input_mode"] == AUTOMATIC_INPUT_MODE
+        and params["flt_applicable"] and params["tipo_viga"] != CANTILEVER
+    )
+    if params["tipo_viga"] == CANTILEVER and params["cantilever_standard_cb"]:
+        params["Cb_projeto"] = 1.0
+    params["unsupported_reasons"] = scope_reasons(scope, params)
+    # DesignInput valida o caso e completa Lb, ℓ e a posição da força pontual.
+    return DesignInput.from_params(params).to_params()
+
+
+def read_cases(path: str | Path) -> list[dict]:
+    """Casos de um CSV (separador detectado) ou de uma lista JSON de objetos."""
+    path = Path(path)
+    if path.suffix.lower() == ".json":
+        cases = json.loads(path.read_text(encoding="utf-8"))
+        if not isinstance(cases, list) or not all(isinstance(case, dict) for case in cases):
+            raise ValueError("O arquivo JSON deve conter uma lista de casos.")
+        return cases
+    frame = pd.read_csv(
+        path, sep=None, engine="python", dtype=str, keep_default_na=False, encoding="utf-8-sig",
+    )
+    return frame.to_dict("records")
+
+
+def output_columns(cases: list[dict]) -> tuple[str, ...]:
+    """Colunas gravadas: as de ``evaluate_catalog`` para o conjunto de casos, após ``Caso``."""
+    columns = ("Caso", "Tipo", "Perfil", "Peso (kg/m)", "Status") + EFFICIENCY_COLUMNS
+    columns += ("Estado-limite governante",)
+    if any(params["combination_envelope"] and params["input_mode"] == AUTOMATIC_INPUT_MODE for params in cases):
+        columns += COMBINATION_COLUMNS + ("Combinação governante",)
+    return columns + ("Observação",)
+
+
+def _init_worker(table: ProfileTable) -> None:
+    global _worker_table
+    _worker_table = table
+
+
+def _check_case(case_id: str, params: dict, columns: tuple, approved_only: bool) -> pd.DataFrame:
+    frame = evaluate_catalog(params, _worker_table)
+    if approved_only:
+        frame = frame[frame["Status"] == "APROVADO"]
+    frame = frame.reindex(columns=columns)
+    frame["Caso"] = case_id
+    # Tipos fixos: todos os lotes gravados têm o mesmo esquema.
+    for name in columns:
+        if name != "Peso (kg/m)" and not name.startswith("Ef."):
+            frame[name] = frame[name].astype(object).where(frame[name].notna(), None)
+    return frame
+
+
+def _open_writer(output: Path, columns: tuple):
+    """Funções ``(write, close)`` que acrescentam DataFrames a ``output``."""
+    if output.suffix.lower() == ".csv":
+        handle = open(output, "w", encoding="utf-8", newline="")
+        pd.DataFrame(columns=list(columns)).to_csv(handle, index=False)
+
+        def write(frame):
+            frame.to_csv(handle, header=False, index=False)
+            handle.flush()
+
+        return write, handle.close
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError:
+        raise ValueError("A gravação em Parquet requer o pacote pyarrow.") from None
+    schema = pa.schema([
+        (name, pa.float64() if name == "Peso (kg/m)" or name.startswith("Ef.") else pa.string())
+        for name in columns
+    ])
+    writer = pq.ParquetWriter(output, schema)
+
+    def write(frame):
+        writer.write_table(pa.Table.from_pandas(frame, schema=schema, preserve_index=False))
+
+    return write, writer.close
+
+
+def run_cases(
+    cases: list[dict],
+    output: str | Path,
+    all_sheets: dict | ProfileTable | None = None,
+    workers: int | None = None,
+    approved_only: bool = False,
+    progress=None,
+) -> int:
+    """Verifica o catálogo para cada caso e grava as linhas em ``output``; devolve quantas.
+
+    O formato vem da extensão (``.csv`` ou ``.parquet``). ``workers`` é o
+    número de processos (padrão: todos os núcleos; 1 avalia no próprio
+    processo), com no máximo o dobro de casos em andamento. Com
+    ``approved_only`` só os perfis APROVADOS são gravados. ``progress``
+    recebe ``(concluídos, total)`` a cada caso.
+    """
+    output = Path(output)
+    if output.suffix.lower() not in OUTPUT_FORMATS:
+        raise ValueError("A saída deve ser um arquivo .csv ou .parquet.")
+    tasks = []
+    for index, case in enumerate(cases, start=1):
+        case_id = case.get("caso")
+        case_id = str(index) if _is_missing(case_id) else str(case_id)
+        try:
+            tasks.append((case_id, case_params(case)))
+        except ValueError as exc:
+            raise ValueError(f"Caso {case_id}: {exc}") from None
+    columns = output_columns([params for _, params in tasks])
+    if all_sheets is None:
+        all_sheets = load_catalog(DEFAULT_WORKBOOK)
+    table = all_sheets if isinstance(all_sheets, ProfileTable) else ProfileTable.from_sheets(all_sheets)
+    workers = workers or os.cpu_count() or 1
+
+    write, close = _open_writer(output, columns)
+    written = 0
+    done = 0
+
+    def store(frame):
+        nonlocal written, done
+        write(frame)
+        written += len(frame)
+        done += 1
+        if progress is not None:
+            progress(done, len(tasks))
+
+    try:
+        if workers == 1:
+            _init_worker(table)
+            for case_id, params in tasks:
+                store(_check_case(case_id, params, columns, approved_only))
+        else:
+            with ProcessPoolExecutor(workers, initializer=_init_worker, initargs=(table,)) as pool:
+                pending = set()
+                for case_id, params in tasks:
+                    pending.add(pool.submit(_check_case, case_id, params, columns, approved_only))
+                    if len(pending) >= 2 * workers:
+                        finished, pending = wait(pending, return_when=FIRST_COMPLETED)
+                        for future in finished:
+                            store(future.result())
+                while pending:
+                    finished, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in finished:
+                        store(future.result())
+    finally:
+        close()
+    return written
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Verifica o catálogo para um arquivo de casos de projeto.")
+    parser.add_argument("cases", type=Path, help="CSV ou lista JSON de casos")
+    parser.add_argument("output", type=Path, help="arquivo .csv ou .parquet de resultados")
+    parser.add_argument("--workers", type=int)
+    parser.add_argument("--approved-only", action="store_true", help="grava só os perfis APROVADOS")
+    parser.add_argument("--catalog", type=Path, default=DEFAULT_WORKBOOK, help="planilha de perfis")
+    arguments = parser.parse_args()
+    cases = read_cases(arguments.cases)
+    rows = run_cases(
+        cases, arguments.output, load_catalog(arguments.catalog), arguments.workers,
+        arguments.approved_only,
+    )
+    print(f"{len(cases)} casos, {rows} linhas gravadas em {arguments.output}")
@@ -4,26 +4,26 @@ import math
 import plotly.graph_objects as go
 from datetime import datetime
 import io
+import time
+import threading
 import openpyxl
 from openpyxl.styles import PatternFill
 import base64
 import pytz
 from pathlib import Path
+from collections import OrderedDict
+from types import MappingProxyType
 from calculos_nbr8800_2024 import (
     ERRATA,
     NORMA,
-    analyze_beam,
-    calculate_cb as calculate_cb_nbr2024,
-    combine_els,
-    combine_elu_normal,
-    deflection_limit,
-    flexural_strength_i,
-    local_compression_strength,
-    overall_status,
-    shear_strength_i,
     validate_material,
 )
-from memorial_nbr8800_2024 import build_memorial_details
+from verificacao_nbr8800_2024 import perform_all_checks
+from analise_catalogo import (
+    EvaluationCache, ProfileTable, evaluate_catalog, lightest_profiles, make_catalog_executor,
+)
+from catalogo_binario import load_catalog
+from entrada_projeto import DesignInput, scope_reasons
 # ==============================================================================
 # 1. CONFIGURAÇÕES E CONSTANTES GLOBAIS APRIMORADAS
 # ==============================================================================
@@ -51,13 +51,6 @@ PROFILE_TYPE_MAP = {
     "VS": "Perfis Soldados"
 }
 
-PROFILE_FABRICATION_MAP = {
-    "Laminados": "Laminado",
-    "CS": "Soldado",
-    "CVS": "Soldado",
-    "VS": "Soldado",
-}
-
 
 def compact_number(value, max_decimals=3):
     """Formata valores exibidos sem zeros decimais que não agregam precisão."""
@@ -695,12 +688,17 @@ HTML_TEMPLATE_CSS_PRO = """
 # 2. FUNÇÕES DE CÁLCULO E UTILITÁRIAS
 # ==============================================================================
 
-@st.cache_data
+@st.cache_resource
 def load_data_from_local_file():
-    """Carrega os dados da planilha de perfis."""
+    """Carrega os dados da planilha de perfis (pelo catálogo compilado, se atualizado).
+
+    Carregado uma vez por processo, serve apenas para montar o
+    ``ProfileTable`` de ``load_profile_table``: as sessões recebem as colunas
+    somente leitura da tabela, nunca estes DataFrames compartilhados.
+    """
     try:
         caminho_arquivo_excel = Path(__file__).resolve().with_name('perfis.xlsx')
-        return pd.read_excel(caminho_arquivo_excel, sheet_name=None)
+        return MappingProxyType(load_catalog(caminho_arquivo_excel))
     except FileNotFoundError:
         st.error(f"Erro: Arquivo '{caminho_arquivo_excel}' não foi encontrado. Verifique se ele está na mesma pasta que o seu script Python.")
         return None
@@ -708,6 +706,58 @@ def load_data_from_local_file():
         st.error(f"Erro ao ler o arquivo Excel: {e}")
         return None
 
+@st.cache_resource
+def load_profile_table():
+    """Catálogo em colunas somente leitura, montado uma vez por processo e compartilhado entre as sessões."""
+    all_sheets = load_data_from_local_file()
+    return ProfileTable.from_sheets(all_sheets) if all_sheets else None
+
+
+@st.cache_resource
+def load_catalog_executor():
+    """Pool de processos da análise em lote, mantido entre sessões e reexecuções."""
+    return make_catalog_executor()
+
+
+RESULTS_CACHE_SIZE = 32
+
+@st.cache_resource
+def load_results_cache():
+    """Resultados da análise em lote compartilhados entre sessões.
+
+    A chave é o ``DesignInput.content_hash`` dos dados com as faixas de
+    pré-seleção: projetos com os mesmos dados de engenharia reaproveitam o
+    mesmo DataFrame. É uma LRU de ``RESULTS_CACHE_SIZE`` entradas protegida
+    por uma trava, como em ``analise_catalogo.EvaluationCache``; cada sessão
+    recebe uma cópia, e o DataFrame guardado nunca é alterado.
+    """
+    return OrderedDict(), threading.Lock()
+
+
+@st.cache_resource
+def load_evaluation_cache():
+    """Capacidades e demandas da avaliação do catálogo, reaproveitadas entre reexecuções.
+
+    Ajustar só g_area ou q_area recalcula as demandas; as resistências dos
+    perfis vêm do cache (``analise_catalogo.EvaluationCache``).
+    """
+    return EvaluationCache()
+
+
+def load_catalog_resources():
+    """Catálogo compartilhado e custo do acesso medido a cada reexecução do script."""
+    start = time.perf_counter()
+    profile_table = load_profile_table()
+    elapsed_ms = (time.perf_counter() - start) * 1000.0
+    stats = st.session_state.setdefault(
+        'catalog_access', {'reruns': 0, 'last_ms': 0.0, 'total_ms': 0.0, 'max_ms': 0.0}
+    )
+    stats['reruns'] += 1
+    stats['last_ms'] = elapsed_ms
+    stats['total_ms'] += elapsed_ms
+    stats['max_ms'] = max(stats['max_ms'], elapsed_ms)
+    return profile_table
+
 def calcular_esforcos_viga(tipo_viga, L_cm, q_kn_cm=0, p_load=None):
     msd_q, vsd_q, msd_p, vsd_p = 0, 0, 0, 0
     L = L_cm
@@ -913,41 +963,6 @@ def calcular_flecha_maxima(tipo_viga, L_cm, E, Ix, q_serv_kn_cm=0, p_serv_load=N
     detalhes['delta_total'] = delta_q + delta_p
     return detalhes
 
-def get_profile_properties(profile_series):
-    props = {
-        "d": profile_series.get('d (mm)'),
-        "bf": profile_series.get('bf (mm)'),
-        "tw": profile_series.get('tw (mm)'),
-        "tf": profile_series.get('tf (mm)'),
-        # h_faces é a distância entre faces internas; d' desconta os raios nos laminados.
-        "h_faces": profile_series.get('h (mm)'),
-        "h_clear": profile_series.get("d' (mm)", profile_series.get('h (mm)')),
-        "Area": profile_series.get('Área (cm2)'),
-        "Ix": profile_series.get('Ix (cm4)'),
-        "Wx": profile_series.get('Wx (cm3)'),
-        "rx": profile_series.get('rx (cm)'),
-        "Zx": profile_series.get('Zx (cm3)'),
-        "Iy": profile_series.get('Iy (cm4)'),
-        "Wy": profile_series.get('Wy (cm3)'),
-        "ry": profile_series.get('ry (cm)'),
-        "Zy": profile_series.get('Zy (cm3)'),
-        "rt": profile_series.get('rt (cm)'),
-        "J": profile_series.get('It (cm4)'),
-        "Cw": profile_series.get('Cw (cm6)'),
-        "Peso": profile_series.get('Massa Linear (kg/m)', profile_series.get('Peso (kg/m)')),
-    }
-    required_keys = ["d", "bf", "tw", "tf", "h_faces", "h_clear", "Area", "Ix", "Wx", "rx", "Zx", "Iy", "ry", "J", "Cw", "Peso"]
-    profile_name = profile_series.get('Bitola (mm x kg/m)', 'Perfil Desconhecido')
-    for key in required_keys:
-        value = props.get(key)
-        if value is None or pd.isna(value) or (isinstance(value, (int, float)) and value <= 0):
-            raise ValueError(f"Propriedade ESSENCIAL '{key}' inválida ou nula no Excel para '{profile_name}'. Verifique a planilha.")
-    for key in ['d', 'bf', 'tw', 'tf', 'h_faces', 'h_clear']:
-        props[key] /= 10.0
-    # Alias mantido apenas para blocos legados de apresentação.
-    props['h'] = props['h_clear']
-    return props
-
 def _calcular_mrdx_flt(props, Lb, Cb, fy, E):
     Zx, ry, Iy, Cw, J, Wx = props['Zx'], props['ry'], props['Iy'], props['Cw'], props['J'], props['Wx']
     detalhes = {'passos_calculo': [], 'passos_verificacao': []}
@@ -1995,15 +2010,6 @@ def _render_esforcos_viga_section(params):
 
     return html
 
-def _verification_status(demand, resistance, applicable=True):
-    if not applicable:
-        return 0.0, "N/A"
-    if resistance is None or resistance <= 0:
-        return float('inf'), "NÃO VERIFICADO"
-    efficiency = demand / resistance * 100.0
-    return efficiency, "APROVADO" if demand <= resistance else "REPROVADO"
-
-
 def _memorial_2024_html_legacy_summary(bundle):
     """Resumo anterior preservado apenas como referência histórica interna."""
     """Memorial autocontido, com hipóteses, rastreabilidade e resultados por ELU/ELS."""
@@ -2114,208 +2120,6 @@ def _memorial_2024_html_legacy_summary(bundle):
     """
 
 
-def _memorial_2024_html(bundle):
-    """Renderiza o memorial auditável com os dados do núcleo normativo."""
-    return build_memorial_details(bundle)
-
-
-def perform_all_checks(props, fy_aco, Lb_projeto, Cb_projeto, L_cm, Msd, Vsd, q_serv_kn_cm, p_load_serv, tipo_viga, input_mode, tipo_fabricacao, usa_enrijecedores, a_enr, limite_flecha_divisor, projeto_info, E_aco, detalhado=False, fu_aco=45.0, **kwargs):
-    automatic = input_mode == "Calcular a partir de Cargas na Viga"
-    scope_issues = list(kwargs.get('unsupported_reasons', []))
-    scope_notes = list(kwargs.get('scope_notes', []))
-    scope_issues.extend(validate_material(fy_aco, fu_aco))
-
-    self_weight = props['Peso'] * 9.80665 / 100_000.0 if kwargs.get('include_self_weight', True) else 0.0
-    elu_response = None
-    els_response = None
-    elu_loads = None
-    els_loads = None
-    point_position = kwargs.get('p_pos_cm', p_load_serv[1] if p_load_serv else L_cm / 2.0)
-    Cb_final = Cb_projeto
-    cb_info = None
-    cb_basis = "Cb informado pelo usuário; a origem deve ser registrada no projeto."
-    if (
-        tipo_viga == 'Engastada e Livre (Balanço)'
-        and kwargs.get('cantilever_standard_cb', False)
-    ):
-        cb_basis = "Cb = 1,0 para a condição de balanço declarada em 5.4.2.3-b."
-    elif kwargs.get('cb_source', '').strip():
-        cb_basis = f"Cb informado pelo usuário. Origem registrada: {kwargs['cb_source'].strip()}."
-
-    if automatic:
-        q_g = kwargs.get('q_g_kn_cm', 0.0)
-        q_q = kwargs.get('q_q_kn_cm', q_serv_kn_cm)
-        p_g = kwargs.get('p_g_kn', 0.0)
-        p_q = kwargs.get('p_q_kn', p_load_serv[0] if p_load_serv else 0.0)
-        elu_loads = combine_elu_normal(
-            q_g, q_q, self_weight, p_g, p_q,
-            gamma_g=kwargs.get('gamma_g', 1.50),
-            gamma_q=kwargs.get('gamma_q', 1.50),
-            gamma_self_weight=kwargs.get('gamma_self_weight', 1.25),
-        )
-        elu_response = analyze_beam(
-            tipo_viga, L_cm, elu_loads['q'], elu_loads['P'], point_position
-        )
-        Msd, Vsd = elu_response.max_moment, elu_response.max_shear
-
-        if kwargs.get('cb_modo_auto', False):
-            cb_info = calculate_cb_nbr2024(
-                elu_response,
-                segment_start=kwargs.get('lb_start_cm', 0.0),
-                unbraced_length=Lb_projeto,
-            )
-            Cb_final = cb_info['Cb']
-            cb_basis = (
-                f"Cálculo automático no trecho x={cb_info['segment_start']/100:.3f} m a "
-                f"x={(cb_info['segment_start']+cb_info['Lb'])/100:.3f} m: "
-                f"|Mmax|={cb_info['Mmax']/100:.3f}, |MA|={cb_info['MA']/100:.3f}, "
-                f"|MB|={cb_info['MB']/100:.3f}, |MC|={cb_info['MC']/100:.3f} kN·m."
-            )
-
-        els_loads = combine_els(
-            q_g, q_q, self_weight, p_g, p_q,
-            combination=kwargs.get('els_combination', 'rare'),
-            psi1=kwargs.get('psi1', 0.6),
-            psi2=kwargs.get('psi2', 0.4),
-        )
-        els_response = analyze_beam(
-            tipo_viga, L_cm, els_loads['q'], els_loads['P'], point_position,
-            E=E_aco, I=props['Ix'],
-        )
-    elif not kwargs.get('manual_local_checks_confirmed', False):
-        scope_issues.append("Modo manual sem reações/forças localizadas e sem verificação ELS.")
-
-    Afg_tension = None
-    Afn_tension = None
-    if kwargs.get('has_tension_flange_holes', False):
-        Afg_tension = props['bf'] * props['tf']
-        Afn_tension = Afg_tension * kwargs.get('tension_flange_net_ratio', 1.0)
-
-    flex = flexural_strength_i(
-        props, fy_aco, fu_aco, E_aco, Lb_projeto, Cb_final, tipo_fabricacao,
-        stiffener_spacing=a_enr if usa_enrijecedores else None,
-        flt_applicable=kwargs.get('flt_applicable', True),
-        net_tension_flange_area=Afn_tension,
-        gross_tension_flange_area=Afg_tension,
-    )
-    scope_issues.extend(flex['applicability_issues'])
-
-    shear = shear_strength_i(
-        props, fy_aco, E_aco,
-        stiffener_spacing=a_enr if usa_enrijecedores else None,
-        stiffener_width=kwargs.get('stiffener_width'),
-        stiffener_thickness=kwargs.get('stiffener_thickness'),
-        stiffener_pair=kwargs.get('stiffener_pair', True),
-        stiffener_welded_to_web_and_flanges=kwargs.get('stiffener_welded', False),
-    )
-
-    flt_eff, flt_status = _verification_status(Msd, flex['Mrd_FLT'], kwargs.get('flt_applicable', True))
-    flm_eff, flm_status = _verification_status(Msd, flex['Mrd_FLM'])
-    fla_eff, fla_status = _verification_status(Msd, flex['Mrd_FLA_or_tension'])
-    rupture_eff, rupture_status = _verification_status(
-        Msd, flex['Mrd_rupture'], flex['Mrd_rupture'] is not None
-    )
-    shear_eff, shear_status = _verification_status(Vsd, shear['Vrd'])
-
-    res_flt = {'Mrdx': flex['Mrd_FLT'] or flex['Mrd'], 'eficiencia': flt_eff, 'status': flt_status, 'core': flex, 'Msd': Msd, 'titulo': 'Flexão — FLT'}
-    res_flt.update({
-        'rupture_Mrd': flex['Mrd_rupture'],
-        'rupture_efficiency': rupture_eff,
-        'rupture_status': rupture_status,
-    })
-    res_flm = {'Mrdx': flex['Mrd_FLM'], 'eficiencia': flm_eff, 'status': flm_status, 'core': flex, 'Msd': Msd, 'titulo': 'Flexão — FLM'}
-    res_fla = {'Mrdx': flex['Mrd_FLA_or_tension'], 'eficiencia': fla_eff, 'status': fla_status, 'core': flex, 'Msd': Msd, 'titulo': 'Flexão — FLA/Anexo E'}
-    res_cis = {'Vrd': shear['Vrd'], 'eficiencia': shear_eff, 'status': shear_status, 'core': shear, 'Vsd': Vsd}
-
-    local_checks = []
-    local_statuses = []
-    if automatic and elu_response:
-        locations = [
-            (
-                "Apoio esquerdo", abs(elu_response.reaction_left),
-                kwargs.get('bearing_left_cm', 10.0), 0.0, 0.0,
-                kwargs.get('support_relative_lateral_restrained', True),
-            ),
-        ]
-        if tipo_viga != 'Engastada e Livre (Balanço)':
-            locations.append((
-                "Apoio direito", abs(elu_response.reaction_right),
-                kwargs.get('bearing_right_cm', 10.0), 0.0, L_cm,
-                kwargs.get('support_relative_lateral_restrained', True),
-            ))
-        if elu_loads['P'] > 0:
-            locations.append((
-                "Carga pontual", elu_loads['P'], kwargs.get('point_bearing_cm', 10.0),
-                min(point_position, L_cm - point_position), point_position,
-                kwargs.get('point_relative_lateral_restrained', True),
-            ))
-        for name, demand, bearing, distance_end, x_load, lateral_restrained in locations:
-            local = local_compression_strength(
-                props, fy_aco, E_aco, bearing, distance_end, tipo_fabricacao,
-                weld_root_or_radius=kwargs.get('weld_root_cm', 0.0),
-                lateral_unbraced_length=kwargs.get('local_unbraced_cm', Lb_projeto),
-                flange_rotation_restrained=kwargs.get('loaded_flange_rotation_restrained', True),
-                relative_lateral_movement_restrained=lateral_restrained,
-                moment_at_load=elu_response.moment_at(x_load),
-            )
-            efficiency, status = _verification_status(demand, local['FRd'])
-            local_checks.append({
-                'name': name, 'demand': demand, 'resistance': local['FRd'],
-                'efficiency': efficiency, 'status': status, 'details': local,
-                'position': x_load, 'bearing_length': bearing,
-            })
-            local_statuses.append(status)
-
-    flecha_max = flecha_limite = eficiencia_flecha = 0.0
-    status_flecha = "N/A"
-    if els_response:
-        absolute_limit = 1.5 if kwargs.get('masonry_on_beam', False) else None
-        flecha_limite = deflection_limit(tipo_viga, L_cm, limite_flecha_divisor, absolute_limit)
-        flecha_max = els_response.max_deflection
-        eficiencia_flecha, status_flecha = _verification_status(flecha_max, flecha_limite)
-    res_flecha = {
-        'flecha_max': flecha_max, 'flecha_limite': flecha_limite,
-        'eficiencia': eficiencia_flecha, 'status': status_flecha,
-        'Ix': props['Ix'], 'detalhes': {}, 'divisor': limite_flecha_divisor,
-        'response': els_response,
-    }
-
-    statuses = [
-        flt_status, flm_status, fla_status, rupture_status,
-        shear_status, status_flecha,
-    ] + local_statuses
-    if scope_issues:
-        statuses.append("NÃO VERIFICADO")
-    status_global = overall_status(statuses)
-    for result in (res_flt, res_flm, res_fla, res_cis, res_flecha):
-        result['status_global'] = status_global
-        result['scope_issues'] = scope_issues
-        result['local_checks'] = local_checks
-
-    bundle = {
-        'Msd': Msd, 'Vsd': Vsd, 'flexure': flex, 'shear': shear,
-        'elu_response': elu_response, 'els_response': els_response,
-        'elu_loads': elu_loads, 'els_loads': els_loads,
-        'elu_combination_text': kwargs.get('elu_combination_text', '1,50·G + 1,25·PP aço + 1,50·Q'),
-        'els_combination_text': kwargs.get('els_combination_text', kwargs.get('els_combination', 'rare')),
-        'Cb': Cb_final, 'Lb': Lb_projeto, 'cb_basis': cb_basis, 'cb_info': cb_info,
-        'props': props, 'fy': fy_aco, 'fu': fu_aco, 'E': E_aco,
-        'fabrication': tipo_fabricacao, 'support': tipo_viga, 'length': L_cm,
-        'input_mode': input_mode, 'point_position': point_position,
-        'self_weight': self_weight, 'gamma_a1': 1.10, 'gamma_a2': 1.35,
-        'influence_left_cm': kwargs.get('larg_esq_cm'),
-        'influence_right_cm': kwargs.get('larg_dir_cm'),
-        'influence_width_m': kwargs.get('larg_inf_total_m'),
-        'g_area': kwargs.get('g_area'), 'q_area': kwargs.get('q_area'),
-        'masonry_on_beam': kwargs.get('masonry_on_beam', False),
-        'local_checks': local_checks,
-        'deflection_limit': flecha_limite, 'deflection_divisor': limite_flecha_divisor,
-        'deflection_efficiency': eficiencia_flecha, 'deflection_status': status_flecha,
-        'scope_notes': scope_notes, 'scope_issues': scope_issues, 'status_global': status_global,
-    }
-    passo_a_passo_html = _memorial_2024_html(bundle) if detalhado else ""
-    return res_flt, res_flm, res_fla, res_cis, res_flecha, passo_a_passo_html
-
 # Substitua a função build_summary_html por esta versão:
 def build_summary_html(Msd, Vsd, res_flt, res_flm, res_fla, res_cisalhamento, res_flecha):
     verificacoes = [
@@ -2554,9 +2358,12 @@ def main():
         st.session_state.analysis_mode = "batch"
     if 'profile_efficiency_chart' not in st.session_state:
         st.session_state.profile_efficiency_chart = None
+    if 'lightest_results' not in st.session_state:
+        st.session_state.lightest_results = None
+        st.session_state.lightest_key = None
 
-    all_sheets = load_data_from_local_file()
-    if not all_sheets:
+    profile_table = load_catalog_resources()
+    if profile_table is None:
         st.stop()
     
     st.markdown(HTML_TEMPLATE_CSS_PRO, unsafe_allow_html=True)
@@ -2770,30 +2577,32 @@ def main():
             limite_flecha_divisor = st.number_input("Divisor personalizado x em L/x", 1.0, value=350.0, step=10.0, key='custom_deflection_divisor')
         masonry_on_beam = st.checkbox("Há alvenaria solidarizada sobre ou sob a viga (limite adicional 15 mm)", value=False, key='masonry_on_beam')
 
-        unsupported_reasons = []
         with st.expander("Triagem de aplicabilidade obrigatória", expanded=False):
             has_axial_torsion = st.checkbox("Há força axial, torção ou flexão biaxial", key='scope_axial_torsion')
             has_web_openings = st.checkbox("Há aberturas na alma", key='scope_openings')
             has_fatigue = st.checkbox("Há mais de 20.000 ciclos relevantes de tensão (fadiga)", key='scope_fatigue')
             has_vibration = st.checkbox("O piso/sistema é suscetível a vibrações", key='scope_vibration')
             outside_ambient_scope = st.checkbox("Há incêndio, sismo ou perfil formado a frio", key='scope_external')
-        if has_axial_torsion: unsupported_reasons.append("Interação com força axial/torção/flexão biaxial não verificada por este módulo.")
-        if has_web_openings: unsupported_reasons.append("Aberturas na alma exigem o Anexo F e não foram modeladas.")
-        if has_fatigue: unsupported_reasons.append("Fadiga aplicável: detalhamento e faixa de tensões do Anexo H não informados.")
-        if has_vibration: unsupported_reasons.append("Vibrações aplicáveis: avaliação do Anexo I não realizada.")
-        if outside_ambient_scope: unsupported_reasons.append("Situação fora do escopo à temperatura ambiente de perfis laminados/soldados.")
-        if not material_qualified:
-            unsupported_reasons.append(
-                "Qualificação estrutural do aço e requisitos efetivamente medidos de 4.6.2.2.1 não confirmados."
-            )
-        if not support_torsion_restrained: unsupported_reasons.append("5.7.8 exige enrijecedores nos apoios/extremidades declarados sem restrição torcional e com alma livre.")
-        standard_cantilever_cb = (
-            tipo_viga == 'Engastada e Livre (Balanço)' and cantilever_standard_cb
+        # Mesma regra dos arquivos de casos e do serviço HTTP (entrada_projeto.scope_reasons).
+        unsupported_reasons = scope_reasons(
+            {
+                'scope_axial_torsion': has_axial_torsion, 'scope_openings': has_web_openings,
+                'scope_fatigue': has_fatigue, 'scope_vibration': has_vibration,
+                'scope_external': outside_ambient_scope, 'material_qualified': material_qualified,
+                'support_torsion_restrained': support_torsion_restrained,
+            },
+            {
+                'tipo_viga': tipo_viga, 'flt_applicable': flt_applicable, 'cb_modo_auto': cb_modo_auto,
+                'cantilever_standard_cb': cantilever_standard_cb, 'cb_source': cb_source,
+            },
+        )
+
+        catalog_access = st.session_state.catalog_access
+        st.caption(
+            f"Acesso ao catálogo nesta execução: {catalog_access['last_ms']:.2f} ms "
+            f"(média {catalog_access['total_ms'] / catalog_access['reruns']:.2f} ms em "
+            f"{catalog_access['reruns']} execuções; máx. {catalog_access['max_ms']:.2f} ms)"
         )
-        if flt_applicable and not cb_modo_auto and not standard_cantilever_cb and not cb_source.strip():
-            unsupported_reasons.append(
-                "Cb manual sem origem documentada por análise de estabilidade ou procedimento técnico aceito."
-            )
 
     projeto_info = {'nome': projeto_nome, 'engenheiro': engenheiro, 'data': data_projeto.strftime('%d/%m/%Y'), 'revisao': revisao}
     scope_notes = [
@@ -2847,15 +2656,42 @@ def main():
     if st.session_state.analysis_mode == "batch":
         # st.header("📊 Análise em Lote") # <- Esta linha foi removida
         st.subheader("📊 Análise em Lote") # <- Substituída por esta
+        bounds = property_preselection(profile_table, "batch")
+        parallel = st.toggle(
+            "Processamento paralelo (todos os núcleos)", value=False, key="batch_parallel",
+            help="Divide o catálogo por planilha e em blocos avaliados em processos separados.",
+        )
         
+        # Resultados da busca valem só para os dados e faixas com que foram obtidos.
+        if st.session_state.lightest_key != design_key(input_params, bounds):
+            st.session_state.lightest_results = None
+
         if st.button("🚀 Iniciar Análise Otimizada", type="primary", use_container_width=True):
-            run_batch_analysis(all_sheets, input_params)
+            run_batch_analysis(profile_table, input_params, bounds, parallel)
+        if st.button("🪶 Buscar os 3 Perfis Aprovados Mais Leves por Família", use_container_width=True):
+            run_lightest_search(profile_table, input_params, top=3, bounds=bounds)
+
+        if st.session_state.lightest_results is not None:
+            search = st.session_state.lightest_results
+            st.caption(
+                f"Busca pelos mais leves: {search['full_evaluations']} verificações completas "
+                f"para {len(profile_table)} perfis do catálogo."
+            )
+            if search['profiles'].empty:
+                st.info("Nenhum perfil aprovado encontrado.")
+            else:
+                st.dataframe(
+                    style_classic_dataframe(search['profiles'].replace({'Tipo': PROFILE_TYPE_MAP})),
+                    use_container_width=True,
+                )
         
-        if st.session_state.analysis_results is not None:
+        if st.session_state.analysis_results is not None and st.session_state.analysis_results.empty:
+            st.info("Nenhum perfil nas faixas informadas.")
+        elif st.session_state.analysis_results is not None:
             df_all_results = st.session_state.analysis_results
             
-            tabs = st.tabs([PROFILE_TYPE_MAP.get(name, name) for name in all_sheets.keys()])
-            for i, sheet_name in enumerate(all_sheets.keys()):
+            tabs = st.tabs([PROFILE_TYPE_MAP.get(name, name) for name in profile_table.families])
+            for i, sheet_name in enumerate(profile_table.families):
                 with tabs[i]:
                     df_type = df_all_results[df_all_results['Tipo'] == sheet_name].drop(columns=['Tipo'])
                     df_aprovados_cat = df_type[df_type['Status'] == 'APROVADO'].copy().sort_values(by='Peso (kg/m)')
@@ -2893,17 +2729,28 @@ def main():
         # st.header("📋 Memorial Detalhado") # <- Esta linha foi removida
         st.subheader("📋 Memorial Detalhado") # <- Substituída por esta
         
-        display_names = [PROFILE_TYPE_MAP.get(name, name) for name in all_sheets.keys()]
+        display_names = [PROFILE_TYPE_MAP.get(name, name) for name in profile_table.families]
         reverse_name_map = {v: k for k, v in PROFILE_TYPE_MAP.items()}
 
         col1, col2 = st.columns(2)
         selected_display_name = col1.selectbox("Selecione o Tipo de Perfil:", display_names)
         sheet_name = reverse_name_map.get(selected_display_name, selected_display_name)
-        df_selecionado = all_sheets[sheet_name]
-        perfil_selecionado_nome = col2.selectbox("Selecione o Perfil Específico:", df_selecionado['Bitola (mm x kg/m)'])
+        bounds = property_preselection(profile_table, "detailed")
+        perfis_disponiveis = list(profile_table['Perfil'][profile_table['Tipo'] == sheet_name])
+        if bounds:
+            # Perfis da família dentro das faixas, do mais leve ao mais pesado.
+            rows = profile_table.query("Peso", families=(sheet_name,), **bounds)
+            perfis_disponiveis = list(dict.fromkeys(profile_table['Perfil'][rows]))
+        perfil_selecionado_nome = col2.selectbox("Selecione o Perfil Específico:", perfis_disponiveis)
+        if perfil_selecionado_nome is None:
+            st.info("Nenhum perfil desta família atende às faixas de pré-seleção.")
+            return
 
         if st.button("📄 Gerar Memorial Completo", type="primary", use_container_width=True):
-            run_detailed_analysis(df_selecionado, perfil_selecionado_nome, selected_display_name, input_params)
+            run_detailed_analysis(
+                profile_table, sheet_name, perfil_selecionado_nome,
+                selected_display_name, input_params,
+            )
 
         if st.session_state.detailed_analysis_html:
             with st.expander("📊 Resumo Visual da Análise", expanded=True):
@@ -2922,13 +2769,21 @@ def main():
                 use_container_width=True
             )
 
-def run_detailed_analysis(df, perfil_nome, perfil_tipo_display, input_params):
+def run_detailed_analysis(profile_table, sheet_name, perfil_nome, perfil_tipo_display, input_params):
     with st.spinner(f"Gerando análise completa para {perfil_nome}..."):
         try:
-            perfil_series = df[df['Bitola (mm x kg/m)'] == perfil_nome].iloc[0]
-            props = get_profile_properties(perfil_series)
+            # Consulta direta pelo índice do catálogo, sem acesso às planilhas
+            # compartilhadas; as dimensões voltam a mm para o resumo do memorial.
+            row = profile_table.row(perfil_nome, sheet_name)
+            props = profile_table.properties(row)
+            perfil_series = {
+                'd (mm)': props['d'] * 10.0, 'bf (mm)': props['bf'] * 10.0,
+                'tw (mm)': props['tw'] * 10.0, 'tf (mm)': props['tf'] * 10.0,
+                'h (mm)': props['h_faces'] * 10.0, "d' (mm)": props['h_clear'] * 10.0,
+                'Área (cm2)': props['Area'], 'Ix (cm4)': props['Ix'], 'Wx (cm3)': props['Wx'],
+            }
 
-            tipo_fabricacao = "Soldado" if "Soldado" in perfil_tipo_display else "Laminado"
+            tipo_fabricacao = profile_table['fabrication'][row]
             # A análise, as combinações e Cb são agora documentados no bloco normativo 2024.
             esforcos_html = ""
             cb_calc_html = ""
@@ -2981,48 +2836,72 @@ def run_detailed_analysis(df, perfil_nome, perfil_tipo_display, input_params):
         except Exception as e:
             st.error(f"❌ Ocorreu um erro: {e}")
 
-def run_batch_analysis(all_sheets, input_params):
-    all_results = []
-    progress_bar = st.progress(0, text="Analisando perfis...")
-    total_perfis = sum(len(df) for df in all_sheets.values())
-    perfis_processados = 0
-    
-    for sheet_name, df in all_sheets.items():
-        tipo_fabricacao_auto = PROFILE_FABRICATION_MAP.get(sheet_name, "Laminado")
-        
-        for _, row in df.iterrows():
-            perfis_processados += 1
-            progress_bar.progress(perfis_processados / total_perfis, text=f"Analisando: {row['Bitola (mm x kg/m)']}")
-            try:
-                props = get_profile_properties(row)
-                res_flt, res_flm, res_fla, res_cis, res_flecha, _ = perform_all_checks(
-                    props=props, tipo_fabricacao=tipo_fabricacao_auto, **input_params
-                )
-                
-                status_geral = res_flt.get('status_global', 'NÃO VERIFICADO')
-                local_efficiencies = [item['efficiency'] for item in res_cis.get('local_checks', [])]
-                max_local_efficiency = max(local_efficiencies, default=0.0)
-                
-                all_results.append({
-                    'Tipo': sheet_name, 'Perfil': row['Bitola (mm x kg/m)'],
-                    'Peso (kg/m)': props.get('Peso', 0), 'Status': status_geral,
-                    'Ef. FLT (%)': res_flt['eficiencia'], 'Ef. FLM (%)': res_flm['eficiencia'],
-                    'Ef. FLA (%)': res_fla['eficiencia'], 'Ef. Cisalhamento (%)': res_cis['eficiencia'],
-                    'Ef. Ruptura Mesa (%)': (
-                        res_flt['rupture_efficiency']
-                        if res_flt.get('rupture_status') != 'N/A' else None
-                    ),
-                    'Ef. Forças Locais (%)': max_local_efficiency,
-                    'Ef. Flecha (%)': res_flecha['eficiencia']
-                })
-            except (ValueError, KeyError) as exc:
-                all_results.append({
-                    'Tipo': sheet_name, 'Perfil': row.get('Bitola (mm x kg/m)', 'N/D'),
-                    'Peso (kg/m)': row.get('Massa Linear (kg/m)', 0), 'Status': 'NÃO VERIFICADO',
-                    'Observação': str(exc),
-                })
-    progress_bar.empty()
-    st.session_state.analysis_results = pd.DataFrame(all_results) if all_results else pd.DataFrame()
+def property_preselection(profile_table, key):
+    # Faixas opcionais respondidas pelos índices ordenados do catálogo
+    # (ProfileTable.query); zero deixa o limite em aberto.
+    with st.expander("🔎 Pré-seleção por propriedades"):
+        col1, col2 = st.columns(2)
+        ix_min = col1.number_input("Ix mínimo (cm⁴)", min_value=0.0, value=0.0, step=1000.0, key=f"{key}_ix_min")
+        d_max = col2.number_input("Altura d máxima (mm)", min_value=0.0, value=0.0, step=50.0, key=f"{key}_d_max")
+    bounds = {}
+    if ix_min > 0:
+        bounds['Ix'] = (ix_min, None)
+    if d_max > 0:
+        bounds['d'] = (None, d_max / 10.0)
+    if bounds:
+        st.caption(f"{len(profile_table.query(**bounds))} perfis dentro das faixas informadas.")
+    return bounds
+
+def design_key(input_params, bounds=None):
+    """Chave canônica dos dados (``DesignInput.content_hash``) com as faixas; ``None`` se inválidos."""
+    try:
+        content_hash = DesignInput.from_params(input_params).content_hash
+    except ValueError:
+        return None
+    return content_hash, tuple(sorted((bounds or {}).items()))
+
+def run_batch_analysis(profile_table, input_params, bounds=None, parallel=False):
+    # O catálogo inteiro é avaliado em colunas (analise_catalogo.evaluate_catalog),
+    # com os mesmos critérios de perform_all_checks aplicados perfil a perfil.
+    # Resultados compartilhados pela chave canônica dos dados (entrada_projeto.DesignInput).
+    st.session_state.analysis_results = None
+    try:
+        DesignInput.from_params(input_params)
+    except ValueError as e:
+        st.error(f"❌ Dados inválidos para a análise: {e}")
+        return
+    store, lock = load_results_cache()
+    key = design_key(input_params, bounds)
+    with lock:
+        results = store.get(key)
+        if results is not None:
+            store.move_to_end(key)
+    if results is None:
+        executor = load_catalog_executor() if parallel else None
+        with st.spinner("Analisando perfis..."):
+            results = evaluate_catalog(
+                input_params, profile_table, bounds=bounds, executor=executor,
+                cache=None if parallel else load_evaluation_cache(),
+            )
+        with lock:
+            store[key] = results
+            store.move_to_end(key)
+            while len(store) > RESULTS_CACHE_SIZE:
+                store.popitem(last=False)
+    st.session_state.analysis_results = results.copy()
+
+def run_lightest_search(profile_table, input_params, top, bounds=None):
+    # Ordem de peso por família, triagem por limites superiores e verificação
+    # completa apenas até reunir os aprovados (analise_catalogo.lightest_profiles).
+    st.session_state.lightest_results = None
+    with st.spinner("Buscando os perfis aprovados mais leves..."):
+        try:
+            results = lightest_profiles(input_params, profile_table, top=top, bounds=bounds)
+        except ValueError as e:
+            st.error(f"❌ Dados inválidos para a busca: {e}")
+            return
+    st.session_state.lightest_results = results
+    st.session_state.lightest_key = design_key(input_params, bounds)
 
 if __name__ == '__main__':
     main()
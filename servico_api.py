@@ -0,0 +1,287 @@
+"""Serviço HTTP local, em JSON, em torno do motor de verificação.
+
+Rotas (sempre ``POST`` com corpo JSON):
+
+* ``/check``: ``{"perfil": "W 200 x 15,0", "tipo": "Laminados", "caso": {...}}``
+  devolve a linha de ``check_profile`` (o fluxo de ``perform_all_checks``)
+  para um perfil; sem ``tipo``, vale o primeiro perfil com o nome;
+* ``/batch``: ``{"caso": {...}, "faixas": {"d": [30, 50]}, "aprovados": true}``
+  devolve ``{"linhas": [...]}`` com as linhas de ``evaluate_catalog``.
+
+``caso`` tem os campos de ``lote_casos.case_params``. As faixas são as de
+``ProfileTable.query``, nas unidades do motor: ``d`` em cm (não em mm, como
+na planilha), ``Ix`` em cm⁴, ``Wx`` em cm³; ``null`` deixa o limite aberto. As verificações rodam
+em um pool de ``workers`` processos, cada um com o catálogo carregado uma
+vez pelo ``initializer``. No máximo ``max_pending`` verificações ficam em
+andamento; as excedentes recebem 503 com ``Retry-After`` em vez de entrar em
+uma fila sem limite. Uma verificação que passa de ``timeout`` segundos recebe
+504: se ainda estava na fila, é cancelada; se já estava em um processo,
+continua ocupando sua vaga até terminar. Requisições
+lentas para chegar (``read_timeout``) recebem 408 e corpos acima de
+``MAX_BODY`` bytes, 413. As conexões são persistentes (HTTP/1.1), e o
+serviço escuta apenas em ``127.0.0.1`` por padrão. Só usa a biblioteca padrão.
+
+Uso: ``python servico_api.py --port 8765``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from http import HTTPStatus
+import json
+import math
+import os
+from pathlib import Path
+
+from analise_catalogo import ProfileTable, evaluate_catalog, make_catalog_executor
+from catalogo_binario import DEFAULT_WORKBOOK, load_catalog
+from lote_casos import case_params
+from verificacao_nbr8800_2024 import check_profile
+
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+MAX_BODY = 1 << 20
+MAX_HEADERS = 100
+
+_worker_sheets: dict | None = None
+_worker_table: ProfileTable | None = None
+_worker_index: dict | None = None
+
+
+class RequestError(Exception):
+    """Erro que vira uma resposta HTTP com ``status`` e ``{"erro": mensagem}``."""
+
+    def __init__(self, status: HTTPStatus, message: str):
+        super().__init__(message)
+        self.status = status
+
+
+def _init_worker(workbook: str) -> None:
+    # Catálogo por processo: o binário compilado vem do mapeamento de memória.
+    global _worker_sheets, _worker_table, _worker_index
+    _worker_sheets = load_catalog(workbook, refresh=False)
+    _worker_table = ProfileTable.from_sheets(_worker_sheets)
+    _worker_index = {}
+    for sheet_name, frame in _worker_sheets.items():
+        for position, name in enumerate(frame["Bitola (mm x kg/m)"]):
+            _worker_index.setdefault((sheet_name, str(name)), position)
+            _worker_index.setdefault((None, str(name)), (sheet_name, position))
+
+
+def _ready() -> int:
+    return os.getpid()
+
+
+def _json_value(value):
+    if isinstance(value, float) and math.isnan(value):
+        return None
+    return value.item() if hasattr(value, "item") else value
+
+
+def _check(request: dict) -> dict:
+    params = case_params(request.get("caso") or {})
+    name, sheet_name = str(request.get("perfil")), request.get("tipo")
+    if sheet_name is None:
+        sheet_name, position = _worker_index.get((None, name), (None, None))
+    else:
+        position = _worker_index.get((sheet_name, name))
+    if position is None:
+        raise LookupError(f"Perfil {name!r} não encontrado no catálogo.")
+    row = _worker_sheets[sheet_name].iloc[position]
+    return {key: _json_value(value) for key, value in check_profile(row, sheet_name, params).items()}
+
+
+def _batch(request: dict) -> dict:
+    params = case_params(request.get("caso") or {})
+    bounds = request.get("faixas") or None
+    if bounds is not None:
+        if not isinstance(bounds, dict):
+            raise ValueError("faixas deve ser um objeto {propriedade: [mínimo, máximo]}.")
+        bounds = {key: tuple(limits) for key, limits in bounds.items()}
+    frame = evaluate_catalog(params, _worker_table, bounds=bounds)
+    if request.get("aprovados") and len(frame):
+        frame = frame[frame["Status"] == "APROVADO"]
+    rows = [
+        {key: _json_value(value) for key, value in row.items()}
+        for row in frame.to_dict("records")
+    ]
+    return {"total": len(rows), "linhas": rows}
+
+
+ROUTES = {"/check": _check, "/batch": _batch}
+
+
+async def _read_request(reader: asyncio.StreamReader):
+    """``(método, caminho, cabeçalhos, corpo)`` ou ``None`` no fim da conexão."""
+    line = await reader.readline()
+    if not line:
+        return None
+    try:
+        method, target, version = line.decode("latin-1").split()
+    except ValueError:
+        raise RequestError(HTTPStatus.BAD_REQUEST, "Linha de requisição inválida.") from None
+    headers = {}
+    while True:
+        line = await reader.readline()
+        if line in (b"\r\n", b"\n", b""):
+            break
+        if len(headers) >= MAX_HEADERS:
+            raise RequestError(HTTPStatus.REQUEST_HEADER_FIELDS_TOO_LARGE, "Cabeçalhos demais.")
+        name, _, value = line.decode("latin-1").partition(":")
+        headers[name.strip().lower()] = value.strip()
+    try:
+        length = int(headers.get("content-length", "0"))
+    except ValueError:
+        raise RequestError(HTTPStatus.BAD_REQUEST, "Content-Length inválido.") from None
+    if length > MAX_BODY:
+        raise RequestError(HTTPStatus.REQUEST_ENTITY_TOO_LARGE, f"Corpo acima de {MAX_BODY} bytes.")
+    if version == "HTTP/1.0" and headers.get("connection", "").lower() != "keep-alive":
+        headers["connection"] = "close"
+    return method, target.split("?", 1)[0], headers, await reader.readexactly(max(length, 0))
+
+
+def _response(status: HTTPStatus, payload: dict, keep_alive: bool, extra: dict | None = None) -> bytes:
+    body = json.dumps(payload, ensure_ascii=False, allow_nan=False).encode("utf-8")
+    headers = {
+        "Content-Type": "application/json; charset=utf-8",
+        "Content-Length": str(len(body)),
+        "Connection": "keep-alive" if keep_alive else "close",
+        **(extra or {}),
+    }
+    head = f"HTTP/1.1 {status.value} {status.phrase}\r\n"
+    head += "".join(f"{name}: {value}\r\n" for name, value in headers.items())
+    return (head + "\r\n").encode("latin-1") + body
+
+
+async def start_service(
+    host: str = DEFAULT_HOST,
+    port: int = DEFAULT_PORT,
+    workers: int | None = None,
+    max_pending: int | None = None,
+    timeout: float = 5.0,
+    read_timeout: float = 10.0,
+    workbook: str | Path = DEFAULT_WORKBOOK,
+) -> tuple[asyncio.Server, ProcessPoolExecutor]:
+    """Inicia o serviço e devolve o servidor e o pool (a encerrar por quem chamou).
+
+    Os processos do pool são criados e carregam o catálogo antes de o
+    servidor aceitar conexões, para que a primeira resposta não pague essa
+    espera. ``max_pending`` vale por padrão o dobro de ``workers``.
+    """
+    workers = workers or os.cpu_count() or 1
+    max_pending = max_pending or 2 * workers
+    if timeout <= 0 or read_timeout <= 0:
+        raise ValueError("Os tempos limite devem ser positivos.")
+    # Compila o catálogo uma vez aqui; os processos só o abrem.
+    load_catalog(workbook)
+    loop = asyncio.get_running_loop()
+    executor = make_catalog_executor(workers, _init_worker, (str(workbook),))
+    await asyncio.gather(*(loop.run_in_executor(executor, _ready) for _ in range(workers)))
+    pending = 0
+
+    def release(_future) -> None:
+        nonlocal pending
+        pending -= 1
+
+    async def dispatch(method: str, path: str, body: bytes) -> tuple[HTTPStatus, dict, dict | None]:
+        nonlocal pending
+        handler = ROUTES.get(path)
+        if handler is None:
+            raise RequestError(HTTPStatus.NOT_FOUND, f"Rota {path} inexistente.")
+        if method != "POST":
+            raise RequestError(HTTPStatus.METHOD_NOT_ALLOWED, "Use POST.")
+        try:
+            request = json.loads(body or b"{}")
+        except ValueError:
+            raise RequestError(HTTPStatus.BAD_REQUEST, "Corpo JSON inválido.") from None
+        if not isinstance(request, dict):
+            raise RequestError(HTTPStatus.BAD_REQUEST, "O corpo deve ser um objeto JSON.")
+        if pending >= max_pending:
+            return HTTPStatus.SERVICE_UNAVAILABLE, {"erro": "Serviço ocupado."}, {"Retry-After": "1"}
+        # A vaga só é liberada quando a tarefa termina ou é cancelada ainda na fila.
+        pending += 1
+        future = executor.submit(handler, request)
+        future.add_done_callback(lambda done: loop.call_soon_threadsafe(release, done))
+        try:
+            result = await asyncio.wait_for(asyncio.wrap_future(future), timeout)
+        except asyncio.TimeoutError:
+            raise RequestError(HTTPStatus.GATEWAY_TIMEOUT, f"Verificação acima de {timeout} s.") from None
+        except ValueError as exc:
+            raise RequestError(HTTPStatus.BAD_REQUEST, str(exc)) from None
+        except LookupError as exc:
+            raise RequestError(HTTPStatus.NOT_FOUND, str(exc)) from None
+        except BrokenProcessPool:
+            raise RequestError(HTTPStatus.SERVICE_UNAVAILABLE, "Pool de processos indisponível.") from None
+        return HTTPStatus.OK, result, None
+
+    async def handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while True:
+                extra = None
+                try:
+                    request = await asyncio.wait_for(_read_request(reader), read_timeout)
+                except RequestError as exc:
+                    request, status, payload = None, exc.status, {"erro": str(exc)}
+                except ValueError:
+                    request, status, payload = None, HTTPStatus.BAD_REQUEST, {"erro": "Linha longa demais."}
+                except asyncio.TimeoutError:
+                    request, status, payload = None, HTTPStatus.REQUEST_TIMEOUT, {"erro": "Requisição incompleta."}
+                except asyncio.IncompleteReadError:
+                    break
+                else:
+                    if request is None:
+                        break
+                    method, path, _, body = request
+                    try:
+                        status, payload, extra = await dispatch(method, path, body)
+                    except RequestError as exc:
+                        status, payload = exc.status, {"erro": str(exc)}
+                    except Exception as exc:
+                        status, payload = HTTPStatus.INTERNAL_SERVER_ERROR, {"erro": str(exc)}
+                # Sem a requisição lida por inteiro, a conexão não pode ser reaproveitada.
+                keep_alive = request is not None and request[2].get("connection", "").lower() != "close"
+                writer.write(_response(status, payload, keep_alive, extra))
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    server = await asyncio.start_server(handle, host, port)
+    return server, executor
+
+
+async def serve(**options) -> None:
+    """Atende até ser interrompido; ``options`` são os de ``start_service``."""
+    server, executor = await start_service(**options)
+    try:
+        async with server:
+            address = server.sockets[0].getsockname()
+            print(f"Serviço em http://{address[0]}:{address[1]}", flush=True)
+            await server.serve_forever()
+    finally:
+        executor.shutdown(cancel_futures=True)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Serviço HTTP local de verificação de perfis.")
+    parser.add_argument("--host", default=DEFAULT_HOST)
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--workers", type=int)
+    parser.add_argument("--max-pending", type=int)
+    parser.add_argument("--timeout", type=float, default=5.0, help="segundos por verificação")
+    parser.add_argument("--catalog", type=Path, default=DEFAULT_WORKBOOK, help="planilha de perfis")
+    arguments = parser.parse_args()
+    try:
+        asyncio.run(serve(
+            host=arguments.host, port=arguments.port, workers=arguments.workers,
+            max_pending=arguments.max_pending, timeout=arguments.timeout, workbook=arguments.catalog,
+        ))
+    except KeyboardInterrupt:
+        pass
@@ -0,0 +1,266 @@
+"""Tabelas de vão × carga distribuída × vinculação para todo o catálogo.
+
+``generate_span_load_tables`` verifica cada perfil válido em uma grade de
+vãos, cargas variáveis distribuídas e vinculações. O critério é o mesmo de
+``analise_catalogo``: cada ponto da grade vira uma linha da avaliação
+colunar, com o vão entrando por ``span_scale`` e a carga por
+``variable_scale``. A grade é dividida em blocos de até ``CHUNK_ROWS``
+linhas, distribuídos entre processos, e cada bloco volta já compactado:
+
+* ``efficiency.npy``: eficiência governante em ‰ (uint16, saturada em
+  65535);
+* ``state.npy``: código uint8 ``status · STATE_STRIDE + verificação``, com
+  os índices de ``STATUS_CODES`` e ``CHECK_NAMES`` (``decode_state``).
+
+Os dois arquivos de cada planilha têm a forma (perfis, vinculações, vãos,
+cargas) e são gravados por mapeamento de memória; o ``manifest.json`` com os
+eixos e os nomes dos perfis é gravado por último. A memória do processo
+principal fica limitada aos blocos em andamento.
+
+Uso: ``python tabelas_vao_carga.py saida --spans 300:1200:50 --loads 1:30:1``.
+"""
+
+from __future__ import annotations
+
+import argparse
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+import json
+import os
+from pathlib import Path
+
+import numpy as np
+
+from analise_catalogo import (
+    AUTOMATIC_INPUT_MODE, CHECK_NAMES, EFFICIENCY_COLUMNS, PROPERTY_COLUMNS, ProfileTable,
+    _evaluate_valid_profiles,
+)
+from catalogo_binario import DEFAULT_WORKBOOK, _replace, load_catalog
+
+
+TABLE_FORMAT = 1
+CHUNK_ROWS = 20_000
+SUPPORTS = ("Bi-apoiada", "Engastada e Livre (Balanço)", "Bi-engastada", "Engastada e Apoiada")
+STATUS_CODES = ("APROVADO", "REPROVADO", "NÃO VERIFICADO")
+STATE_STRIDE = 8
+EFFICIENCY_SCALE = 10.0
+EFFICIENCY_MAX = np.iinfo(np.uint16).max
+
+# Dados da barra lateral de ``main`` usados quando a tabela não recebe outros:
+# ASTM A572 Gr. 50, Lb igual ao vão, Cb automático e flecha limitada a L/350.
+TABLE_DEFAULTS = dict(
+    tipo_viga="Bi-apoiada", L_cm=600.0, input_mode=AUTOMATIC_INPUT_MODE, Msd=0.0, Vsd=0.0,
+    q_g_kn_cm=0.0, q_q_kn_cm=0.01, p_g_kn=0.0, p_q_kn=0.0, p_pos_cm=300.0,
+    fy_aco=34.5, fu_aco=45.0, E_aco=20_000.0,
+    Lb_projeto=600.0, lb_start_cm=0.0, Cb_projeto=1.0, flt_applicable=True, cb_modo_auto=True,
+    usa_enrijecedores=False, a_enr=0.0, bearing_left_cm=10.0, bearing_right_cm=10.0,
+    support_relative_lateral_restrained=True, point_bearing_cm=10.0,
+    point_relative_lateral_restrained=False, loaded_flange_rotation_restrained=False,
+    local_unbraced_cm=600.0, weld_root_cm=0.0, limite_flecha_divisor=350, masonry_on_beam=False,
+    include_self_weight=True, gamma_g=1.50, gamma_q=1.50, gamma_self_weight=1.25,
+    els_combination="rare", psi1=0.6, psi2=0.4, unsupported_reasons=[],
+)
+
+_worker_columns: dict | None = None
+
+
+def encode_results(results: dict) -> tuple[np.ndarray, np.ndarray]:
+    """Eficiência governante (‰, uint16) e código de estado (uint8) de uma avaliação colunar."""
+    efficiency = np.nanmax(np.column_stack([results[name] for name in EFFICIENCY_COLUMNS]), axis=1)
+    permille = np.clip(np.nan_to_num(efficiency * EFFICIENCY_SCALE, posinf=EFFICIENCY_MAX), 0, EFFICIENCY_MAX)
+    status = np.argmax(results["Status"][:, None] == np.array(STATUS_CODES, dtype=object), axis=1)
+    check = np.argmax(results["Estado-limite governante"][:, None] == np.array(CHECK_NAMES, dtype=object), axis=1)
+    return np.rint(permille).astype(np.uint16), (status * STATE_STRIDE + check).astype(np.uint8)
+
+
+def decode_state(code) -> tuple[np.ndarray, np.ndarray]:
+    """Status e estado-limite governante de códigos de ``state.npy``."""
+    code = np.asarray(code, dtype=np.uint8)
+    return (
+        np.asarray(STATUS_CODES, dtype=object)[code // STATE_STRIDE],
+        np.asarray(CHECK_NAMES, dtype=object)[code % STATE_STRIDE],
+    )
+
+
+def _init_worker(columns: dict) -> None:
+    # O catálogo chega uma vez por processo; os blocos levam apenas índices.
+    global _worker_columns
+    _worker_columns = columns
+
+
+def _table_block(params: dict, rows: np.ndarray, spans: np.ndarray, loads: np.ndarray):
+    """Eficiência e estado de (perfis, vãos, cargas) em uma única avaliação colunar."""
+    columns = _worker_columns
+    profile = np.repeat(rows, len(spans) * len(loads))
+    span_scale = np.tile(np.repeat(spans, len(loads)), len(rows)) / params["L_cm"]
+    variable_scale = np.tile(loads, len(rows) * len(spans))
+    results = _evaluate_valid_profiles(
+        {key: columns[key][profile] for key, _, _ in PROPERTY_COLUMNS},
+        columns["fabrication"][profile], params, variable_scale, span_scale,
+    )
+    shape = (len(rows), len(spans), len(loads))
+    efficiency, state = encode_results(results)
+    return efficiency.reshape(shape), state.reshape(shape)
+
+
+def _blocks(count: int, spans: int, loads: int, chunk_rows: int):
+    """Fatias (perfis, vãos) com no máximo ``chunk_rows`` pontos da grade."""
+    per_profile = spans * loads
+    if per_profile <= chunk_rows:
+        profiles = max(1, chunk_rows // per_profile)
+        for start in range(0, count, profiles):
+            yield slice(start, min(start + profiles, count)), slice(0, spans)
+        return
+    span_step = max(1, chunk_rows // loads)
+    for row in range(count):
+        for start in range(0, spans, span_step):
+            yield slice(row, row + 1), slice(start, min(start + span_step, spans))
+
+
+def table_params(input_params: dict | None = None) -> dict:
+    """Dados de ``TABLE_DEFAULTS`` com ``input_params`` por cima, com carga de referência 1 kN/m."""
+    params = dict(TABLE_DEFAULTS, **(input_params or {}))
+    if params["input_mode"] != AUTOMATIC_INPUT_MODE or params.get("combination_envelope", False):
+        raise ValueError("As tabelas usam a combinação única com cargas aplicadas na viga.")
+    # Carga variável de referência: o fator de cada ponto é a carga em kN/m.
+    params["q_q_kn_cm"] = 0.01
+    return params
+
+
+def generate_span_load_tables(
+    output: str | Path,
+    spans_cm,
+    loads_kn_m,
+    supports=SUPPORTS,
+    input_params: dict | None = None,
+    all_sheets: dict | ProfileTable | None = None,
+    workers: int | None = None,
+    chunk_rows: int = CHUNK_ROWS,
+) -> Path:
+    """Gera as tabelas de todas as planilhas em ``output`` e devolve o diretório.
+
+    ``spans_cm`` são os vãos (cm) e ``loads_kn_m`` as cargas variáveis
+    distribuídas (kN/m) somadas às permanentes de ``input_params``. Lb, x0,
+    ℓ e a posição da carga pontual acompanham o vão na proporção de
+    ``L_cm``, como em ``max_span``. ``workers`` é o número de processos
+    (padrão: todos os núcleos; 1 avalia no próprio processo).
+    """
+    spans = np.asarray(spans_cm, dtype=float)
+    loads = np.asarray(loads_kn_m, dtype=float)
+    if spans.ndim != 1 or loads.ndim != 1 or not len(spans) or not len(loads):
+        raise ValueError("Informe ao menos um vão e uma carga.")
+    if np.any(spans <= 0) or np.any(loads < 0):
+        raise ValueError("Os vãos devem ser positivos e as cargas, não negativas.")
+    if chunk_rows < 1:
+        raise ValueError("O bloco deve ter ao menos uma linha.")
+    params = table_params(input_params)
+    supports = tuple(supports)
+    if all_sheets is None:
+        all_sheets = load_catalog(DEFAULT_WORKBOOK)
+    table = all_sheets if isinstance(all_sheets, ProfileTable) else ProfileTable.from_sheets(all_sheets)
+    columns = table.columns
+    workers = workers or os.cpu_count() or 1
+
+    output = Path(output)
+    output.mkdir(parents=True, exist_ok=True)
+    sheets = {}
+    arrays = {}
+    tasks = []
+    for sheet in dict.fromkeys(columns["Tipo"]):
+        rows = np.flatnonzero(columns["valid"] & (columns["Tipo"] == sheet))
+        if not len(rows):
+            continue
+        directory = output / sheet
+        directory.mkdir(exist_ok=True)
+        shape = (len(rows), len(supports), len(spans), len(loads))
+        arrays[sheet] = tuple(
+            np.lib.format.open_memmap(directory / name, mode="w+", dtype=dtype, shape=shape)
+            for name, dtype in (("efficiency.npy", np.uint16), ("state.npy", np.uint8))
+        )
+        sheets[sheet] = {
+            "profiles": [str(name) for name in columns["Perfil"][rows]],
+            "weights": columns["Peso"][rows].tolist(),
+        }
+        for index, support in enumerate(supports):
+            support_params = dict(params, tipo_viga=support)
+            for profile_slice, span_slice in _blocks(len(rows), len(spans), len(loads), chunk_rows):
+                key = (sheet, index, profile_slice, span_slice)
+                tasks.append((key, (support_params, rows[profile_slice], spans[span_slice], loads)))
+
+    def store(key, block):
+        sheet, index, profile_slice, span_slice = key
+        for target, values in zip(arrays[sheet], block):
+            target[profile_slice, index, span_slice] = values
+
+    if workers == 1:
+        _init_worker(dict(columns))
+        for key, args in tasks:
+            store(key, _table_block(*args))
+    else:
+        # Janela limitada de blocos em andamento: a memória não cresce com a grade.
+        with ProcessPoolExecutor(workers, initializer=_init_worker, initargs=(dict(columns),)) as pool:
+            pending = {}
+            for key, args in tasks:
+                pending[pool.submit(_table_block, *args)] = key
+                if len(pending) >= 2 * workers:
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        store(pending.pop(future), future.result())
+            for future, key in pending.items():
+                store(key, future.result())
+
+    for efficiency, state in arrays.values():
+        efficiency.flush()
+        state.flush()
+    manifest = {
+        "format": TABLE_FORMAT,
+        "spans_cm": spans.tolist(),
+        "loads_kn_m": loads.tolist(),
+        "supports": list(supports),
+        "status_codes": list(STATUS_CODES),
+        "check_names": list(CHECK_NAMES),
+        "state_stride": STATE_STRIDE,
+        "efficiency_scale": EFFICIENCY_SCALE,
+        "sheets": sheets,
+    }
+    _replace(
+        output / "manifest.json",
+        lambda handle: handle.write(json.dumps(manifest, ensure_ascii=False).encode("utf-8")),
+    )
+    return output
+
+
+def load_span_load_tables(directory: str | Path) -> dict:
+    """Manifesto e, por planilha, ``efficiency`` e ``state`` mapeados em memória."""
+    directory = Path(directory)
+    manifest = json.loads((directory / "manifest.json").read_text(encoding="utf-8"))
+    if manifest.get("format") != TABLE_FORMAT:
+        raise ValueError("Formato de tabela não suportado.")
+    for sheet, entry in manifest["sheets"].items():
+        for name in ("efficiency", "state"):
+            entry[name] = np.load(directory / sheet / f"{name}.npy", mmap_mode="r")
+    return manifest
+
+
+def _grid(text: str) -> np.ndarray:
+    """``início:fim:passo`` (fim incluído) ou valores separados por vírgula."""
+    if ":" in text:
+        start, stop, step = (float(value) for value in text.split(":"))
+        return np.arange(start, stop + step / 2.0, step)
+    return np.array([float(value) for value in text.split(",")])
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Gera tabelas de vão × carga para o catálogo.")
+    parser.add_argument("output", type=Path)
+    parser.add_argument("--spans", type=_grid, required=True, help="vãos em cm, início:fim:passo ou lista")
+    parser.add_argument("--loads", type=_grid, required=True, help="cargas variáveis em kN/m")
+    parser.add_argument("--supports", nargs="+", default=list(SUPPORTS))
+    parser.add_argument("--params", type=Path, help="JSON com dados que substituem TABLE_DEFAULTS")
+    parser.add_argument("--workers", type=int)
+    arguments = parser.parse_args()
+    overrides = json.loads(arguments.params.read_text(encoding="utf-8")) if arguments.params else None
+    path = generate_span_load_tables(
+        arguments.output, arguments.spans, arguments.loads, arguments.supports, overrides,
+        workers=arguments.workers,
+    )
+    print(f"Tabelas gravadas em {path}")
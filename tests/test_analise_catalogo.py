@@ -0,0 +1,414 @@
+import math
+from pathlib import Path
+import subprocess
+import sys
+import tempfile
+import time
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from analise_catalogo import (
+    PROFILE_FABRICATION_MAP, EvaluationCache, ProfileTable, evaluate_catalog, lightest_profiles, make_catalog_executor,
+    max_span, max_variable_load, screen_profiles,
+)
+from calculos_lote_nbr8800_2024 import flexural_strength_i_batch, shear_strength_i_batch
+from calculos_nbr8800_2024 import VariableAction, load_combinations
+from verificacao_nbr8800_2024 import get_profile_properties, perform_all_checks
+
+
+ROOT = Path(__file__).resolve().parents[1]
+
+BASE_INPUTS = dict(
+    tipo_viga="Bi-apoiada", L_cm=500.0,
+    input_mode="Calcular a partir de Cargas na Viga", Msd=0.0, Vsd=0.0,
+    q_serv_kn_cm=0.18, p_load_serv=None, q_g_kn_cm=0.06, q_q_kn_cm=0.12,
+    larg_esq_cm=200.0, larg_dir_cm=200.0, larg_inf_total_m=4.0,
+    g_area=1.5, q_area=3.0, p_g_kn=0.0, p_q_kn=0.0, p_pos_cm=250.0,
+    fy_aco=34.5, fu_aco=45.0, E_aco=20_000.0,
+    has_tension_flange_holes=False, tension_flange_net_ratio=1.0,
+    Lb_projeto=500.0, lb_start_cm=0.0, Cb_projeto=1.0, flt_applicable=True,
+    cb_modo_auto=True, cb_source="", cantilever_standard_cb=True,
+    usa_enrijecedores=False, a_enr=0.0, stiffener_width=None,
+    stiffener_thickness=None, stiffener_pair=True, stiffener_welded=False,
+    bearing_left_cm=10.0, bearing_right_cm=10.0,
+    support_relative_lateral_restrained=True, point_bearing_cm=10.0,
+    point_relative_lateral_restrained=False,
+    loaded_flange_rotation_restrained=False, local_unbraced_cm=500.0,
+    weld_root_cm=0.0, limite_flecha_divisor=350, masonry_on_beam=False,
+    include_self_weight=True, gamma_g=1.50, gamma_q=1.50, gamma_self_weight=1.25,
+    els_combination="rare", psi1=0.6, psi2=0.4,
+    manual_local_checks_confirmed=False, unsupported_reasons=[], scope_notes=[],
+    projeto_info={"nome": "Teste"},
+)
+
+
+def row_by_row(all_sheets, input_params):
+    rows = []
+    for sheet_name, frame in all_sheets.items():
+        fabrication = PROFILE_FABRICATION_MAP.get(sheet_name, "Laminado")
+        for _, row in frame.iterrows():
+            props = get_profile_properties(row)
+            res_flt, res_flm, res_fla, res_cis, res_flecha, _ = perform_all_checks(
+                props=props, tipo_fabricacao=fabrication, **input_params
+            )
+            rows.append({
+                "Status": res_flt["status_global"],
+                "Ef. FLT (%)": res_flt["eficiencia"],
+                "Ef. FLM (%)": res_flm["eficiencia"],
+                "Ef. FLA (%)": res_fla["eficiencia"],
+                "Ef. Cisalhamento (%)": res_cis["eficiencia"],
+                "Ef. Forças Locais (%)": max(
+                    (item["efficiency"] for item in res_cis["local_checks"]), default=0.0
+                ),
+                "Ef. Flecha (%)": res_flecha["eficiencia"],
+            })
+    return pd.DataFrame(rows)
+
+
+class CatalogEvaluationTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.sheets = pd.read_excel(ROOT / "perfis.xlsx", sheet_name=None)
+
+    def test_columnar_pipeline_matches_perform_all_checks(self):
+        variants = (
+            {},
+            dict(tipo_viga="Engastada e Livre (Balanço)", L_cm=250.0, Lb_projeto=250.0,
+                 cb_modo_auto=False, p_q_kn=15.0, p_pos_cm=200.0),
+            dict(tipo_viga="Bi-engastada", p_g_kn=5.0, p_q_kn=20.0, p_pos_cm=175.0,
+                 els_combination="frequent"),
+            dict(tipo_viga="Engastada e Apoiada", L_cm=900.0, Lb_projeto=300.0,
+                 lb_start_cm=300.0, p_q_kn=40.0, p_pos_cm=600.0,
+                 has_tension_flange_holes=True, tension_flange_net_ratio=0.6),
+            dict(input_mode="Inserir Esforços Manualmente", Msd=20_000.0, Vsd=150.0),
+        )
+        for variant in variants:
+            inputs = dict(BASE_INPUTS, **variant)
+            with self.subTest(variant=variant):
+                expected = row_by_row(self.sheets, inputs)
+                result = evaluate_catalog(inputs, self.sheets)
+                self.assertEqual(list(result["Status"]), list(expected["Status"]))
+                for column in expected.columns.drop("Status"):
+                    for got, wanted in zip(result[column], expected[column]):
+                        self.assertTrue(math.isclose(got, wanted, rel_tol=1e-9, abs_tol=1e-9))
+
+    def test_invalid_profile_is_reported_without_stopping_the_batch(self):
+        sheets = {name: frame.copy() for name, frame in self.sheets.items()}
+        sheets["CS"].loc[0, "tw (mm)"] = 0.0
+        result = evaluate_catalog(BASE_INPUTS, sheets)
+        offset = len(sheets["Laminados"])
+        self.assertEqual(result.loc[offset, "Status"], "NÃO VERIFICADO")
+        self.assertIn("'tw'", result.loc[offset, "Observação"])
+        self.assertTrue(result["Observação"].drop(index=offset).isna().all())
+
+    def test_profile_table_matches_get_profile_properties(self):
+        table = ProfileTable.from_sheets(self.sheets)
+        self.assertEqual(len(table), sum(len(frame) for frame in self.sheets.values()))
+        for sheet_name, frame in self.sheets.items():
+            first = ~frame["Bitola (mm x kg/m)"].duplicated()
+            for position, (_, series) in enumerate(frame.iterrows()):
+                if not first.iloc[position]:
+                    continue
+                row = table.row(series["Bitola (mm x kg/m)"], sheet_name)
+                self.assertEqual(table["sheet_row"][row], position)
+                self.assertEqual(table["fabrication"][row], PROFILE_FABRICATION_MAP[sheet_name])
+                expected = get_profile_properties(series)
+                got = table.properties(row)
+                self.assertEqual(set(got), set(expected))
+                for key, value in expected.items():
+                    self.assertTrue(math.isclose(got[key], value, rel_tol=1e-12), key)
+        self.assertFalse(table["Ix"].flags.writeable)
+        with self.assertRaises(ValueError):
+            table.row("300 x 95")
+        pd.testing.assert_frame_equal(
+            evaluate_catalog(BASE_INPUTS, table), evaluate_catalog(BASE_INPUTS, self.sheets)
+        )
+
+    def test_profile_table_reports_invalid_rows_at_lookup(self):
+        sheets = {name: frame.copy() for name, frame in self.sheets.items()}
+        sheets["CS"].loc[0, "tw (mm)"] = 0.0
+        table = ProfileTable.from_sheets(sheets)
+        row = table.row(sheets["CS"].loc[0, "Bitola (mm x kg/m)"], "CS")
+        self.assertFalse(table["valid"][row])
+        with self.assertRaisesRegex(ValueError, "'tw'"):
+            table.properties(row)
+
+    def test_envelope_with_one_action_matches_single_combination(self):
+        single = evaluate_catalog(BASE_INPUTS, self.sheets)
+        envelope = evaluate_catalog(dict(
+            BASE_INPUTS, combination_envelope=True, els_combinations=("rare",),
+            variable_actions=[{"name": "Sobrecarga", "q": 0.12}],
+        ), self.sheets)
+        self.assertEqual(list(envelope["Status"]), list(single["Status"]))
+        for column in [name for name in single.columns if name.startswith("Ef.")]:
+            pd.testing.assert_series_equal(envelope[column], single[column], rtol=1e-12)
+        self.assertTrue((envelope["Combinação FLM"] == "ELU: Sobrecarga principal").all())
+
+    def test_envelope_matches_worst_of_separate_combinations(self):
+        actions = [
+            dict(name="Sobrecarga", q=0.10, point_load=20.0, psi0=0.7, psi1=0.6, psi2=0.4),
+            dict(name="Equipamento", q=0.02, point_load=35.0, gamma_q=1.4, psi0=0.8, psi1=0.7, psi2=0.6),
+            dict(name="Cobertura", q=0.08, psi0=0.5, psi1=0.4, psi2=0.3),
+        ]
+        inputs = dict(BASE_INPUTS, tipo_viga="Engastada e Apoiada", p_g_kn=5.0, p_pos_cm=180.0)
+        envelope = evaluate_catalog(dict(
+            inputs, combination_envelope=True, variable_actions=actions,
+        ), self.sheets)
+
+        def separate(row, combination):
+            # A combinação entra como uma ação variável única com fator 1.
+            factors = row["variable"]
+            return evaluate_catalog(dict(
+                inputs, gamma_q=1.0, els_combination=combination,
+                q_q_kn_cm=sum(f * action["q"] for f, action in zip(factors, actions)),
+                p_q_kn=sum(f * action.get("point_load", 0.0) for f, action in zip(factors, actions)),
+            ), self.sheets)
+
+        combinations = load_combinations([VariableAction(**action) for action in actions])
+        elu = [(row["label"], separate(row, "rare")) for row in combinations["elu"]]
+        els = [(row["label"], separate(row, "rare")) for row in combinations["els"]]
+        self.assertEqual(len(elu), 3)
+        self.assertEqual(len(els), 7)
+        checks = (
+            ("Ef. FLT (%)", "Combinação FLT", elu), ("Ef. FLM (%)", "Combinação FLM", elu),
+            ("Ef. Cisalhamento (%)", "Combinação Cisalhamento", elu),
+            ("Ef. Forças Locais (%)", "Combinação Forças locais", elu),
+            ("Ef. Flecha (%)", "Combinação Flecha", els),
+        )
+        for column, label_column, runs in checks:
+            with self.subTest(check=column):
+                values = pd.concat([frame[column] for _, frame in runs], axis=1).to_numpy()
+                expected = values.max(axis=1)
+                for got, wanted in zip(envelope[column], expected):
+                    self.assertTrue(math.isclose(got, wanted, rel_tol=1e-9, abs_tol=1e-9))
+                # Empates entre combinações não têm governante único.
+                top = np.sort(values, axis=1)
+                distinct = top[:, -1] - top[:, -2] > 1e-6 * top[:, -1]
+                labels = np.array([label for label, _ in runs], dtype=object)[values.argmax(axis=1)]
+                self.assertTrue(distinct.any())
+                self.assertEqual(list(envelope[label_column][distinct]), list(labels[distinct]))
+        self.assertTrue(envelope["Combinação governante"].notna().all())
+
+    def test_pruned_evaluation_matches_full_evaluation(self):
+        table = ProfileTable.from_sheets(self.sheets)
+        variants = (
+            {},
+            dict(input_mode="Inserir Esforços Manualmente", Msd=20_000.0, Vsd=150.0),
+            dict(L_cm=900.0, Lb_projeto=900.0, q_q_kn_cm=0.4),
+            dict(combination_envelope=True, variable_actions=[
+                {"name": "Sobrecarga", "q": 0.2, "point_load": 30.0}, {"name": "Cobertura", "q": 0.1},
+            ]),
+        )
+        for variant in variants:
+            inputs = dict(BASE_INPUTS, **variant)
+            with self.subTest(variant=variant):
+                full = evaluate_catalog(inputs, table)
+                pruned = evaluate_catalog(inputs, table, prune=True)
+                self.assertEqual(list(pruned["Status"]), list(full["Status"]))
+                evaluated = pruned["Triagem"].isna()
+                self.assertGreater((~evaluated).sum(), 0)
+                self.assertTrue((pruned.loc[~evaluated, "Status"] == "REPROVADO").all())
+                pd.testing.assert_frame_equal(pruned.drop(columns="Triagem")[evaluated], full[evaluated])
+
+    def test_screening_bounds_cover_computed_resistances(self):
+        table = ProfileTable.from_sheets(self.sheets)
+        props = {key: table[key] for key in (
+            "d", "bf", "tw", "tf", "h_faces", "h_clear", "Wx", "Zx", "Iy", "J", "Cw", "ry", "Peso", "Ix",
+        )}
+        screening = screen_profiles(props, dict(BASE_INPUTS, input_mode="Inserir Esforços Manualmente"))
+        flexure = flexural_strength_i_batch(props, 34.5, 45.0, 20_000.0, 500.0, 1.0, table["fabrication"])
+        shear = shear_strength_i_batch(props, 34.5, 20_000.0)
+        self.assertTrue(np.all(flexure["Mrd_FLA_or_tension"] <= screening["Mrd_bound"]))
+        self.assertTrue(np.all(shear["Vrd"] <= screening["Vrd_bound"]))
+
+    def test_lightest_search_matches_sorted_full_evaluation(self):
+        table = ProfileTable.from_sheets(self.sheets)
+        for variant in ({}, dict(L_cm=900.0, Lb_projeto=900.0, q_q_kn_cm=0.4)):
+            inputs = dict(BASE_INPUTS, **variant)
+            full = evaluate_catalog(inputs, table)
+            approved = full[full["Status"] == "APROVADO"].sort_values("Peso (kg/m)", kind="stable")
+            for top in (1, 3):
+                with self.subTest(variant=variant, top=top):
+                    search = lightest_profiles(inputs, table, top=top)
+                    expected = approved.groupby("Tipo", sort=False).head(top)
+                    expected = pd.concat([expected[expected["Tipo"] == family] for family in self.sheets])
+                    self.assertEqual(list(search["profiles"]["Perfil"]), list(expected["Perfil"]))
+                    for column in ("Ef. FLT (%)", "Ef. Flecha (%)"):
+                        np.testing.assert_array_equal(search["profiles"][column], expected[column])
+                    self.assertLess(search["full_evaluations"], len(table) // 4)
+                    self.assertEqual(
+                        search["full_evaluations"],
+                        sum(item["full_evaluations"] for item in search["families"].values()),
+                    )
+
+
+    def test_lightest_search_without_profiles_in_bounds_is_empty(self):
+        search = lightest_profiles(BASE_INPUTS, ProfileTable.from_sheets(self.sheets), bounds={"d": (1_000.0, None)})
+        self.assertTrue(search["profiles"].empty)
+        self.assertEqual(search["full_evaluations"], 0)
+
+    def test_property_ranges_match_brute_force_filter(self):
+        table = ProfileTable.from_sheets(self.sheets)
+        valid = table["valid"]
+        cases = (
+            {"Ix": (18_000.0, None), "d": (None, 45.0)},
+            {"Peso": (20.0, 60.0)},
+            {"bf": (15.0, 15.0), "Zx": (None, 2_000.0), "Aw": (10.0, None)},
+            {"Wx": (1e9, None)},
+        )
+        for bounds in cases:
+            with self.subTest(bounds=bounds):
+                mask = valid.copy()
+                for key, (low, high) in bounds.items():
+                    mask &= table[key] >= (-np.inf if low is None else low)
+                    mask &= table[key] <= (np.inf if high is None else high)
+                expected = np.flatnonzero(mask)
+                expected = expected[np.argsort(table["Peso"][expected], kind="stable")]
+                np.testing.assert_array_equal(table.query(**bounds), expected)
+        np.testing.assert_array_equal(table["Aw"], table["d"] * table["tw"])
+        with self.assertRaises(ValueError):
+            table.range_rows("tw", 0.5)
+
+    def test_bounded_evaluation_keeps_only_profiles_in_range(self):
+        table = ProfileTable.from_sheets(self.sheets)
+        bounds = {"Ix": (18_000.0, None), "d": (None, 45.0)}
+        full = evaluate_catalog(BASE_INPUTS, table)
+        bounded = evaluate_catalog(BASE_INPUTS, table, bounds=bounds)
+        expected = full.iloc[np.sort(table.query(**bounds))].reset_index(drop=True)
+        pd.testing.assert_frame_equal(bounded, expected.drop(columns=["Observação"], errors="ignore"))
+
+        empty = evaluate_catalog(BASE_INPUTS, table, bounds={"d": (1_000.0, None)}, prune=True)
+        self.assertTrue(empty.empty)
+        self.assertEqual(list(empty.columns[:4]), ["Tipo", "Perfil", "Peso (kg/m)", "Status"])
+        self.assertIn("Estado-limite governante", empty.columns)
+        self.assertEqual(len(empty[empty["Tipo"] == "Laminados"]), 0)
+
+    def assertCapacityBracket(self, table, capacity, column, inputs_at, step):
+        # O valor encontrado é aprovado e o seguinte, acima da tolerância, não.
+        catalog_rows = np.flatnonzero(table["valid"])
+        for position in np.flatnonzero(capacity[column].notna())[::37]:
+            row = capacity.iloc[position]
+            checks = [(row[column], True)]
+            if row["Status além do limite"] is not None:
+                checks.append((row[column] + step, False))
+            for value, expected in checks:
+                with self.subTest(profile=row["Perfil"], value=value):
+                    frame = evaluate_catalog(inputs_at(value), table)
+                    status = frame["Status"].iloc[catalog_rows[position]]
+                    self.assertEqual(status == "APROVADO", expected)
+
+    def test_max_span_brackets_the_approved_span(self):
+        table = ProfileTable.from_sheets(self.sheets)
+        inputs = dict(BASE_INPUTS, p_g_kn=10.0, p_q_kn=15.0, p_pos_cm=200.0, Lb_projeto=250.0)
+
+        def inputs_at(span):
+            ratio = span / inputs["L_cm"]
+            return dict(
+                inputs, L_cm=span, Lb_projeto=inputs["Lb_projeto"] * ratio,
+                local_unbraced_cm=inputs["local_unbraced_cm"] * ratio, p_pos_cm=inputs["p_pos_cm"] * ratio,
+            )
+
+        capacity = max_span(inputs, table, tolerance=1.0)
+        self.assertEqual(len(capacity), int(table["valid"].sum()))
+        self.assertTrue(capacity["Estado-limite governante"].notna().all())
+        self.assertCapacityBracket(table, capacity, "Vão máximo (cm)", inputs_at, 1.0)
+
+    def test_max_variable_load_brackets_the_approved_load(self):
+        table = ProfileTable.from_sheets(self.sheets)
+        capacity = max_variable_load(BASE_INPUTS, table, tolerance=1e-3)
+        np.testing.assert_allclose(
+            capacity["Carga variável máxima (kN/m)"],
+            capacity["Fator de carga variável"] * BASE_INPUTS["q_q_kn_cm"] * 100.0,
+        )
+
+        def inputs_at(factor):
+            return dict(BASE_INPUTS, q_q_kn_cm=BASE_INPUTS["q_q_kn_cm"] * factor)
+
+        self.assertCapacityBracket(table, capacity, "Fator de carga variável", inputs_at, 1e-3)
+        with self.assertRaises(ValueError):
+            max_variable_load(dict(BASE_INPUTS, input_mode="Inserir Esforços Manualmente"), table)
+
+    def test_process_pool_matches_single_process_evaluation(self):
+        table = ProfileTable.from_sheets(self.sheets)
+        executor = make_catalog_executor(2)
+        self.addCleanup(executor.shutdown)
+        for variant in ({}, dict(p_q_kn=20.0, p_pos_cm=150.0), dict(tipo_viga="Inválida")):
+            inputs = dict(BASE_INPUTS, **variant)
+            with self.subTest(variant=variant):
+                pd.testing.assert_frame_equal(
+                    evaluate_catalog(inputs, table, executor=executor, chunk_rows=37),
+                    evaluate_catalog(inputs, table),
+                )
+        modules = executor.submit(eval, "sorted(__import__('sys').modules)").result()
+        for name in ("streamlit", "plotly", "openpyxl", "main"):
+            self.assertNotIn(name, modules)
+
+    def test_process_pool_does_not_reimport_a_streamlit_entry_script(self):
+        # Sob ``streamlit run``, o ``__main__`` é o script do Streamlit.
+        with tempfile.TemporaryDirectory() as folder:
+            script = Path(folder) / "entrada.py"
+            script.write_text(
+                "import sys\n"
+                "import streamlit.web.cli\n"
+                f"sys.path.insert(0, {str(ROOT)!r})\n"
+                "from analise_catalogo import make_catalog_executor\n"
+                "if __name__ == '__main__':\n"
+                "    executor = make_catalog_executor(1)\n"
+                "    print(executor.submit(eval, \"sorted(__import__('sys').modules)\").result())\n"
+                "    executor.shutdown()\n",
+                encoding="utf-8",
+            )
+            output = subprocess.run(
+                [sys.executable, str(script)], capture_output=True, text=True, check=True, timeout=120,
+            ).stdout
+        modules = eval(output)
+        self.assertIn("analise_catalogo", modules)
+        for name in ("streamlit", "plotly", "main"):
+            self.assertNotIn(name, modules)
+
+    def test_evaluation_cache_reuses_capacities_when_only_loads_change(self):
+        table = ProfileTable.from_sheets(self.sheets)
+        cache = EvaluationCache()
+        variants = (
+            {},
+            dict(cb_modo_auto=False, Cb_projeto=1.3, usa_enrijecedores=True, a_enr=100.0),
+            dict(p_g_kn=10.0, p_q_kn=15.0, p_pos_cm=180.0, Lb_projeto=250.0, local_unbraced_cm=100.0),
+            dict(combination_envelope=True, variable_actions=[VariableAction("Uso", 0.12)]),
+            dict(input_mode="Inserir Esforços Manualmente", Msd=5000.0, Vsd=80.0),
+        )
+        for variant in variants:
+            inputs = dict(BASE_INPUTS, **variant)
+            with self.subTest(variant=variant):
+                expected = evaluate_catalog(inputs, table)
+                for _ in range(2):
+                    pd.testing.assert_frame_equal(evaluate_catalog(inputs, table, cache=cache), expected)
+
+        # Ajustes de Qk e Gk recalculam apenas as demandas, inclusive com Cb automático.
+        hits = dict(cache.hits)
+        for q_area, g_area in ((3.1, 1.5), (3.2, 1.7)):
+            inputs = dict(BASE_INPUTS, q_area=q_area, q_q_kn_cm=q_area * 0.04, g_area=g_area, q_g_kn_cm=g_area * 0.04)
+            pd.testing.assert_frame_equal(evaluate_catalog(inputs, table, cache=cache), evaluate_catalog(inputs, table))
+        self.assertEqual(cache.hits["capacity"], hits["capacity"] + 2)
+        self.assertEqual(cache.hits["demand"], hits["demand"])
+
+        # Mudar o aço invalida as capacidades e mantém as demandas.
+        hits = dict(cache.hits)
+        evaluate_catalog(dict(BASE_INPUTS, fy_aco=25.0), table, cache=cache)
+        self.assertEqual(cache.hits["capacity"], hits["capacity"])
+        self.assertEqual(cache.hits["demand"], hits["demand"] + 1)
+
+    def test_full_catalog_is_evaluated_quickly(self):
+        evaluate_catalog(BASE_INPUTS, self.sheets)
+        start = time.perf_counter()
+        evaluate_catalog(BASE_INPUTS, self.sheets)
+        self.assertLess(time.perf_counter() - start, 0.5)
+        actions = [{"name": f"Q{index}", "q": 0.02 * index} for index in range(1, 6)]
+        start = time.perf_counter()
+        evaluate_catalog(dict(BASE_INPUTS, combination_envelope=True, variable_actions=actions), self.sheets)
+        self.assertLess(time.perf_counter() - start, 0.5)
+
+
+if __name__ == "__main__":
+    unittest.main()
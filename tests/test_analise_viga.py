@@ -0,0 +1,250 @@
+import math
+import unittest
+
+import numpy as np
+
+from analise_viga import (
+    DistributedLoad,
+    PointLoad,
+    Span,
+    analyze_beam_loads,
+    analyze_continuous_beam,
+    moving_load_checks,
+    moving_load_envelope,
+)
+from calculos_nbr8800_2024 import analyze_beam, calculate_cb, flexural_strength_i
+from verificacao_nbr8800_2024 import perform_all_checks
+
+
+SUPPORTS = ("Bi-apoiada", "Engastada e Livre (Balanço)", "Bi-engastada", "Engastada e Apoiada")
+
+
+class PiecewiseBeamTests(unittest.TestCase):
+    def assertClose(self, value, expected, scale=1.0):
+        self.assertTrue(
+            math.isclose(value, expected, rel_tol=1e-9, abs_tol=1e-9 * scale),
+            f"{value} != {expected}",
+        )
+
+    def test_single_loads_match_closed_form_engine(self):
+        for support in SUPPORTS:
+            with self.subTest(support=support):
+                reference = analyze_beam(
+                    support, 600.0, 0.08, 25.0, 210.0, E=20_000.0, I=8_000.0, samples=None
+                )
+                beam = analyze_beam_loads(
+                    support, 600.0, [PointLoad(210.0, 25.0)], [DistributedLoad(0.0, 600.0, 0.08)],
+                    E=20_000.0, I=8_000.0,
+                )
+                scale = reference.max_moment
+                self.assertClose(beam.reaction_left, reference.reaction_left, scale)
+                self.assertClose(beam.reaction_right, reference.reaction_right, scale)
+                self.assertClose(beam.moment_left, reference.moment_left, scale)
+                self.assertClose(beam.moment_right, reference.moment_right, scale)
+                self.assertClose(beam.max_moment, reference.max_moment, scale)
+                self.assertClose(beam.max_shear, reference.max_shear, scale)
+                self.assertClose(beam.max_deflection, reference.max_deflection)
+                self.assertClose(
+                    calculate_cb(beam, 100.0, 350.0)["Cb"], calculate_cb(reference, 100.0, 350.0)["Cb"]
+                )
+
+    def test_triangular_load_on_simply_supported_beam(self):
+        L, w = 500.0, 0.12
+        beam = analyze_beam_loads("Bi-apoiada", L, distributed_loads=[(0.0, L, 0.0, w)])
+        self.assertClose(beam.reaction_left, w * L / 6.0)
+        self.assertClose(beam.reaction_right, w * L / 3.0)
+        self.assertClose(beam.max_moment, w * L**2 / (9.0 * math.sqrt(3.0)))
+        self.assertClose(beam.max_moment_position, L / math.sqrt(3.0))
+
+    def test_partial_loads_superpose_to_full_load(self):
+        halves = analyze_beam_loads(
+            "Bi-engastada", 800.0, distributed_loads=[(0.0, 300.0, 0.1), (300.0, 800.0, 0.1)],
+            E=20_000.0, I=12_000.0,
+        )
+        full = analyze_beam_loads(
+            "Bi-engastada", 800.0, distributed_loads=[(0.0, 800.0, 0.1)], E=20_000.0, I=12_000.0,
+        )
+        xs = np.linspace(0.0, 800.0, 37)
+        np.testing.assert_allclose(halves.moment_at(xs), full.moment_at(xs), atol=1e-8)
+        np.testing.assert_allclose(halves.deflection_at(xs), full.deflection_at(xs), atol=1e-12)
+
+    def test_many_point_loads_respect_boundary_conditions_and_extremes(self):
+        rng = np.random.default_rng(7)
+        L = 1_200.0
+        points = [(float(x), float(p)) for x, p in zip(rng.uniform(0.0, L, 60), rng.uniform(1.0, 40.0, 60))]
+        loads = [(100.0, 900.0, 0.05, 0.2)]
+        for support in SUPPORTS:
+            with self.subTest(support=support):
+                beam = analyze_beam_loads(support, L, points, loads, E=20_000.0, I=30_000.0)
+                total = sum(p for _, p in points) + 0.125 * 800.0
+                self.assertClose(beam.reaction_left + beam.reaction_right, total, total)
+                xs = np.linspace(0.0, L, 120_001)
+                self.assertGreaterEqual(beam.max_moment, np.abs(beam.moment_at(xs)).max())
+                self.assertGreaterEqual(beam.max_deflection, np.abs(beam.deflection_at(xs)).max())
+                self.assertAlmostEqual(beam.max_moment, np.abs(beam.moment_at(xs)).max(), delta=1e-4 * beam.max_moment)
+                if support != "Engastada e Livre (Balanço)":
+                    self.assertAlmostEqual(float(beam.deflection_at(L)), 0.0, places=10)
+                for root in beam.roots("shear"):
+                    self.assertGreaterEqual(root, 0.0)
+                    self.assertLessEqual(root, L)
+
+    def test_invalid_loads_are_rejected(self):
+        with self.assertRaises(ValueError):
+            analyze_beam_loads("Bi-apoiada", 500.0, [(600.0, 10.0)])
+        with self.assertRaises(ValueError):
+            analyze_beam_loads("Bi-apoiada", 500.0, distributed_loads=[(300.0, 200.0, 0.1)])
+        with self.assertRaises(ValueError):
+            analyze_beam_loads("Bi-apoiada", 500.0, [(100.0, -5.0)])
+
+
+class ContinuousBeamTests(unittest.TestCase):
+    def assertClose(self, value, expected, scale=1.0):
+        self.assertTrue(
+            math.isclose(value, expected, rel_tol=1e-9, abs_tol=1e-9 * scale),
+            f"{value} != {expected}",
+        )
+
+    def test_equal_spans_under_uniform_load_match_tabulated_coefficients(self):
+        w, L = 0.1, 600.0
+        two = analyze_continuous_beam([Span(L, 10_000.0, (), ((0.0, L, w),))] * 2, 20_000.0)
+        self.assertClose(two.support_moments[1], -w * L**2 / 8.0, w * L**2)
+        np.testing.assert_allclose(two.reactions / (w * L), [0.375, 1.25, 0.375])
+        three = analyze_continuous_beam([Span(L, 10_000.0, (), ((0.0, L, w),))] * 3, 20_000.0)
+        np.testing.assert_allclose(three.support_moments / (w * L**2), [0.0, -0.1, -0.1, 0.0], atol=1e-12)
+        np.testing.assert_allclose(three.reactions / (w * L), [0.4, 1.1, 1.1, 0.4])
+
+    def test_single_span_end_conditions_match_single_span_models(self):
+        span = Span(600.0, 10_000.0, ((200.0, 30.0),), ((0.0, 600.0, 0.1),))
+        cases = (("fixed", "fixed", "Bi-engastada"), ("fixed", "pinned", "Engastada e Apoiada"),
+                 ("pinned", "pinned", "Bi-apoiada"))
+        for left, right, support in cases:
+            with self.subTest(support=support):
+                beam = analyze_continuous_beam([span], 20_000.0, left, right)
+                reference = analyze_beam_loads(
+                    support, 600.0, span.point_loads, span.distributed_loads, E=20_000.0, I=10_000.0,
+                )
+                scale = reference.max_moment
+                self.assertClose(beam.support_moments[0], reference.moment_left, scale)
+                self.assertClose(beam.support_moments[1], reference.moment_right, scale)
+                self.assertClose(beam.reactions[0], reference.reaction_left, scale)
+                self.assertClose(beam.spans[0].max_moment, reference.max_moment, scale)
+                self.assertClose(beam.spans[0].max_deflection, reference.max_deflection)
+
+    def test_moment_at_handles_more_spans_than_numpy_choose(self):
+        w, L = 0.1, 300.0
+        beam = analyze_continuous_beam([Span(L, 10_000.0, (), ((0.0, L, w),))] * 80, 20_000.0)
+        scale = w * L**2
+        x = beam.support_positions[:-1] + L / 2
+        expected = [span.moment_at(L / 2) for span in beam.spans]
+        np.testing.assert_allclose(beam.moment_at(x[::-1]), expected[::-1], atol=1e-9 * scale)
+        np.testing.assert_allclose(beam.moment_at(beam.support_positions[1:-1]),
+                                   beam.support_moments[1:-1], atol=1e-9 * scale)
+        self.assertEqual(beam.moment_at(x.reshape(8, 10)).shape, (8, 10))
+        self.assertClose(float(beam.moment_at(x[40])), expected[40], scale)
+
+    def test_spans_feed_cb_and_resistance_checks(self):
+        rng = np.random.default_rng(11)
+        spans = [
+            Span(float(length), 20_000.0, tuple((float(x), 25.0) for x in rng.uniform(0.0, 400.0, 4)),
+                 ((0.0, 400.0, 0.08),))
+            for length in rng.uniform(450.0, 800.0, 10)
+        ]
+        beam = analyze_continuous_beam(spans, 20_000.0)
+        self.assertEqual(len(beam.spans), 10)
+        self.assertClose(
+            float(beam.reactions.sum()),
+            sum(25.0 * 4 + 0.08 * 400.0 for _ in spans), 1.0,
+        )
+        props = {
+            "d": 45.0, "bf": 20.0, "tw": 0.8, "tf": 1.25, "h_clear": 40.4, "Wx": 1_500.0,
+            "Zx": 1_700.0, "Iy": 1_670.0, "J": 40.0, "Cw": 800_000.0, "ry": 4.2,
+        }
+        for span, limit in zip(beam.spans, beam.deflection_limits(350.0)):
+            cb = calculate_cb(span)
+            self.assertGreaterEqual(cb["Cb"], 1.0)
+            flexure = flexural_strength_i(props, 34.5, 45.0, 20_000.0, span.length, cb["Cb"], "Soldado")
+            self.assertGreater(flexure["Mrd"], 0.0)
+            self.assertEqual(limit, span.length / 350.0)
+        positions = beam.support_positions
+        np.testing.assert_allclose(beam.moment_at(positions[1:-1]), beam.support_moments[1:-1], atol=1e-6)
+
+
+class MovingLoadEnvelopeTests(unittest.TestCase):
+    def test_envelopes_bound_every_load_position(self):
+        L, P, q = 800.0, 60.0, 0.05
+        positions = np.linspace(0.0, L, 401)
+        for support in SUPPORTS:
+            with self.subTest(support=support):
+                envelope = moving_load_envelope(support, L, P, q, 101, E=20_000.0, I=20_000.0)
+                responses = [
+                    analyze_beam(support, L, q, P, float(a), E=20_000.0, I=20_000.0, samples=None)
+                    for a in positions
+                ]
+                moments = np.array([[r.moment_at(x) for x in envelope.sections] for r in responses])
+                self.assertTrue(np.all(envelope.moment_max >= moments.max(axis=0) - 1e-9))
+                self.assertTrue(np.all(envelope.moment_min <= moments.min(axis=0) + 1e-9))
+                self.assertLessEqual(
+                    envelope.max_moment - max(r.max_moment for r in responses), 1e-4 * envelope.max_moment
+                )
+                self.assertAlmostEqual(envelope.max_shear, max(r.max_shear for r in responses), places=9)
+                self.assertAlmostEqual(
+                    envelope.reaction_left_max, max(r.reaction_left for r in responses), places=9
+                )
+                self.assertGreaterEqual(
+                    envelope.max_deflection, max(r.max_deflection for r in responses) - 1e-12
+                )
+
+    def test_simply_supported_closed_form_and_checks(self):
+        L, P = 600.0, 40.0
+        envelope = moving_load_envelope("Bi-apoiada", L, P, sections=7, E=20_000.0, I=30_000.0)
+        self.assertAlmostEqual(envelope.max_moment, P * L / 4.0, places=8)
+        np.testing.assert_allclose(envelope.moment_max, P * envelope.sections * (L - envelope.sections) / L, atol=1e-8)
+        np.testing.assert_allclose(
+            envelope.moment_max_load_position[1:-1], envelope.sections[1:-1], atol=1e-9
+        )
+        self.assertAlmostEqual(envelope.max_deflection, P * L**3 / (48.0 * 20_000.0 * 30_000.0), places=10)
+        props = {
+            "d": 45.0, "bf": 20.0, "tw": 0.8, "tf": 1.25, "h_clear": 40.4, "Wx": 1_500.0,
+            "Zx": 1_700.0, "Iy": 1_670.0, "J": 40.0, "Cw": 800_000.0, "ry": 4.2,
+        }
+        result = moving_load_checks(
+            envelope, envelope, props, 34.5, 45.0, 20_000.0, L, 1.0, "Soldado", 600.0
+        )
+        self.assertEqual(result["checks"]["Cisalhamento"]["demand"], P)
+        self.assertIn(result["status"], ("APROVADO", "REPROVADO"))
+
+    def test_checks_apply_the_scope_and_rupture_gates_of_perform_all_checks(self):
+        L, P = 600.0, 5.0
+        envelope = moving_load_envelope("Bi-apoiada", L, P, sections=7, E=20_000.0, I=30_000.0)
+        # Alma esbelta em perfil laminado: fora do escopo do Anexo E.
+        props = {
+            "d": 45.0, "bf": 20.0, "tw": 0.25, "tf": 1.25, "h_faces": 42.5, "h_clear": 40.4, "Area": 60.0,
+            "Ix": 30_000.0, "Wx": 1_500.0, "rx": 18.0, "Zx": 1_700.0, "Iy": 1_670.0, "ry": 4.2,
+            "J": 40.0, "Cw": 800_000.0, "Peso": 47.0,
+        }
+        result = moving_load_checks(
+            envelope, envelope, props, 34.5, 45.0, 20_000.0, L, 1.0, "Laminado", 600.0
+        )
+        res_flt, *_ = perform_all_checks(
+            props, 34.5, L, 1.0, L, envelope.max_moment, envelope.max_shear, 0.0, None, "Bi-apoiada",
+            "Inserir Esforços Manualmente", "Laminado", False, 0.0, 600.0, {}, 20_000.0,
+            manual_local_checks_confirmed=True,
+        )
+        self.assertTrue(result["scope_issues"])
+        self.assertEqual(result["status"], "NÃO VERIFICADO")
+        self.assertEqual(result["status"], res_flt["status_global"])
+
+        props["tw"] = 0.8
+        result = moving_load_checks(envelope, envelope, props, 34.5, 30.0, 20_000.0, L, 1.0, "Laminado", 600.0)
+        self.assertEqual(result["status"], "NÃO VERIFICADO")
+        result = moving_load_checks(
+            envelope, envelope, props, 34.5, 45.0, 20_000.0, L, 1.0, "Laminado", 600.0,
+            tension_flange_net_ratio=0.5,
+        )
+        rupture = result["checks"]["Ruptura da mesa"]
+        self.assertNotEqual(rupture["status"], "N/A")
+        self.assertAlmostEqual(rupture["efficiency"], envelope.max_moment / result["flexure"]["Mrd_rupture"] * 100.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
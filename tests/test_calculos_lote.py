@@ -0,0 +1,293 @@
+import math
+from pathlib import Path
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from calculos_lote_nbr8800_2024 import (
+    flexural_applicability_issues,
+    flexural_strength_i_batch,
+    local_compression_strength_batch,
+    max_deflection_batch,
+    shear_strength_i_batch,
+    unit_load_beam,
+)
+from calculos_nbr8800_2024 import (
+    analyze_beam,
+    calculate_cb,
+    flexural_strength_i,
+    local_compression_strength,
+    shear_strength_i,
+)
+
+
+ROOT = Path(__file__).resolve().parents[1]
+
+
+def catalog_columns():
+    workbook = pd.read_excel(ROOT / "perfis.xlsx", sheet_name=None)
+    frame = pd.concat(workbook.values(), ignore_index=True)
+    fabrication = np.concatenate([
+        np.full(len(sheet), "Laminado" if name == "Laminados" else "Soldado")
+        for name, sheet in workbook.items()
+    ])
+    columns = {
+        "d": frame["d (mm)"] / 10.0,
+        "bf": frame["bf (mm)"] / 10.0,
+        "tw": frame["tw (mm)"] / 10.0,
+        "tf": frame["tf (mm)"] / 10.0,
+        "h_faces": frame["h (mm)"] / 10.0,
+        "h_clear": frame["d' (mm)"] / 10.0,
+        "Ix": frame["Ix (cm4)"],
+        "Wx": frame["Wx (cm3)"],
+        "Zx": frame["Zx (cm3)"],
+        "Iy": frame["Iy (cm4)"],
+        "ry": frame["ry (cm)"],
+        "J": frame["It (cm4)"],
+        "Cw": frame["Cw (cm6)"],
+    }
+    return {key: value.to_numpy(dtype=float) for key, value in columns.items()}, fabrication
+
+
+def row(columns, index):
+    return {key: float(value[index]) for key, value in columns.items()}
+
+
+class BatchFlexureTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.columns, cls.fabrication = catalog_columns()
+
+    def assertColumnMatches(self, batch_value, scalar_value):
+        if scalar_value is None:
+            self.assertTrue(math.isnan(batch_value))
+        elif isinstance(scalar_value, str):
+            self.assertEqual(str(batch_value), scalar_value)
+        else:
+            self.assertTrue(math.isclose(batch_value, scalar_value, rel_tol=1e-12, abs_tol=1e-9))
+
+    def test_batch_flexure_matches_scalar_for_every_catalog_profile(self):
+        cases = (
+            dict(Lb=500.0, Cb=1.0),
+            dict(Lb=150.0, Cb=1.3, stiffener_spacing=60.0),
+            dict(Lb=1_200.0, Cb=1.0, flt_applicable=False),
+            dict(Lb=400.0, Cb=1.136, holes=0.70),
+        )
+        keys = (
+            "Mrd", "Mrd_FLM", "Mrd_FLA_or_tension", "Mrd_rupture", "Mcr_FLT",
+            "lambda_LT", "chi_LT", "regime_FLT", "regime_FLM", "regime_FLA", "kpg",
+        )
+        for case in cases:
+            case = dict(case)
+            holes = case.pop("holes", None)
+            extra = {}
+            if holes is not None:
+                gross = self.columns["bf"] * self.columns["tf"]
+                extra = dict(gross_tension_flange_area=gross, net_tension_flange_area=gross * holes)
+            with self.subTest(case=case, holes=holes):
+                batch = flexural_strength_i_batch(
+                    self.columns, 34.5, 45.0, 20_000.0,
+                    fabrication=self.fabrication, **case, **extra,
+                )
+                for index, fabrication in enumerate(self.fabrication):
+                    scalar_extra = {key: float(value[index]) for key, value in extra.items()}
+                    scalar = flexural_strength_i(
+                        row(self.columns, index), 34.5, 45.0, 20_000.0,
+                        fabrication=fabrication, **case, **scalar_extra,
+                    )
+                    for key in keys:
+                        self.assertColumnMatches(batch[key][index], scalar[key])
+                    if case.get("flt_applicable", True):
+                        self.assertColumnMatches(batch["Mrd_FLT"][index], scalar["Mrd_FLT"])
+                    else:
+                        self.assertIsNone(batch["Mrd_FLT"])
+                    self.assertEqual(bool(batch["slender_web"][index]), scalar["slender_web"])
+                    self.assertEqual(
+                        flexural_applicability_issues(batch, index),
+                        scalar["applicability_issues"],
+                    )
+
+    def test_annex_e_branches_and_issues_match_scalar(self):
+        slender = {
+            "d": 124.0, "bf": 30.0, "tw": 0.6, "tf": 2.0, "h_clear": 120.0,
+            "Wx": 3_000.0, "Zx": 3_400.0, "Iy": 4_500.0, "J": 50.0,
+            "Cw": 2_000_000.0, "ry": 3.0,
+        }
+        very_slender = dict(slender, tw=0.35, bf=8.0)
+        profiles = [slender, slender, very_slender]
+        fabrication = np.array(["Soldado", "Laminado", "Soldado"])
+        columns = {key: np.array([item[key] for item in profiles]) for key in slender}
+        batch = flexural_strength_i_batch(
+            columns, 34.5, 45.0, 20_000.0, 300.0, 1.0, fabrication,
+            stiffener_spacing=150.0,
+        )
+        for index, props in enumerate(profiles):
+            scalar = flexural_strength_i(
+                props, 34.5, 45.0, 20_000.0, 300.0, 1.0, fabrication[index],
+                stiffener_spacing=150.0,
+            )
+            self.assertTrue(batch["slender_web"][index])
+            self.assertEqual(flexural_applicability_issues(batch, index), scalar["applicability_issues"])
+            for key in ("Mrd", "Mrd_FLT", "Mrd_FLM", "annex_e_limit", "ryc"):
+                self.assertColumnMatches(batch[key][index], scalar[key])
+        self.assertEqual(batch["Mrd"][1], 0.0)
+        self.assertFalse(batch["applicable"][2])
+
+    def test_invalid_property_column_is_rejected(self):
+        columns = dict(self.columns)
+        columns["tw"] = columns["tw"].copy()
+        columns["tw"][3] = 0.0
+        with self.assertRaises(ValueError):
+            flexural_strength_i_batch(columns, 34.5, 45.0, 20_000.0, 500.0, 1.0, "Soldado")
+
+
+class BatchShearTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.columns, _ = catalog_columns()
+
+    def test_batch_shear_matches_scalar_with_and_without_stiffeners(self):
+        cases = (
+            {},
+            dict(stiffener_spacing=60.0, stiffener_width=10.0, stiffener_thickness=0.8,
+                 stiffener_welded_to_web_and_flanges=True),
+            dict(stiffener_spacing=40.0, stiffener_width=4.0, stiffener_thickness=0.8,
+                 stiffener_pair=False, stiffener_welded_to_web_and_flanges=True),
+            dict(stiffener_spacing=100.0, stiffener_width=10.0, stiffener_thickness=0.8),
+            dict(stiffener_spacing=100.0, stiffener_width=30.0, stiffener_thickness=0.5,
+                 stiffener_welded_to_web_and_flanges=True),
+        )
+        for case in cases:
+            with self.subTest(case=case):
+                batch = shear_strength_i_batch(self.columns, 34.5, 20_000.0, **case)
+                for index in range(len(self.columns["d"])):
+                    scalar = shear_strength_i(row(self.columns, index), 34.5, 20_000.0, **case)
+                    for key in ("Vrd", "Vpl", "lambda_p", "lambda_r", "kv", "a_h"):
+                        self.assertTrue(math.isclose(batch[key][index], scalar[key], rel_tol=1e-12))
+                    for key in ("j", "I_st", "I_required"):
+                        if scalar[key] is None:
+                            self.assertTrue(math.isnan(batch[key][index]))
+                        else:
+                            self.assertTrue(math.isclose(batch[key][index], scalar[key], rel_tol=1e-12))
+                    self.assertEqual(batch["regime"][index], scalar["regime"])
+                    self.assertEqual(batch["kv_basis"][index], scalar["kv_basis"])
+                    self.assertEqual(bool(batch["stiffener_valid"][index]), scalar["stiffener_valid"])
+                    passed = [check["passed"] for check in scalar["stiffener_checks"]]
+                    if passed:
+                        self.assertEqual(passed, [
+                            batch["stiffener_welded_ok"],
+                            bool(batch["stiffener_slenderness_ok"][index]),
+                            bool(batch["stiffener_inertia_ok"][index]),
+                        ])
+
+
+class BatchLocalForceTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.columns, cls.fabrication = catalog_columns()
+
+    def test_profiles_by_locations_matrix_matches_scalar(self):
+        bearing = np.array([10.0, 12.0, 4.0, 30.0])
+        distance = np.array([0.0, 0.0, 250.0, 15.0])
+        movement_restrained = np.array([True, True, False, False])
+        moments = np.outer(np.linspace(0.0, 40_000.0, len(self.fabrication)), [0.0, 0.0, 1.0, 0.5])
+        for rotation_restrained in (True, False):
+            with self.subTest(rotation_restrained=rotation_restrained):
+                batch = local_compression_strength_batch(
+                    self.columns, 34.5, 20_000.0, bearing, distance, self.fabrication,
+                    weld_root_or_radius=0.3, lateral_unbraced_length=500.0,
+                    flange_rotation_restrained=rotation_restrained,
+                    relative_lateral_movement_restrained=movement_restrained,
+                    moment_at_load=moments,
+                )
+                self.assertEqual(batch["FRd"].shape, (len(self.fabrication), len(bearing)))
+                for index, fabrication in enumerate(self.fabrication):
+                    for location in range(len(bearing)):
+                        scalar = local_compression_strength(
+                            row(self.columns, index), 34.5, 20_000.0,
+                            float(bearing[location]), float(distance[location]), fabrication,
+                            weld_root_or_radius=0.3, lateral_unbraced_length=500.0,
+                            flange_rotation_restrained=rotation_restrained,
+                            relative_lateral_movement_restrained=bool(movement_restrained[location]),
+                            moment_at_load=float(moments[index, location]),
+                        )
+                        for key in ("FRd", "yielding_FRd", "crippling_FRd", "sidesway_FRd", "Mr"):
+                            value = batch[key][index, location]
+                            if scalar[key] is None:
+                                self.assertTrue(math.isnan(value))
+                            else:
+                                self.assertTrue(math.isclose(value, scalar[key], rel_tol=1e-12))
+                        for key in ("yielding_case", "crippling_case", "sidesway_case"):
+                            self.assertEqual(batch[key][index, location], scalar[key])
+                        governing = batch["governing_index"][index, location]
+                        candidates = (scalar["yielding_FRd"], scalar["crippling_FRd"], scalar["sidesway_FRd"])
+                        self.assertEqual(candidates[governing], scalar["FRd"])
+
+    def test_boolean_welded_mask_matches_fabrication_labels(self):
+        welded = np.char.startswith(self.fabrication.astype(str), "Sold")
+        self.assertTrue(welded.any() and not welded.all())
+        results = [
+            (
+                local_compression_strength_batch(
+                    self.columns, 34.5, 20_000.0, 10.0, 0.0, fabrication, weld_root_or_radius=0.3,
+                    lateral_unbraced_length=500.0,
+                ),
+                flexural_strength_i_batch(self.columns, 34.5, 45.0, 20_000.0, 300.0, 1.0, fabrication),
+            )
+            for fabrication in (self.fabrication, welded)
+        ]
+        for labelled, masked in zip(*results):
+            for key in ("FRd", "yielding_FRd", "crippling_FRd", "Mrd", "Mrd_FLT", "Mrd_FLM"):
+                if key in labelled:
+                    np.testing.assert_array_equal(masked[key], labelled[key], err_msg=key)
+
+class BatchDeflectionTests(unittest.TestCase):
+    def test_analytic_deflection_matches_scalar_for_every_support(self):
+        q = np.linspace(0.0, 0.2, 7)
+        inertia = np.linspace(2_000.0, 40_000.0, 7)
+        supports = ("Bi-apoiada", "Engastada e Livre (Balanço)", "Bi-engastada", "Engastada e Apoiada")
+        for support in supports:
+            for point_load, position in ((0.0, 0.0), (25.0, 120.0), (10.0, 500.0)):
+                with self.subTest(support=support, point_load=point_load, position=position):
+                    deflection, x = max_deflection_batch(
+                        support, 500.0, q, point_load, position, 20_000.0, inertia,
+                    )
+                    for index in range(len(q)):
+                        scalar = analyze_beam(
+                            support, 500.0, float(q[index]), point_load, position,
+                            E=20_000.0, I=float(inertia[index]), samples=None,
+                        )
+                        self.assertTrue(math.isclose(
+                            deflection[index], scalar.max_deflection, rel_tol=1e-9, abs_tol=1e-12,
+                        ))
+                        if scalar.max_deflection > 0.0:
+                            self.assertTrue(math.isclose(
+                                x[index], scalar.max_deflection_position, rel_tol=1e-6, abs_tol=1e-6,
+                            ))
+
+    def test_unit_load_superposition_matches_direct_analysis(self):
+        q = np.linspace(0.02, 0.3, 5)
+        for support in ("Bi-apoiada", "Engastada e Livre (Balanço)", "Bi-engastada", "Engastada e Apoiada"):
+            with self.subTest(support=support):
+                beam = unit_load_beam(support, 700.0, 260.0)
+                self.assertIs(unit_load_beam(support, 700.0, 260.0), beam)
+                ra, rb, m0, mL, _ = beam.end_actions(q, 18.0)
+                max_moment, _ = beam.max_moment(q, 18.0)
+                max_shear = beam.max_shear(q, 18.0)
+                cb = beam.cb(q, 18.0, 100.0, 400.0)
+                for index, q_value in enumerate(q):
+                    direct = analyze_beam(support, 700.0, float(q_value), 18.0, 260.0, samples=None)
+                    direct_cb = calculate_cb(direct, 100.0, 400.0)
+                    expected = (
+                        (ra, direct.reaction_left), (rb, direct.reaction_right),
+                        (m0, direct.moment_left), (mL, direct.moment_right),
+                        (max_moment, direct.max_moment), (max_shear, direct.max_shear),
+                        (cb["Cb"], direct_cb["Cb"]), (cb["Mmax"], direct_cb["Mmax"]),
+                    )
+                    for column, value in expected:
+                        self.assertTrue(math.isclose(column[index], value, rel_tol=1e-12, abs_tol=1e-9))
+
+
+if __name__ == "__main__":
+    unittest.main()
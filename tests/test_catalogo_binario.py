@@ -0,0 +1,75 @@
+from pathlib import Path
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+import numpy as np
+import pandas as pd
+
+from catalogo_binario import (
+    VALUES_NAME, _frames, _read_manifest, compile_catalog, compiled_path, load_catalog, workbook_digest,
+)
+
+
+ROOT = Path(__file__).resolve().parents[1]
+
+
+class CompiledCatalogTests(unittest.TestCase):
+    def setUp(self):
+        self.directory = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, self.directory)
+        self.workbook = self.directory / "perfis.xlsx"
+        shutil.copy(ROOT / "perfis.xlsx", self.workbook)
+
+    def test_compiled_catalog_round_trips_the_workbook(self):
+        expected = pd.read_excel(self.workbook, sheet_name=None)
+        compile_catalog(self.workbook)
+        with mock.patch("catalogo_binario.pd.read_excel") as read_excel:
+            loaded = load_catalog(self.workbook)
+        read_excel.assert_not_called()
+        self.assertEqual(list(loaded), list(expected))
+        for name, frame in expected.items():
+            pd.testing.assert_frame_equal(loaded[name], frame)
+
+    def test_float_columns_are_read_only_views_of_the_memory_map(self):
+        compiled = compile_catalog(self.workbook)
+        values = np.load(compiled / VALUES_NAME, mmap_mode="r")
+        sheets = _frames(_read_manifest(compiled), values)
+        for name, frame in sheets.items():
+            floats = frame.select_dtypes("float64").columns
+            self.assertGreater(len(floats), 0)
+            # Operações que consolidam blocos não podem trazer as colunas para memória privada.
+            frame._consolidate_inplace()
+            for column in floats:
+                with self.subTest(sheet=name, column=column):
+                    array = frame[column].to_numpy()
+                    self.assertTrue(np.shares_memory(array, values))
+                    self.assertFalse(array.flags.writeable)
+        with self.assertRaises(ValueError):
+            sheets["CS"].loc[0, "tw (mm)"] = 99.0
+
+    def test_stale_hash_falls_back_to_workbook_and_recompiles(self):
+        compile_catalog(self.workbook)
+        sheets = pd.read_excel(self.workbook, sheet_name=None)
+        sheets["CS"].loc[0, "tw (mm)"] = 99.0
+        with pd.ExcelWriter(self.workbook) as writer:
+            for name, frame in sheets.items():
+                frame.to_excel(writer, sheet_name=name, index=False)
+
+        loaded = load_catalog(self.workbook)
+        self.assertEqual(loaded["CS"].loc[0, "tw (mm)"], 99.0)
+        manifest = (compiled_path(self.workbook) / "manifest.json").read_text(encoding="utf-8")
+        self.assertIn(workbook_digest(self.workbook), manifest)
+        with mock.patch("catalogo_binario.pd.read_excel") as read_excel:
+            self.assertEqual(load_catalog(self.workbook)["CS"].loc[0, "tw (mm)"], 99.0)
+        read_excel.assert_not_called()
+
+    def test_missing_compiled_catalog_reads_workbook_without_refresh(self):
+        loaded = load_catalog(self.workbook, refresh=False)
+        self.assertEqual(set(loaded), {"Laminados", "CS", "CVS", "VS"})
+        self.assertFalse(compiled_path(self.workbook).exists())
+
+
+if __name__ == "__main__":
+    unittest.main()
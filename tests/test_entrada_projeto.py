@@ -0,0 +1,88 @@
+from dataclasses import FrozenInstanceError, replace
+import os
+from pathlib import Path
+import subprocess
+import sys
+import unittest
+
+import pandas as pd
+
+from analise_catalogo import ProfileTable, evaluate_catalog
+from calculos_nbr8800_2024 import VariableAction
+from entrada_projeto import DesignInput
+from test_analise_catalogo import BASE_INPUTS
+
+
+ROOT = Path(__file__).resolve().parents[1]
+
+
+class DesignInputTests(unittest.TestCase):
+    def test_hash_ignores_presentation_and_tracks_engineering_fields(self):
+        design = DesignInput.from_params(BASE_INPUTS)
+        renamed = DesignInput.from_params(dict(
+            BASE_INPUTS, projeto_info={"nome": "Outro", "engenheiro": "B", "revisao": "03"},
+            els_combination_text="Rara",
+        ))
+        self.assertEqual(design, renamed)
+        self.assertEqual(hash(design), hash(renamed))
+        self.assertEqual(design.content_hash, renamed.content_hash)
+        # Tipos e representações equivalentes têm a mesma forma canônica.
+        same = DesignInput.from_params(dict(
+            BASE_INPUTS, L_cm=500, limite_flecha_divisor="350", Msd=-0.0, scope_notes=(), lb_start_cm=0,
+        ))
+        self.assertEqual(same.content_hash, design.content_hash)
+        changes = (
+            {"L_cm": 501.0}, {"psi1": 0.7}, {"usa_enrijecedores": True, "a_enr": 100.0},
+            {"cb_source": "Análise de estabilidade"}, {"Lb_projeto": 250.0},
+            {"variable_actions": [VariableAction("Q1", q=0.1)]},
+        )
+        hashes = {design.content_hash}
+        for change in changes:
+            with self.subTest(change=change):
+                hashes.add(replace(design, **change).content_hash)
+        self.assertEqual(len(hashes), len(changes) + 1)
+        with self.assertRaises(FrozenInstanceError):
+            design.L_cm = 600.0
+
+    def test_hash_is_stable_across_processes(self):
+        code = (
+            "from entrada_projeto import DesignInput; "
+            "print(DesignInput(L_cm=640, q_g_kn_cm=0.05, projeto_info={'nome': 'X'}).content_hash)"
+        )
+        hashes = {
+            subprocess.run(
+                [sys.executable, "-c", code], cwd=ROOT, capture_output=True, text=True, check=True,
+                env=dict(os.environ, PYTHONHASHSEED=seed),
+            ).stdout.strip()
+            for seed in ("1", "2")
+        }
+        self.assertEqual(hashes, {DesignInput(L_cm=640.0, q_g_kn_cm=0.05).content_hash})
+
+    def test_round_trip_keeps_results(self):
+        sheets = pd.read_excel(ROOT / "perfis.xlsx", sheet_name=None)
+        table = ProfileTable.from_sheets(sheets)
+        params = dict(BASE_INPUTS, larg_inf_total_m=2.0, q_g_kn_cm=0.03, q_q_kn_cm=0.06, q_serv_kn_cm=0.09,
+                      p_q_kn=12.0, p_pos_cm=180.0, p_load_serv=(12.0, 180.0))
+        design = DesignInput.from_params(params)
+        rebuilt = design.to_params()
+        self.assertEqual(DesignInput.from_params(rebuilt), design)
+        for name in ("q_serv_kn_cm", "p_load_serv", "larg_inf_total_m", "projeto_info"):
+            self.assertEqual(rebuilt[name], params[name])
+        pd.testing.assert_frame_equal(evaluate_catalog(rebuilt, table), evaluate_catalog(params, table))
+        defaults = DesignInput(L_cm=300.0)
+        self.assertEqual((defaults.Lb_projeto, defaults.local_unbraced_cm, defaults.p_pos_cm), (300.0, 300.0, 150.0))
+
+    def test_invalid_inputs_are_rejected(self):
+        invalid = (
+            {"tipo_viga": "Treliça"}, {"L_cm": 0.0}, {"L_cm": "nan"}, {"Lb_projeto": 600.0},
+            {"lb_start_cm": 100.0}, {"p_pos_cm": 520.0}, {"q_q_kn_cm": -0.1}, {"psi2": 0.9},
+            {"tension_flange_net_ratio": 1.2}, {"usa_enrijecedores": True, "a_enr": 0.0},
+            {"els_combination": "rara"}, {"els_combinations": ("rare", "rara")}, {"cor": "azul"},
+        )
+        for change in invalid:
+            with self.subTest(change=change), self.assertRaises(ValueError):
+                DesignInput.from_params(dict(BASE_INPUTS, **change))
+
+
+if __name__ == "__main__":
+    unittest.main()
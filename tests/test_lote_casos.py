@@ -0,0 +1,115 @@
+import importlib.util
+import json
+from pathlib import Path
+import tempfile
+import unittest
+
+import pandas as pd
+
+from analise_catalogo import ProfileTable, evaluate_catalog
+from lote_casos import case_params, read_cases, run_cases
+from test_analise_catalogo import BASE_INPUTS
+
+
+ROOT = Path(__file__).resolve().parents[1]
+CASES = [
+    {"caso": "V1", "L_cm": "600", "g_area": "1,5", "q_area": "3", "material": "ASTM A36", "cb_modo_auto": "sim"},
+    {"caso": "V2", "tipo_viga": "Bi-engastada", "L_cm": 800, "larg_esq_cm": 250, "larg_dir_cm": 250,
+     "usa_enrijecedores": True, "a_enr": 100, "p_q_kn": 20, "Lb_projeto": 400},
+    {"caso": "V3", "tipo_viga": "Engastada e Livre (Balanço)", "L_cm": 300, "q_area": 2},
+]
+
+
+class DesignCaseTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.table = ProfileTable.from_sheets(pd.read_excel(ROOT / "perfis.xlsx", sheet_name=None))
+
+    def test_case_fields_follow_sidebar_defaults_and_derivations(self):
+        # Largura de influência B = (200 + 200) / 200 = 2 m, como na barra lateral.
+        sidebar = dict(BASE_INPUTS, q_g_kn_cm=0.03, q_q_kn_cm=0.06, q_serv_kn_cm=0.09)
+        pd.testing.assert_frame_equal(
+            evaluate_catalog(case_params({}), self.table), evaluate_catalog(sidebar, self.table)
+        )
+        params = case_params(CASES[0])
+        self.assertEqual((params["fy_aco"], params["fu_aco"]), (25.0, 40.0))
+        self.assertAlmostEqual(params["q_g_kn_cm"], 0.03)
+        self.assertEqual((params["Lb_projeto"], params["local_unbraced_cm"], params["p_pos_cm"]), (600.0, 600.0, 300.0))
+        params = case_params(CASES[1])
+        self.assertEqual(params["local_unbraced_cm"], 400.0)
+        self.assertEqual(params["p_load_serv"], (20.0, 400.0))
+        self.assertFalse(case_params(CASES[2])["cb_modo_auto"])
+        for case in ({"vao": 500}, {"material": "S355"}, {"L_cm": "quinhentos"}, {"cb_modo_auto": "talvez"}):
+            with self.subTest(case=case), self.assertRaises(ValueError):
+                case_params(case)
+
+    def test_scope_gates_match_the_sidebar(self):
+        # Parâmetros que a barra lateral monta para Cb manual = 2,5 sem origem informada.
+        sidebar = dict(
+            BASE_INPUTS, q_g_kn_cm=0.03, q_q_kn_cm=0.06, q_serv_kn_cm=0.09, cb_modo_auto=False, Cb_projeto=2.5,
+            unsupported_reasons=[
+                "Cb manual sem origem documentada por análise de estabilidade ou procedimento técnico aceito.",
+            ],
+        )
+        case = {"cb_modo_auto": "0", "Cb_projeto": "2.5"}
+        frame = evaluate_catalog(case_params(case), self.table)
+        pd.testing.assert_frame_equal(frame, evaluate_catalog(sidebar, self.table))
+        self.assertNotIn("APROVADO", set(frame["Status"]))
+        self.assertEqual(case_params(dict(case, cb_source="Análise de estabilidade"))["unsupported_reasons"], [])
+
+        self.assertEqual(len(case_params({"fy_aco": 30, "fu_aco": 40})["unsupported_reasons"]), 1)
+        self.assertEqual(case_params({"material": "Outro", "fy_aco": 30, "fu_aco": 40, "material_qualified": "sim"})
+                         ["unsupported_reasons"], [])
+        self.assertEqual(len(case_params({"support_torsion_restrained": "não", "scope_fatigue": 1})
+                             ["unsupported_reasons"]), 2)
+
+        envelope = case_params({"combination_envelope": "sim", "variable_actions": '[{"name": "Uso", "q": 0.12}]'})
+        self.assertIn("APROVADO", set(evaluate_catalog(envelope, self.table)["Status"]))
+        with self.assertRaises(ValueError):
+            case_params({"variable_actions": '[{"q": 0.12}]'})
+
+    def test_results_match_catalog_evaluation_for_each_case(self):
+        expected = pd.concat(
+            [evaluate_catalog(case_params(case), self.table).assign(Caso=case["caso"]) for case in CASES],
+            ignore_index=True,
+        )
+        with tempfile.TemporaryDirectory() as directory:
+            source = Path(directory) / "casos.json"
+            source.write_text(json.dumps(CASES), encoding="utf-8")
+            calls = []
+            output = Path(directory) / "resultados.csv"
+            rows = run_cases(read_cases(source), output, self.table, workers=2, progress=lambda *a: calls.append(a))
+            written = pd.read_csv(output, dtype={"Caso": str})
+        self.assertEqual(rows, len(expected))
+        self.assertEqual(calls[-1], (3, 3))
+        key = ["Caso", "Tipo", "Perfil"]
+        written = written.sort_values(key, kind="stable").reset_index(drop=True)
+        expected = expected.sort_values(key, kind="stable").reset_index(drop=True)
+        self.assertEqual(list(written["Status"]), list(expected["Status"]))
+        pd.testing.assert_series_equal(written["Ef. Flecha (%)"], expected["Ef. Flecha (%)"], rtol=1e-12)
+
+    @unittest.skipUnless(importlib.util.find_spec("pyarrow"), "pyarrow não instalado")
+    def test_parquet_output_keeps_only_approved_profiles(self):
+        with tempfile.TemporaryDirectory() as directory:
+            output = Path(directory) / "resultados.parquet"
+            rows = run_cases(CASES, output, self.table, workers=1, approved_only=True)
+            written = pd.read_parquet(output)
+        expected = evaluate_catalog(case_params(CASES[0]), self.table)
+        self.assertEqual(rows, len(written))
+        self.assertEqual(set(written["Status"]), {"APROVADO"})
+        self.assertEqual(
+            list(written.loc[written["Caso"] == "V1", "Perfil"]),
+            list(expected.loc[expected["Status"] == "APROVADO", "Perfil"]),
+        )
+
+    def test_invalid_inputs_are_rejected_before_running(self):
+        with tempfile.TemporaryDirectory() as directory:
+            with self.assertRaisesRegex(ValueError, "Caso 2"):
+                run_cases([{}, {"L_cm": -1}], Path(directory) / "r.csv", self.table, workers=1)
+            with self.assertRaises(ValueError):
+                run_cases([{}], Path(directory) / "r.xlsx", self.table, workers=1)
+            self.assertFalse((Path(directory) / "r.csv").exists())
+
+
+if __name__ == "__main__":
+    unittest.main()
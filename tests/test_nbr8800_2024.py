@@ -2,11 +2,13 @@ import math
 import unittest
 
 from calculos_nbr8800_2024 import (
+    VariableAction,
     analyze_beam,
     calculate_cb,
     combine_els,
     deflection_limit,
     flexural_strength_i,
+    load_combinations,
     overall_status,
     shear_strength_i,
     validate_material,
@@ -109,6 +111,42 @@ class BeamAnalysisTests(unittest.TestCase):
         self.assertAlmostEqual(coarse_cb["Mmax"], fine_cb["Mmax"], places=10)
         self.assertAlmostEqual(coarse_cb["Cb"], fine_cb["Cb"], places=10)
 
+    def test_deflection_extremum_is_analytic_and_independent_of_mesh(self):
+        P, a = 30.0, 175.0
+        E, I = self.E, self.I
+        coarse = analyze_beam(
+            "Bi-apoiada", self.L, point_load=P, point_position=a, E=E, I=I, samples=101,
+        )
+        x_max = self.L - math.sqrt((self.L**2 - a**2) / 3.0)
+        expected = P * a * (self.L**2 - a**2) ** 1.5 / (9.0 * math.sqrt(3.0) * self.L * E * I)
+        self.assertAlmostEqual(coarse.max_deflection_position, x_max, places=8)
+        self.assertAlmostEqual(coarse.max_deflection, expected, places=10)
+
+    def test_samples_none_returns_extremes_without_diagrams(self):
+        kwargs = dict(q=0.093521, point_load=11.5, point_position=350.0, E=self.E, I=self.I)
+        for support in ("Bi-apoiada", "Engastada e Livre (Balanço)", "Bi-engastada", "Engastada e Apoiada"):
+            with self.subTest(support=support):
+                sampled = analyze_beam(support, self.L, **kwargs)
+                exact = analyze_beam(support, self.L, samples=None, **kwargs)
+                self.assertEqual(exact.x.size + exact.moments.size + exact.deflections.size, 0)
+                self.assertEqual(exact.max_moment, sampled.max_moment)
+                self.assertEqual(exact.max_deflection, sampled.max_deflection)
+                self.assertGreaterEqual(exact.max_deflection, max(abs(v) for v in sampled.deflections))
+
+    def test_diagrams_are_sampled_on_demand_at_the_requested_resolution(self):
+        result = analyze_beam(
+            "Bi-apoiada", self.L, self.q, point_load=11.5, point_position=333.3,
+            E=self.E, I=self.I,
+        )
+        coarse = result.diagrams(181)
+        self.assertEqual(len(coarse.x), 181)
+        self.assertIs(result.diagrams(181), coarse)
+        self.assertEqual(len(result.x), 2001)
+        self.assertAlmostEqual(max(abs(result.moments)), result.max_moment, places=3)
+        self.assertLessEqual(max(abs(coarse.deflections)), result.max_deflection)
+        with self.assertRaises(ValueError):
+            result.diagrams(50)
+
     def test_cantilever_deflection_reference_length_is_double(self):
         self.assertEqual(
             deflection_limit("Engastada e Livre (Balanço)", 500.0, 250.0), 4.0
@@ -234,6 +272,28 @@ class CombinationAndStatusTests(unittest.TestCase):
         with self.assertRaises(ValueError):
             combine_els(0.01, 0.02, 0.001, psi1=1.1)
 
+    def test_each_variable_action_leads_with_psi_reduced_companions(self):
+        actions = [
+            VariableAction("Sobrecarga", 0.02, psi0=0.7, psi1=0.6, psi2=0.4),
+            VariableAction("Vento", 0.01, gamma_q=1.4, psi0=0.6, psi1=0.3, psi2=0.0),
+        ]
+        result = load_combinations(actions, gamma_g=1.4)
+        self.assertEqual([row["variable"] for row in result["elu"]], [(1.5, 1.4 * 0.6), (1.5 * 0.7, 1.4)])
+        self.assertTrue(all(row["permanent"] == 1.4 for row in result["elu"]))
+        els = {row["label"]: row["variable"] for row in result["els"]}
+        self.assertEqual(els["Rara: Vento principal"], (0.6, 1.0))
+        self.assertEqual(els["Frequente: Sobrecarga principal"], (0.6, 0.0))
+        self.assertEqual(els["Quase permanente"], (0.4, 0.0))
+        self.assertEqual(len(result["els"]), 5)
+
+    def test_combinations_reject_duplicate_names_and_invalid_psi(self):
+        with self.assertRaises(ValueError):
+            load_combinations([VariableAction("Q"), VariableAction("Q")])
+        with self.assertRaises(ValueError):
+            load_combinations([VariableAction("Q", psi0=1.2)])
+        with self.assertRaises(ValueError):
+            load_combinations([])
+
     def test_proven_failure_has_priority_over_pending_scope(self):
         self.assertEqual(
             overall_status(["NÃO VERIFICADO", "REPROVADO", "APROVADO"]),
@@ -0,0 +1,141 @@
+import asyncio
+import http.client
+import json
+from pathlib import Path
+import threading
+import time
+import unittest
+
+import pandas as pd
+
+from analise_catalogo import ProfileTable, evaluate_catalog
+from lote_casos import case_params
+from servico_api import MAX_BODY, start_service
+from verificacao_nbr8800_2024 import check_profile
+
+
+ROOT = Path(__file__).resolve().parents[1]
+CASE = {"tipo_viga": "Bi-engastada", "L_cm": 700, "q_area": 4, "p_q_kn": 15, "material": "ASTM A36"}
+
+
+class LocalServiceTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.sheets = pd.read_excel(ROOT / "perfis.xlsx", sheet_name=None)
+        cls.loop = asyncio.new_event_loop()
+        cls.thread = threading.Thread(target=cls.loop.run_forever, daemon=True)
+        cls.thread.start()
+        cls.server, cls.executor = cls.wait(start_service(port=0, workers=1, max_pending=1))
+        cls.port = cls.server.sockets[0].getsockname()[1]
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.close()
+        cls.wait(cls.server.wait_closed())
+        cls.executor.shutdown()
+        cls.wait(cls.cancel_connections())
+        cls.loop.call_soon_threadsafe(cls.loop.stop)
+        cls.thread.join()
+        cls.loop.close()
+
+    @staticmethod
+    async def cancel_connections():
+        tasks = asyncio.all_tasks() - {asyncio.current_task()}
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    @classmethod
+    def wait(cls, coroutine):
+        return asyncio.run_coroutine_threadsafe(coroutine, cls.loop).result(timeout=60)
+
+    def request(self, connection, path, payload, method="POST"):
+        body = payload if isinstance(payload, bytes) else json.dumps(payload).encode("utf-8")
+        connection.request(method, path, body, {"Content-Type": "application/json"})
+        response = connection.getresponse()
+        return response.status, json.loads(response.read()), response
+
+    def test_check_and_batch_match_the_engine(self):
+        connection = http.client.HTTPConnection("127.0.0.1", self.port, timeout=30)
+        params = case_params(CASE)
+        for position in (0, 25):
+            row = self.sheets["CS"].iloc[position]
+            status, payload, _ = self.request(
+                connection, "/check", {"perfil": row["Bitola (mm x kg/m)"], "tipo": "CS", "caso": CASE},
+            )
+            self.assertEqual(status, 200)
+            expected = check_profile(row, "CS", params)
+            self.assertEqual(payload["Status"], expected["Status"])
+            self.assertAlmostEqual(payload["Ef. Flecha (%)"], expected["Ef. Flecha (%)"], places=9)
+
+        bounds = {"d": (30.0, 50.0)}
+        status, payload, _ = self.request(
+            connection, "/batch", {"caso": CASE, "faixas": bounds, "aprovados": True},
+        )
+        self.assertEqual(status, 200)
+        expected = evaluate_catalog(params, ProfileTable.from_sheets(self.sheets), bounds=bounds)
+        expected = expected[expected["Status"] == "APROVADO"]
+        self.assertEqual(payload["total"], len(expected))
+        self.assertEqual([row["Perfil"] for row in payload["linhas"]], list(expected["Perfil"]))
+        connection.close()
+
+    def test_invalid_requests_get_error_responses(self):
+        connection = http.client.HTTPConnection("127.0.0.1", self.port, timeout=30)
+        cases = (
+            ("/nada", {}, "POST", 404),
+            ("/check", {}, "GET", 405),
+            ("/check", b"{", "POST", 400),
+            ("/check", {"perfil": "W 200 x 15,0", "caso": {"vao": 5}}, "POST", 400),
+            ("/check", {"perfil": "inexistente"}, "POST", 404),
+            ("/batch", {"faixas": {"massa": [0, 1]}}, "POST", 400),
+        )
+        # Erros com o corpo lido mantêm a conexão.
+        for path, payload, method, expected in cases:
+            with self.subTest(path=path, expected=expected):
+                status, body, _ = self.request(connection, path, payload, method)
+                self.assertEqual(status, expected)
+                self.assertIn("erro", body)
+        # O corpo grande demais é recusado pelo Content-Length, antes de ser lido.
+        connection.putrequest("POST", "/check")
+        connection.putheader("Content-Length", str(MAX_BODY + 1))
+        connection.endheaders()
+        response = connection.getresponse()
+        response.read()
+        self.assertEqual(response.status, 413)
+        self.assertEqual(response.getheader("Connection"), "close")
+        connection.close()
+
+    def test_requests_beyond_the_limit_are_refused_and_slow_ones_time_out(self):
+        server, executor = self.wait(start_service(port=0, workers=1, max_pending=1, timeout=0.5))
+        try:
+            port = server.sockets[0].getsockname()[1]
+            # O único processo fica ocupado; a primeira requisição espera na vaga.
+            busy = executor.submit(time.sleep, 1.5)
+            first = http.client.HTTPConnection("127.0.0.1", port, timeout=30)
+            second = http.client.HTTPConnection("127.0.0.1", port, timeout=30)
+            waiting = threading.Thread(target=lambda: results.append(self.request(first, "/check", {"perfil": "x"})))
+            results = []
+            waiting.start()
+            time.sleep(0.2)
+            status, _, response = self.request(second, "/batch", {"caso": CASE})
+            self.assertEqual(status, 503)
+            self.assertEqual(response.getheader("Retry-After"), "1")
+            waiting.join()
+            self.assertEqual(results[0][0], 504)
+            busy.result()
+            # A vaga volta assim que o processo conclui (ou cancela) a verificação vencida.
+            for _ in range(100):
+                status = self.request(second, "/check", {"perfil": "x"})[0]
+                if status != 503:
+                    break
+                time.sleep(0.02)
+            self.assertEqual(status, 404)
+            first.close()
+            second.close()
+        finally:
+            server.close()
+            self.wait(server.wait_closed())
+            executor.shutdown()
+
+if __name__ == "__main__":
+    unittest.main()
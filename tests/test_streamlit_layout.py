@@ -36,6 +36,34 @@ class StreamlitLayoutTests(unittest.TestCase):
         ]
         self.assertEqual(top_level_page_config, [])
 
+    def test_catalog_is_a_shared_resource_with_access_instrumentation(self):
+        source = (ROOT / "main.py").read_text(encoding="utf-8")
+        tree = ast.parse(source)
+        functions = {node.name: node for node in tree.body if isinstance(node, ast.FunctionDef)}
+        for name in (
+            "load_data_from_local_file", "load_profile_table", "load_catalog_executor", "load_results_cache",
+            "load_evaluation_cache",
+        ):
+            decorators = [ast.unparse(item) for item in functions[name].decorator_list]
+            self.assertEqual(decorators, ["st.cache_resource"])
+        self.assertNotIn("st.cache_data", source)
+        main_calls = {
+            node.func.id for node in ast.walk(functions["main"])
+            if isinstance(node, ast.Call) and isinstance(node.func, ast.Name)
+        }
+        self.assertIn("load_catalog_resources", main_calls)
+        self.assertNotIn("load_data_from_local_file", main_calls)
+        # As planilhas compartilhadas só alimentam o ProfileTable somente leitura.
+        callers = {
+            name for name, function in functions.items()
+            if any(
+                isinstance(node, ast.Call) and isinstance(node.func, ast.Name)
+                and node.func.id == "load_data_from_local_file"
+                for node in ast.walk(function)
+            )
+        }
+        self.assertEqual(callers, {"load_profile_table"})
+
     def test_layout_css_uses_stable_streamlit_container_selector(self):
         source = (ROOT / "main.py").read_text(encoding="utf-8")
         self.assertIn('[data-testid="stMainBlockContainer"]', source)
@@ -0,0 +1,77 @@
+from pathlib import Path
+import tempfile
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from analise_catalogo import ProfileTable, evaluate_catalog
+from tabelas_vao_carga import (
+    EFFICIENCY_MAX, decode_state, generate_span_load_tables, load_span_load_tables, table_params,
+)
+
+
+ROOT = Path(__file__).resolve().parents[1]
+SPANS = np.array([250.0, 600.0, 1100.0])
+LOADS = np.array([0.0, 4.0, 15.0])
+SUPPORTS = ("Bi-apoiada", "Engastada e Livre (Balanço)")
+
+
+class SpanLoadTableTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.table = ProfileTable.from_sheets(pd.read_excel(ROOT / "perfis.xlsx", sheet_name=None))
+
+    def generate(self, directory, **options):
+        generate_span_load_tables(directory, SPANS, LOADS, SUPPORTS, all_sheets=self.table, **options)
+        return load_span_load_tables(directory)
+
+    def test_table_cells_match_catalog_evaluation(self):
+        with tempfile.TemporaryDirectory() as directory:
+            tables = self.generate(directory, workers=1, chunk_rows=500)
+            entry = tables["sheets"]["Laminados"]
+            self.assertEqual(entry["efficiency"].dtype, np.uint16)
+            self.assertEqual(entry["state"].dtype, np.uint8)
+            self.assertEqual(entry["efficiency"].shape, (len(entry["profiles"]), 2, 3, 3))
+            for s, support in enumerate(SUPPORTS):
+                for j, span in enumerate(SPANS):
+                    for k, load in enumerate(LOADS):
+                        ratio = span / 600.0
+                        params = dict(
+                            table_params(), tipo_viga=support, L_cm=span, q_q_kn_cm=load / 100.0,
+                            Lb_projeto=600.0 * ratio, local_unbraced_cm=600.0 * ratio, p_pos_cm=300.0 * ratio,
+                        )
+                        frame = evaluate_catalog(params, self.table)
+                        frame = frame[(frame["Tipo"] == "Laminados") & self.table["valid"]]
+                        with self.subTest(support=support, span=span, load=load):
+                            status, check = decode_state(entry["state"][:, s, j, k])
+                            np.testing.assert_array_equal(status, frame["Status"].to_numpy())
+                            np.testing.assert_array_equal(check, frame["Estado-limite governante"].to_numpy())
+                            efficiency = frame.filter(like="Ef. ").max(axis=1).to_numpy()
+                            expected = np.minimum(np.rint(efficiency * 10.0), EFFICIENCY_MAX)
+                            np.testing.assert_allclose(entry["efficiency"][:, s, j, k], expected, atol=1)
+
+    def test_process_pool_matches_single_process(self):
+        with tempfile.TemporaryDirectory() as first, tempfile.TemporaryDirectory() as second:
+            serial = self.generate(first, workers=1)
+            parallel = self.generate(second, workers=2, chunk_rows=40)
+            for sheet, entry in serial["sheets"].items():
+                with self.subTest(sheet=sheet):
+                    self.assertEqual(entry["profiles"], parallel["sheets"][sheet]["profiles"])
+                    np.testing.assert_array_equal(entry["efficiency"], parallel["sheets"][sheet]["efficiency"])
+                    np.testing.assert_array_equal(entry["state"], parallel["sheets"][sheet]["state"])
+
+    def test_invalid_grids_are_rejected(self):
+        with tempfile.TemporaryDirectory() as directory:
+            with self.assertRaises(ValueError):
+                generate_span_load_tables(directory, [], LOADS, all_sheets=self.table)
+            with self.assertRaises(ValueError):
+                generate_span_load_tables(directory, SPANS, [-1.0], all_sheets=self.table)
+            with self.assertRaises(ValueError):
+                generate_span_load_tables(
+                    directory, SPANS, LOADS, all_sheets=self.table, input_params={"combination_envelope": True},
+                )
+
+
+if __name__ == "__main__":
+    unittest.main()
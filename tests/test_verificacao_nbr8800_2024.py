@@ -0,0 +1,45 @@
+from pathlib import Path
+import subprocess
+import sys
+import unittest
+
+import pandas as pd
+
+from analise_catalogo import evaluate_catalog
+from test_analise_catalogo import BASE_INPUTS
+from verificacao_nbr8800_2024 import check_profiles
+
+
+ROOT = Path(__file__).resolve().parents[1]
+
+
+class HeadlessVerificationTests(unittest.TestCase):
+    def test_module_imports_only_the_calculation_core(self):
+        code = (
+            "import sys, verificacao_nbr8800_2024; "
+            "print(' '.join(sorted({name.split('.')[0] for name in sys.modules})))"
+        )
+        output = subprocess.run(
+            [sys.executable, "-c", code], cwd=ROOT, capture_output=True, text=True, check=True,
+        ).stdout.split()
+        self.assertIn("calculos_nbr8800_2024", output)
+        for name in ("streamlit", "plotly", "openpyxl", "pytz", "pandas", "memorial_nbr8800_2024", "main"):
+            self.assertNotIn(name, output)
+
+    def test_profile_loop_matches_columnar_batch(self):
+        sheets = pd.read_excel(ROOT / "perfis.xlsx", sheet_name=None)
+        sheets["CS"].loc[0, "tw (mm)"] = 0.0
+        calls = []
+        rows = pd.DataFrame(check_profiles(sheets, BASE_INPUTS, lambda *args: calls.append(args)))
+        expected = evaluate_catalog(BASE_INPUTS, sheets)
+        self.assertEqual(list(rows["Perfil"]), list(expected["Perfil"]))
+        self.assertEqual(list(rows["Status"]), list(expected["Status"]))
+        pd.testing.assert_series_equal(rows["Ef. Flecha (%)"], expected["Ef. Flecha (%)"], rtol=1e-9)
+        invalid = len(sheets["Laminados"])
+        self.assertEqual(rows.loc[invalid, "Observação"], expected.loc[invalid, "Observação"])
+        self.assertEqual(len(calls), len(rows))
+        self.assertEqual(calls[-1][:2], (len(rows), len(rows)))
+
+
+if __name__ == "__main__":
+    unittest.main()
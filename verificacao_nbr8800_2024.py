@@ -0,0 +1,338 @@
+"""Verificação de um perfil pela NBR 8800:2024, sem interface.
+
+``perform_all_checks`` orquestra, para um perfil, as combinações, a análise
+da viga, Cb, as resistências de ``calculos_nbr8800_2024``, as forças
+localizadas, a flecha e o status global; ``get_profile_properties`` lê as
+propriedades de uma linha da planilha e ``check_profiles`` percorre as
+planilhas perfil a perfil, como a análise em lote original.
+
+O módulo importa apenas o núcleo normativo e NumPy, de modo que processos
+auxiliares, scripts e serviços o carregam sem o custo de Streamlit, Plotly e
+openpyxl. O memorial detalhado é importado apenas quando solicitado.
+"""
+
+from __future__ import annotations
+
+import math
+
+from calculos_nbr8800_2024 import (
+    analyze_beam,
+    calculate_cb as calculate_cb_nbr2024,
+    combine_els,
+    combine_elu_normal,
+    deflection_limit,
+    flexural_strength_i,
+    local_compression_strength,
+    overall_status,
+    shear_strength_i,
+    validate_material,
+    verification_status,
+)
+
+
+PROFILE_FABRICATION_MAP = {
+    "Laminados": "Laminado",
+    "CS": "Soldado",
+    "CVS": "Soldado",
+    "VS": "Soldado",
+}
+
+
+def _is_missing(value) -> bool:
+    # Células vazias chegam do pandas como NaN (float ou escalar NumPy).
+    return value is None or (isinstance(value, float) and math.isnan(value))
+
+
+def get_profile_properties(profile_series):
+    props = {
+        "d": profile_series.get('d (mm)'),
+        "bf": profile_series.get('bf (mm)'),
+        "tw": profile_series.get('tw (mm)'),
+        "tf": profile_series.get('tf (mm)'),
+        # h_faces é a distância entre faces internas; d' desconta os raios nos laminados.
+        "h_faces": profile_series.get('h (mm)'),
+        "h_clear": profile_series.get("d' (mm)", profile_series.get('h (mm)')),
+        "Area": profile_series.get('Área (cm2)'),
+        "Ix": profile_series.get('Ix (cm4)'),
+        "Wx": profile_series.get('Wx (cm3)'),
+        "rx": profile_series.get('rx (cm)'),
+        "Zx": profile_series.get('Zx (cm3)'),
+        "Iy": profile_series.get('Iy (cm4)'),
+        "Wy": profile_series.get('Wy (cm3)'),
+        "ry": profile_series.get('ry (cm)'),
+        "Zy": profile_series.get('Zy (cm3)'),
+        "rt": profile_series.get('rt (cm)'),
+        "J": profile_series.get('It (cm4)'),
+        "Cw": profile_series.get('Cw (cm6)'),
+        "Peso": profile_series.get('Massa Linear (kg/m)', profile_series.get('Peso (kg/m)')),
+    }
+    required_keys = ["d", "bf", "tw", "tf", "h_faces", "h_clear", "Area", "Ix", "Wx", "rx", "Zx", "Iy", "ry", "J", "Cw", "Peso"]
+    profile_name = profile_series.get('Bitola (mm x kg/m)', 'Perfil Desconhecido')
+    for key in required_keys:
+        value = props.get(key)
+        if _is_missing(value) or (isinstance(value, (int, float)) and value <= 0):
+            raise ValueError(f"Propriedade ESSENCIAL '{key}' inválida ou nula no Excel para '{profile_name}'. Verifique a planilha.")
+    for key in ['d', 'bf', 'tw', 'tf', 'h_faces', 'h_clear']:
+        props[key] /= 10.0
+    # Alias mantido apenas para blocos legados de apresentação.
+    props['h'] = props['h_clear']
+    return props
+
+
+def _memorial_2024_html(bundle):
+    """Renderiza o memorial auditável com os dados do núcleo normativo."""
+    # Importado só no modo detalhado: o memorial e seus diagramas não pesam nos lotes.
+    from memorial_nbr8800_2024 import build_memorial_details
+
+    return build_memorial_details(bundle)
+
+
+def perform_all_checks(props, fy_aco, Lb_projeto, Cb_projeto, L_cm, Msd, Vsd, q_serv_kn_cm, p_load_serv, tipo_viga, input_mode, tipo_fabricacao, usa_enrijecedores, a_enr, limite_flecha_divisor, projeto_info, E_aco, detalhado=False, fu_aco=45.0, **kwargs):
+    automatic = input_mode == "Calcular a partir de Cargas na Viga"
+    scope_issues = list(kwargs.get('unsupported_reasons', []))
+    scope_notes = list(kwargs.get('scope_notes', []))
+    scope_issues.extend(validate_material(fy_aco, fu_aco))
+
+    self_weight = props['Peso'] * 9.80665 / 100_000.0 if kwargs.get('include_self_weight', True) else 0.0
+    elu_response = None
+    els_response = None
+    elu_loads = None
+    els_loads = None
+    point_position = kwargs.get('p_pos_cm', p_load_serv[1] if p_load_serv else L_cm / 2.0)
+    Cb_final = Cb_projeto
+    cb_info = None
+    cb_basis = "Cb informado pelo usuário; a origem deve ser registrada no projeto."
+    if (
+        tipo_viga == 'Engastada e Livre (Balanço)'
+        and kwargs.get('cantilever_standard_cb', False)
+    ):
+        cb_basis = "Cb = 1,0 para a condição de balanço declarada em 5.4.2.3-b."
+    elif kwargs.get('cb_source', '').strip():
+        cb_basis = f"Cb informado pelo usuário. Origem registrada: {kwargs['cb_source'].strip()}."
+
+    if automatic:
+        q_g = kwargs.get('q_g_kn_cm', 0.0)
+        q_q = kwargs.get('q_q_kn_cm', q_serv_kn_cm)
+        p_g = kwargs.get('p_g_kn', 0.0)
+        p_q = kwargs.get('p_q_kn', p_load_serv[0] if p_load_serv else 0.0)
+        elu_loads = combine_elu_normal(
+            q_g, q_q, self_weight, p_g, p_q,
+            gamma_g=kwargs.get('gamma_g', 1.50),
+            gamma_q=kwargs.get('gamma_q', 1.50),
+            gamma_self_weight=kwargs.get('gamma_self_weight', 1.25),
+        )
+        elu_response = analyze_beam(
+            tipo_viga, L_cm, elu_loads['q'], elu_loads['P'], point_position
+        )
+        Msd, Vsd = elu_response.max_moment, elu_response.max_shear
+
+        if kwargs.get('cb_modo_auto', False):
+            cb_info = calculate_cb_nbr2024(
+                elu_response,
+                segment_start=kwargs.get('lb_start_cm', 0.0),
+                unbraced_length=Lb_projeto,
+            )
+            Cb_final = cb_info['Cb']
+            cb_basis = (
+                f"Cálculo automático no trecho x={cb_info['segment_start']/100:.3f} m a "
+                f"x={(cb_info['segment_start']+cb_info['Lb'])/100:.3f} m: "
+                f"|Mmax|={cb_info['Mmax']/100:.3f}, |MA|={cb_info['MA']/100:.3f}, "
+                f"|MB|={cb_info['MB']/100:.3f}, |MC|={cb_info['MC']/100:.3f} kN·m."
+            )
+
+        els_loads = combine_els(
+            q_g, q_q, self_weight, p_g, p_q,
+            combination=kwargs.get('els_combination', 'rare'),
+            psi1=kwargs.get('psi1', 0.6),
+            psi2=kwargs.get('psi2', 0.4),
+        )
+        els_response = analyze_beam(
+            tipo_viga, L_cm, els_loads['q'], els_loads['P'], point_position,
+            E=E_aco, I=props['Ix'],
+        )
+    elif not kwargs.get('manual_local_checks_confirmed', False):
+        scope_issues.append("Modo manual sem reações/forças localizadas e sem verificação ELS.")
+
+    Afg_tension = None
+    Afn_tension = None
+    if kwargs.get('has_tension_flange_holes', False):
+        Afg_tension = props['bf'] * props['tf']
+        Afn_tension = Afg_tension * kwargs.get('tension_flange_net_ratio', 1.0)
+
+    flex = flexural_strength_i(
+        props, fy_aco, fu_aco, E_aco, Lb_projeto, Cb_final, tipo_fabricacao,
+        stiffener_spacing=a_enr if usa_enrijecedores else None,
+        flt_applicable=kwargs.get('flt_applicable', True),
+        net_tension_flange_area=Afn_tension,
+        gross_tension_flange_area=Afg_tension,
+    )
+    scope_issues.extend(flex['applicability_issues'])
+
+    shear = shear_strength_i(
+        props, fy_aco, E_aco,
+        stiffener_spacing=a_enr if usa_enrijecedores else None,
+        stiffener_width=kwargs.get('stiffener_width'),
+        stiffener_thickness=kwargs.get('stiffener_thickness'),
+        stiffener_pair=kwargs.get('stiffener_pair', True),
+        stiffener_welded_to_web_and_flanges=kwargs.get('stiffener_welded', False),
+    )
+
+    flt_eff, flt_status = verification_status(Msd, flex['Mrd_FLT'], kwargs.get('flt_applicable', True))
+    flm_eff, flm_status = verification_status(Msd, flex['Mrd_FLM'])
+    fla_eff, fla_status = verification_status(Msd, flex['Mrd_FLA_or_tension'])
+    rupture_eff, rupture_status = verification_status(
+        Msd, flex['Mrd_rupture'], flex['Mrd_rupture'] is not None
+    )
+    shear_eff, shear_status = verification_status(Vsd, shear['Vrd'])
+
+    res_flt = {'Mrdx': flex['Mrd_FLT'] or flex['Mrd'], 'eficiencia': flt_eff, 'status': flt_status, 'core': flex, 'Msd': Msd, 'titulo': 'Flexão — FLT'}
+    res_flt.update({
+        'rupture_Mrd': flex['Mrd_rupture'],
+        'rupture_efficiency': rupture_eff,
+        'rupture_status': rupture_status,
+    })
+    res_flm = {'Mrdx': flex['Mrd_FLM'], 'eficiencia': flm_eff, 'status': flm_status, 'core': flex, 'Msd': Msd, 'titulo': 'Flexão — FLM'}
+    res_fla = {'Mrdx': flex['Mrd_FLA_or_tension'], 'eficiencia': fla_eff, 'status': fla_status, 'core': flex, 'Msd': Msd, 'titulo': 'Flexão — FLA/Anexo E'}
+    res_cis = {'Vrd': shear['Vrd'], 'eficiencia': shear_eff, 'status': shear_status, 'core': shear, 'Vsd': Vsd}
+
+    local_checks = []
+    local_statuses = []
+    if automatic and elu_response:
+        locations = [
+            (
+                "Apoio esquerdo", abs(elu_response.reaction_left),
+                kwargs.get('bearing_left_cm', 10.0), 0.0, 0.0,
+                kwargs.get('support_relative_lateral_restrained', True),
+            ),
+        ]
+        if tipo_viga != 'Engastada e Livre (Balanço)':
+            locations.append((
+                "Apoio direito", abs(elu_response.reaction_right),
+                kwargs.get('bearing_right_cm', 10.0), 0.0, L_cm,
+                kwargs.get('support_relative_lateral_restrained', True),
+            ))
+        if elu_loads['P'] > 0:
+            locations.append((
+                "Carga pontual", elu_loads['P'], kwargs.get('point_bearing_cm', 10.0),
+                min(point_position, L_cm - point_position), point_position,
+                kwargs.get('point_relative_lateral_restrained', True),
+            ))
+        for name, demand, bearing, distance_end, x_load, lateral_restrained in locations:
+            local = local_compression_strength(
+                props, fy_aco, E_aco, bearing, distance_end, tipo_fabricacao,
+                weld_root_or_radius=kwargs.get('weld_root_cm', 0.0),
+                lateral_unbraced_length=kwargs.get('local_unbraced_cm', Lb_projeto),
+                flange_rotation_restrained=kwargs.get('loaded_flange_rotation_restrained', True),
+                relative_lateral_movement_restrained=lateral_restrained,
+                moment_at_load=elu_response.moment_at(x_load),
+            )
+            efficiency, status = verification_status(demand, local['FRd'])
+            local_checks.append({
+                'name': name, 'demand': demand, 'resistance': local['FRd'],
+                'efficiency': efficiency, 'status': status, 'details': local,
+                'position': x_load, 'bearing_length': bearing,
+            })
+            local_statuses.append(status)
+
+    flecha_max = flecha_limite = eficiencia_flecha = 0.0
+    status_flecha = "N/A"
+    if els_response:
+        absolute_limit = 1.5 if kwargs.get('masonry_on_beam', False) else None
+        flecha_limite = deflection_limit(tipo_viga, L_cm, limite_flecha_divisor, absolute_limit)
+        flecha_max = els_response.max_deflection
+        eficiencia_flecha, status_flecha = verification_status(flecha_max, flecha_limite)
+    res_flecha = {
+        'flecha_max': flecha_max, 'flecha_limite': flecha_limite,
+        'eficiencia': eficiencia_flecha, 'status': status_flecha,
+        'Ix': props['Ix'], 'detalhes': {}, 'divisor': limite_flecha_divisor,
+        'response': els_response,
+    }
+
+    statuses = [
+        flt_status, flm_status, fla_status, rupture_status,
+        shear_status, status_flecha,
+    ] + local_statuses
+    if scope_issues:
+        statuses.append("NÃO VERIFICADO")
+    status_global = overall_status(statuses)
+    for result in (res_flt, res_flm, res_fla, res_cis, res_flecha):
+        result['status_global'] = status_global
+        result['scope_issues'] = scope_issues
+        result['local_checks'] = local_checks
+
+    bundle = {
+        'Msd': Msd, 'Vsd': Vsd, 'flexure': flex, 'shear': shear,
+        'elu_response': elu_response, 'els_response': els_response,
+        'elu_loads': elu_loads, 'els_loads': els_loads,
+        'elu_combination_text': kwargs.get('elu_combination_text', '1,50·G + 1,25·PP aço + 1,50·Q'),
+        'els_combination_text': kwargs.get('els_combination_text', kwargs.get('els_combination', 'rare')),
+        'Cb': Cb_final, 'Lb': Lb_projeto, 'cb_basis': cb_basis, 'cb_info': cb_info,
+        'props': props, 'fy': fy_aco, 'fu': fu_aco, 'E': E_aco,
+        'fabrication': tipo_fabricacao, 'support': tipo_viga, 'length': L_cm,
+        'input_mode': input_mode, 'point_position': point_position,
+        'self_weight': self_weight, 'gamma_a1': 1.10, 'gamma_a2': 1.35,
+        'influence_left_cm': kwargs.get('larg_esq_cm'),
+        'influence_right_cm': kwargs.get('larg_dir_cm'),
+        'influence_width_m': kwargs.get('larg_inf_total_m'),
+        'g_area': kwargs.get('g_area'), 'q_area': kwargs.get('q_area'),
+        'masonry_on_beam': kwargs.get('masonry_on_beam', False),
+        'local_checks': local_checks,
+        'deflection_limit': flecha_limite, 'deflection_divisor': limite_flecha_divisor,
+        'deflection_efficiency': eficiencia_flecha, 'deflection_status': status_flecha,
+        'scope_notes': scope_notes, 'scope_issues': scope_issues, 'status_global': status_global,
+    }
+    passo_a_passo_html = _memorial_2024_html(bundle) if detalhado else ""
+    return res_flt, res_flm, res_fla, res_cis, res_flecha, passo_a_passo_html
+
+
+def check_profile(row, sheet_name: str, input_params: dict) -> dict:
+    """Linha da análise em lote para um perfil (linha da planilha ``sheet_name``).
+
+    Erros de dados do perfil resultam em ``NÃO VERIFICADO`` com a mensagem
+    em ``Observação``.
+    """
+    name = row.get('Bitola (mm x kg/m)', 'N/D')
+    fabrication = PROFILE_FABRICATION_MAP.get(sheet_name, "Laminado")
+    try:
+        props = get_profile_properties(row)
+        res_flt, res_flm, res_fla, res_cis, res_flecha, _ = perform_all_checks(
+            props=props, tipo_fabricacao=fabrication, **input_params
+        )
+    except (ValueError, KeyError) as exc:
+        return {
+            'Tipo': sheet_name, 'Perfil': name,
+            'Peso (kg/m)': row.get('Massa Linear (kg/m)', 0), 'Status': 'NÃO VERIFICADO',
+            'Observação': str(exc),
+        }
+    return {
+        'Tipo': sheet_name, 'Perfil': name,
+        'Peso (kg/m)': props.get('Peso', 0), 'Status': res_flt.get('status_global', 'NÃO VERIFICADO'),
+        'Ef. FLT (%)': res_flt['eficiencia'], 'Ef. FLM (%)': res_flm['eficiencia'],
+        'Ef. FLA (%)': res_fla['eficiencia'], 'Ef. Cisalhamento (%)': res_cis['eficiencia'],
+        'Ef. Ruptura Mesa (%)': (
+            res_flt['rupture_efficiency']
+            if res_flt.get('rupture_status') != 'N/A' else None
+        ),
+        'Ef. Forças Locais (%)': max(
+            (item['efficiency'] for item in res_cis.get('local_checks', [])), default=0.0
+        ),
+        'Ef. Flecha (%)': res_flecha['eficiencia'],
+    }
+
+
+def check_profiles(all_sheets: dict, input_params: dict, progress=None) -> list[dict]:
+    """Linhas da análise em lote, verificando perfil a perfil todas as planilhas.
+
+    ``all_sheets`` é o dicionário de ``pd.read_excel(..., sheet_name=None)``
+    e ``input_params`` o da barra lateral de ``main``; cada linha vem de
+    ``check_profile``. ``progress(feitos, total, nome)``, se informado, é
+    chamado a cada perfil.
+    """
+    results = []
+    total = sum(len(frame) for frame in all_sheets.values())
+    for sheet_name, frame in all_sheets.items():
+        for _, row in frame.iterrows():
+            results.append(check_profile(row, sheet_name, input_params))
+            if progress is not None:
+                progress(len(results), total, results[-1]['Perfil'])
+    return results